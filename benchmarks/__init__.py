@@ -0,0 +1,4 @@
+"""Benchmarks for the knittingpattern library.
+
+See the README.rst in this folder.
+"""
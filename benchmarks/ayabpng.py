@@ -0,0 +1,44 @@
+"""Compare the ways to set the pixels of an AYAB PNG.
+
+``AYABPNGBuilder.set_colors_in_grid()`` sets one pixel after the other.
+``AYABPNGBuilder.set_colors_in_layout()`` sets all the pixels at once.
+Both create the same image.
+"""
+from knittingpattern import load_from_object
+from knittingpattern.convert.Layout import GridLayout
+from knittingpattern.convert.AYABPNGBuilder import AYABPNGBuilder
+from .patterns import chart, measure, report
+
+SIZES = [(100, 100), (200, 500)]
+
+
+def set_colors_in_grid(layout):
+    """:return: the builder with the pixels set one by one"""
+    builder = AYABPNGBuilder(*layout.bounding_box)
+    builder.set_colors_in_grid(layout.walk_instructions())
+    return builder
+
+
+def set_colors_in_layout(layout):
+    """:return: the builder with the pixels set at once"""
+    builder = AYABPNGBuilder(*layout.bounding_box)
+    builder.set_colors_in_layout(layout)
+    return builder
+
+
+def main():
+    """Set the pixels of synthetic charts in both ways."""
+    for rows, width in SIZES:
+        pattern = load_from_object(chart(rows, width)).first
+        layout = GridLayout(pattern)
+        layout.columns  # the columns are part of the layout
+        for function in (set_colors_in_grid, set_colors_in_layout):
+            seconds = measure(function, layout)
+            report(function.__name__, rows * width, seconds)
+        image_1 = set_colors_in_grid(layout)._image
+        image_2 = set_colors_in_layout(layout)._image
+        assert image_1.tobytes() == image_2.tobytes(), "same pixels"
+
+
+if __name__ == "__main__":
+    main()
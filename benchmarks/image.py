@@ -0,0 +1,47 @@
+"""Convert large images to knitting patterns.
+
+The rows are read and written one after the other so the memory needed
+grows with the width of the image and not with its size.
+"""
+import os
+import tempfile
+import tracemalloc
+import PIL.Image
+from knittingpattern import convert_from_image
+from .patterns import measure, report
+
+SIZES = [(100, 100), (500, 500), (1000, 1000)]
+
+
+def image(path, width, height):
+    """Save a black and white image with a pattern of squares."""
+    pixels = bytes(255 if (x // 8 + y // 8) % 2 else 0
+                   for y in range(height) for x in range(width))
+    image = PIL.Image.frombytes("L", (width, height), pixels)
+    image.convert("RGB").save(path)
+
+
+def convert(image_path, json_path):
+    """Convert an image file to a knitting pattern file."""
+    convert_from_image().path(image_path).path(json_path)
+
+
+def main():
+    """Convert images of different sizes and print the peak memory."""
+    directory = tempfile.mkdtemp()
+    image_path = os.path.join(directory, "chart.png")
+    json_path = os.path.join(directory, "chart.json")
+    for width, height in SIZES:
+        image(image_path, width, height)
+        seconds = measure(convert, image_path, json_path)
+        report("convert_from_image", width * height, seconds)
+        tracemalloc.start()
+        convert(image_path, json_path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print("{:<30} {:>8} items {:>10.1f}MB peak".format(
+            "", width * height, peak / 1000000))
+
+
+if __name__ == "__main__":
+    main()
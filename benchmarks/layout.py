@@ -0,0 +1,23 @@
+"""Measure how :class:`knittingpattern.convert.Layout.GridLayout` scales.
+
+Next to the time, the :attr:`walk statistics
+<knittingpattern.convert.Layout.GridLayout.walk_statistics>` are printed.
+"""
+from knittingpattern import load_from_object
+from knittingpattern.convert.Layout import GridLayout
+from .patterns import strands, measure, report
+
+SIZES = [1000, 10000]
+
+
+def main():
+    """Lay out tall synthetic patterns of different sizes."""
+    for size in SIZES:
+        pattern = load_from_object(strands(size, size, 10)).first
+        seconds = measure(GridLayout, pattern)
+        report("layout", size, seconds)
+        print(GridLayout(pattern).walk_statistics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Measure the memory that a loaded knitting pattern takes per stitch.
+
+The memory is traced with :mod:`tracemalloc` while the pattern set is
+loaded. The specification is created before so only the loaded objects
+count. Each stitch is one instruction in a row with one produced and one
+consumed mesh.
+
+A chart of 500 rows of 200 stitches took about 890 bytes per stitch before
+the instructions were shared, 690 bytes before the rows, instructions and
+meshes used ``__slots__`` and 500 bytes before the instructions kept the
+connections of their meshes in lists. Now it takes about 450 bytes.
+A million stitches need about 450MB.
+"""
+import gc
+import tracemalloc
+from knittingpattern import load_from_object
+from .patterns import chart
+
+SIZES = [(100, 100), (500, 200)]
+
+
+def measure_memory(specification):
+    """:return: the bytes that the loaded pattern set takes and its peak"""
+    gc.collect()
+    tracemalloc.start()
+    pattern_set = load_from_object(specification)
+    gc.collect()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert pattern_set.first.rows
+    return size, peak
+
+
+def main():
+    """Load charts of different sizes and print the bytes per stitch."""
+    load_from_object(chart(2, 2))  # load the default instructions
+    for rows, width in SIZES:
+        stitches = rows * width
+        size, peak = measure_memory(chart(rows, width))
+        print("{:<30} {:>8} items {:>10.1f}B/item {:>10.1f}B/item peak"
+              "".format("load_from_object", stitches, size / stitches,
+                        peak / stitches))
+
+
+if __name__ == "__main__":
+    main()
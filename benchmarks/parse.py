@@ -0,0 +1,30 @@
+"""Measure the time it takes to parse small knitting patterns.
+
+Each parse creates a new default instruction library. Before the
+libraries shared the loaded instructions, each parse read the instructions
+from the files in ``knittingpattern/instructions``. Parsing a chart of 2x2
+stitches took about 1.08ms and a chart of 10x10 stitches 2.1ms.
+Now, this takes about 0.27ms and 1.4ms.
+"""
+from knittingpattern import load_from_object
+from .patterns import chart, measure, report
+
+PARSES = 1000
+
+
+def parse_many(specification, parses):
+    """Parse the specification many times."""
+    for _ in range(parses):
+        load_from_object(specification)
+
+
+def main():
+    """Parse small charts many times."""
+    for rows, width in [(2, 2), (10, 10)]:
+        specification = chart(rows, width)
+        seconds = measure(parse_many, specification, PARSES)
+        report("parse {}x{}".format(rows, width), PARSES, seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Synthetic knitting patterns for the benchmarks."""
+from timeit import default_timer
+
+
+def strands(number_of_rows, rows_per_strand=10, width=2):
+    """Create a knitting pattern set with parallel strands of rows.
+
+    :param int number_of_rows: the number of rows in the pattern
+    :param int rows_per_strand: the number of rows that are connected one
+      after the other
+    :param int width: the number of knit instructions in each row
+    :return: a knitting pattern set specification that can be loaded with
+      :func:`knittingpattern.load_from_object`
+    :rtype: dict
+    """
+    rows = []
+    connections = []
+    for row_id in range(number_of_rows):
+        rows.append({"id": row_id, "instructions": [{}] * width})
+        if row_id % rows_per_strand:
+            connections.append({"from": {"id": row_id - 1},
+                                "to": {"id": row_id}})
+    return {"version": "0.1", "type": "knitting pattern",
+            "patterns": [{"id": "strands", "name": "strands", "rows": rows,
+                          "connections": connections}]}
+
+
+def chart(number_of_rows, width, colors=("white", "black", "#123456")):
+    """Create a knitting pattern set with a colored chart.
+
+    :param int number_of_rows: the number of rows of the chart
+    :param int width: the number of instructions in each row
+    :param tuple colors: the colors to repeat in the chart
+    :return: a knitting pattern set specification that can be loaded with
+      :func:`knittingpattern.load_from_object`
+    :rtype: dict
+    """
+    rows = []
+    connections = []
+    for row_id in range(number_of_rows):
+        instructions = [{"color": colors[(row_id + index) % len(colors)]}
+                        for index in range(width)]
+        rows.append({"id": row_id, "instructions": instructions})
+        if row_id:
+            connections.append({"from": {"id": row_id - 1},
+                                "to": {"id": row_id}})
+    return {"version": "0.1", "type": "knitting pattern",
+            "patterns": [{"id": "chart", "name": "chart", "rows": rows,
+                          "connections": connections}]}
+
+
+def measure(function, *args):
+    """Measure the time it takes to call a function.
+
+    :return: the seconds that ``function(*args)`` took
+    :rtype: float
+    """
+    start = default_timer()
+    function(*args)
+    return default_timer() - start
+
+
+def report(name, size, seconds):
+    """Print the result of a measurement."""
+    print("{:<30} {:>8} items {:>10.4f}s {:>10.2f}us/item".format(
+        name, size, seconds, seconds / size * 1000000))
+
+
+__all__ = ["strands", "chart", "measure", "report"]
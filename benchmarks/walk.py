@@ -0,0 +1,21 @@
+"""Measure how :func:`knittingpattern.walk.walk` scales with the rows.
+
+The time per row should stay about the same for all sizes.
+"""
+from knittingpattern import load_from_object
+from knittingpattern.walk import walk
+from .patterns import strands, measure, report
+
+SIZES = [1000, 10000, 100000]
+
+
+def main():
+    """Walk synthetic patterns of different sizes."""
+    for size in SIZES:
+        pattern = load_from_object(strands(size)).first
+        seconds = measure(walk, pattern)
+        report("walk", size, seconds)
+
+
+if __name__ == "__main__":
+    main()
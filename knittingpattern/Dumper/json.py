@@ -1,11 +1,120 @@
 """Dump objects to JSON."""
 import json
+from collections.abc import Iterator
 from .file import ContentDumper
 
 
+#: the types of values that are no iterators and contain none
+_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+
+def encode_in_chunks(object_, encoder=None):
+    """Encode an object as JSON in chunks of strings.
+
+    :param object_: the object to encode. Besides the types that
+      :mod:`json` can encode, it may contain :class:`iterators
+      <collections.abc.Iterator>` such as generators. They are encoded as
+      arrays while they are iterated over.
+    :param json.JSONEncoder encoder: the encoder to use or :obj:`None` to use
+      the default encoder
+    :return: an iterator over the strings that make up the JSON document
+    :raises TypeError: if the object can not be encoded
+
+    Parts of the object without iterators are encoded at once by the
+    :paramref:`encoder`. The result is the same as :func:`json.dumps` would
+    produce for the object with the iterators replaced by lists. Only one
+    item of an iterator needs to be in memory at a time.
+    """
+    if encoder is None:
+        encoder = _ENCODER
+    return _encode_in_chunks(object_, encoder, {})
+
+
+def _has_iterators(object_, memo):
+    """:return: whether the object contains iterators
+
+    :param dict memo: the results for the ids of the lists and dicts that
+      were checked before, so that each is checked once
+    """
+    if isinstance(object_, dict):
+        values = object_.values()
+    elif isinstance(object_, (list, tuple)):
+        values = object_
+    else:
+        return isinstance(object_, Iterator)
+    result = memo.get(id(object_))
+    if result is None:
+        result = False
+        for value in values:
+            if type(value) not in _SCALARS and _has_iterators(value, memo):
+                result = True
+                break
+        memo[id(object_)] = result
+    return result
+
+
+def _encode_key(key, encoder):
+    """:return: the key of a JSON object as :mod:`json` converts it
+    :raises TypeError: if the key is no string, number or :obj:`None`
+    """
+    if isinstance(key, str):
+        return encoder.encode(key)
+    if key is None or isinstance(key, (int, float)):
+        return encoder.encode(encoder.encode(key))
+    raise TypeError("keys must be str, int, float, bool or None, not {}"
+                    "".format(type(key).__name__))
+
+
+def _encode_in_chunks(object_, encoder, memo):
+    """Encode an object, see :func:`encode_in_chunks`."""
+    if not _has_iterators(object_, memo):
+        yield encoder.encode(object_)
+    elif isinstance(object_, dict):
+        yield "{"
+        separator = ""
+        for key, value in object_.items():
+            yield separator + _encode_key(key, encoder) + ": "
+            yield from _encode_in_chunks(value, encoder, memo)
+            separator = ", "
+        yield "}"
+    else:
+        # the items of iterators are new objects, their ids can be reused
+        if isinstance(object_, Iterator):
+            memo = None
+        yield "["
+        separator = ""
+        for item in object_:
+            yield separator
+            yield from _encode_in_chunks(item, encoder,
+                                         {} if memo is None else memo)
+            separator = ", "
+        yield "]"
+
+
+def _as_json_object(object_):
+    """:return: the object with its iterators replaced by lists, see
+      :func:`encode_in_chunks`
+    """
+    if isinstance(object_, dict):
+        return {key: _as_json_object(value) for key, value in object_.items()}
+    if isinstance(object_, (list, tuple, Iterator)):
+        return [_as_json_object(item) for item in object_]
+    return object_
+
+
+_ENCODER = json.JSONEncoder()
+
+
 class JSONDumper(ContentDumper):
 
-    """This class can be used to dump object s as JSON."""
+    """This class can be used to dump object s as JSON.
+
+    The object is written to the file in chunks, see
+    :func:`encode_in_chunks`.
+    Thus, it can contain generators that create the content while it is
+    dumped.
+    :meth:`object` returns the object with lists instead of the generators.
+    """
 
     def __init__(self, on_dump):
         """Create a new JSONDumper object with the callable `on_dump`.
@@ -16,12 +125,21 @@ class JSONDumper(ContentDumper):
         self.__dump_object = on_dump
 
     def object(self):
-        """Return the object that should be dumped."""
-        return self.__dump_object()
+        """Return the object that should be dumped.
+
+        Iterators such as generators in the object are replaced by lists,
+        so the result can be passed to :mod:`json` and iterated many times.
+        """
+        return _as_json_object(self.__dump_object())
 
     def _dump_to_file(self, file):
-        """dump to the file"""
-        json.dump(self.object(), file)
+        """dump to the file
+
+        The iterators in the object are written while they are iterated.
+        """
+        write = file.write
+        for chunk in encode_in_chunks(self.__dump_object()):
+            write(chunk)
 
     def knitting_pattern(self, specification=None):
         """loads a :class:`knitting pattern
@@ -38,4 +156,4 @@ class JSONDumper(ContentDumper):
             loader = new_knitting_pattern_set_loader(specification)
         return loader.object(self.object())
 
-__all__ = ["JSONDumper"]
+__all__ = ["JSONDumper", "encode_in_chunks"]
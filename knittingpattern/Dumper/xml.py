@@ -1,5 +1,4 @@
 """Dump objects to XML."""
-import xmltodict
 from .file import ContentDumper
 
 
@@ -21,6 +20,7 @@ class XMLDumper(ContentDumper):
 
     def _dump_to_file(self, file):
         """dump to the file"""
+        import xmltodict
         xmltodict.unparse(self.object(), file, pretty=True)
 
 __all__ = ["XMLDumper"]
@@ -2,9 +2,21 @@
 """
 from collections import OrderedDict
 
+_REMOVED = object()  #: the place of a removed object in the positions
+
 
 class IdCollection(object):
-    """This is a collections of object that have an ``id`` attribute."""
+    """This is a collections of object that have an ``id`` attribute.
+
+    Next to the objects by id, the collection keeps a list of the objects in
+    the order they were appended and the position of each id in this list.
+    This way, :meth:`at` and :meth:`index_of` take constant time.
+    Removed objects leave a gap in the list.
+    While there are gaps, a :class:`Fenwick tree
+    <https://en.wikipedia.org/wiki/Fenwick_tree>` counts the objects in the
+    list, so :meth:`at` and :meth:`index_of` take logarithmic time.
+    The gaps are closed when they are more than half of the list.
+    """
 
     def __init__(self):
         """Create a new :class:`IdCollection` with no arguments.
@@ -12,23 +24,148 @@ class IdCollection(object):
         You can add objects later using the method :meth:`append`.
         """
         self._items = OrderedDict()
+        self._positions = []
+        self._index = {}
+        self._gaps = 0
+        self._tree = None
 
     def append(self, item):
         """Add an object to the end of the :class:`IdCollection`.
 
         :param item: an object that has an id
+
+        If an object with the same id is in the collection, it is replaced
+        and keeps its position.
+        """
+        id_ = item.id
+        self._items[id_] = item
+        index = self._index.get(id_)
+        if index is None:
+            self._index[id_] = len(self._positions)
+            self._positions.append(item)
+            if self._tree is not None:
+                self._append_to_tree()
+        else:
+            self._positions[index] = item
+
+    def _build_tree(self):
+        """Count the objects in the positions in a Fenwick tree.
+
+        ``self._tree[i]`` is the number of objects in the positions
+        ``i - (i & -i)`` to ``i - 1``.
+        """
+        tree = [0] * (len(self._positions) + 1)
+        for node, item in enumerate(self._positions, 1):
+            if item is not _REMOVED:
+                tree[node] += 1
+            parent = node + (node & -node)
+            if parent < len(tree):
+                tree[parent] += tree[node]
+        self._tree = tree
+
+    def _append_to_tree(self):
+        """Count the object appended to the positions in the tree."""
+        node = len(self._tree)
+        self._tree.append(1 + self._count_before(node - 1) -
+                          self._count_before(node - (node & -node)))
+
+    def _remove_from_tree(self, position):
+        """Remove an object at a position from the counts in the tree."""
+        tree = self._tree
+        node = position + 1
+        while node < len(tree):
+            tree[node] -= 1
+            node += node & -node
+
+    def _count_before(self, position):
+        """:return: the number of objects before the position
+        :rtype: int
         """
-        self._items[item.id] = item
+        tree = self._tree
+        count = 0
+        while position:
+            count += tree[position]
+            position -= position & -position
+        return count
+
+    def _position_of(self, index):
+        """:return: the position of the object at the index
+        :rtype: int
+        """
+        tree = self._tree
+        position = 0
+        bit = 1 << (len(tree) - 1).bit_length()
+        while bit:
+            node = position + bit
+            if node < len(tree) and tree[node] <= index:
+                position = node
+                index -= tree[node]
+            bit >>= 1
+        return position
+
+    def _close_gaps(self):
+        """Remove the gaps of the removed objects from the positions."""
+        self._positions = list(self._items.values())
+        self._index = {item.id: index
+                       for index, item in enumerate(self._positions)}
+        self._gaps = 0
+        self._tree = None
 
     def at(self, index):
         """Get the object at an :paramref:`index`.
 
-        :param int index: the index of the object
-        :return: the object at :paramref:`index`
+        :param index: the index of the object or a :class:`slice`
+        :type index: int or slice
+        :return: the object at :paramref:`index` or a :class:`list` of
+          objects if :paramref:`index` is a :class:`slice`
+        :raises IndexError: if there is no object at :paramref:`index`
+        """
+        if self._tree is None:
+            return self._positions[index]
+        if isinstance(index, slice):
+            return [self.at(i) for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("There is no object at index {}.".format(index))
+        return self._positions[self._position_of(index)]
+
+    def index_of(self, id_):
+        """Get the position of the object with the :paramref:`id_`.
+
+        :param id_: the id of an object
+        :return: the index of the object, see :meth:`at`
+        :rtype: int
+        :raises KeyError: if no object with :paramref:`id_` was found
+        """
+        position = self._index[id_]
+        if self._tree is None:
+            return position
+        return self._count_before(position)
+
+    def __delitem__(self, id_):
+        """Remove the object with the :paramref:`id_`.
+
+        :param id_: the id of an object
+        :raises KeyError: if no object with :paramref:`id_` was found
+
+        This takes logarithmic time, amortized over the removals that
+        close the gaps.
         """
-        keys = list(self._items.keys())
-        key = keys[index]
-        return self[key]
+        del self._items[id_]
+        position = self._index.pop(id_)
+        if position == len(self._positions) - 1:
+            self._positions.pop()
+            if self._tree is not None:
+                self._tree.pop()
+            return
+        if self._tree is None:
+            self._build_tree()
+        self._positions[position] = _REMOVED
+        self._remove_from_tree(position)
+        self._gaps += 1
+        if self._gaps > len(self._positions) // 2:
+            self._close_gaps()
 
     def __getitem__(self, id_):
         """Get the object with the :paramref:`id`
@@ -58,8 +195,7 @@ class IdCollection(object):
 
         The objects in the iterator have the order in which they were appended.
         """
-        for id_ in self._items:
-            yield self[id_]
+        return iter(self._items.values())
 
     def __len__(self):
         """:return: the number of objects in this collection"""
@@ -7,7 +7,6 @@ They have certain attributes in common.
 """
 from .Prototype import Prototype
 from .Mesh import ProducedMesh, ConsumedMesh
-from .convert.color import convert_color_to_rrggbb
 
 
 # pattern specification
@@ -74,6 +73,8 @@ class Instruction(Prototype):
     :mod:`InstructionLibrary <knittingpattern.InstructionLibrary>`.
     """
 
+    __slots__ = ()
+
     @property
     def id(self):
         """The id of the instruction.
@@ -211,6 +212,7 @@ class Instruction(Prototype):
           given
         """
         if self.has_color():
+            from .convert.color import convert_color_to_rrggbb
             return convert_color_to_rrggbb(self.color)
         return None
 
@@ -236,8 +238,23 @@ class InstructionInRow(Instruction):
     """Instructions can be placed in rows.
 
     Then, they have additional attributes and properties.
+
+    .. _instruction-connections:
+
+    The connections of the meshes are kept in two flat lists.
+    For the produced mesh at ``index``, ``_produced_connections[2 * index]``
+    is the instruction that consumes it and
+    ``_produced_connections[2 * index + 1]`` is the index of the mesh in the
+    consumed meshes of that instruction. Both are :obj:`None` if the mesh is
+    not consumed. ``_consumed_connections`` is the same for consumed meshes.
+    The lists are :obj:`None` until the first mesh is connected.
+    The :class:`meshes <knittingpattern.Mesh.Mesh>` are created when they
+    are requested and only refer to their instruction and index.
     """
 
+    __slots__ = ("_row", "_produced_connections", "_consumed_connections",
+                 "_cached_index_in_row")
+
     def __init__(self, row, spec):
         """Create a new instruction in a row with a specification.
 
@@ -247,14 +264,8 @@ class InstructionInRow(Instruction):
         """
         super().__init__(spec)
         self._row = row
-        self._produced_meshes = [
-            self._new_produced_mesh(self, index)
-            for index in range(self.number_of_produced_meshes)
-        ]
-        self._consumed_meshes = [
-            self._new_consumed_mesh(self, index)
-            for index in range(self.number_of_consumed_meshes)
-        ]
+        self._produced_connections = None
+        self._consumed_connections = None
         self._cached_index_in_row = None
 
     def transfer_to_row(self, new_row):
@@ -269,6 +280,17 @@ class InstructionInRow(Instruction):
                 self._row.instructions.pop(index)
             self._row = new_row
 
+    def __reduce__(self):
+        """Pickle the instruction as its position in its row.
+
+        :raises knittingpattern.Instruction.InstructionNotFoundInRow: if the
+          instruction is not in its row
+
+        .. seealso:: :meth:`Row.__reduce__()
+          <knittingpattern.Row.Row.__reduce__>`
+        """
+        return _instruction_at, (self._row, self.index_in_row)
+
     @property
     def _new_produced_mesh(self):
         """:return: the class of the produced meshes."""
@@ -279,6 +301,56 @@ class InstructionInRow(Instruction):
         """:return: the class of the consumed meshes."""
         return ConsumedMesh
 
+    def _consumed_mesh_connected_to(self, index):
+        """:return: the mesh that consumes the produced mesh at
+          :paramref:`index` or :obj:`None`
+        """
+        connections = self._produced_connections
+        if connections is None or connections[2 * index] is None:
+            return None
+        instruction = connections[2 * index]
+        return instruction._new_consumed_mesh(instruction,
+                                              connections[2 * index + 1])
+
+    def _produced_mesh_connected_to(self, index):
+        """:return: the mesh that produces the consumed mesh at
+          :paramref:`index` or :obj:`None`
+        """
+        connections = self._consumed_connections
+        if connections is None or connections[2 * index] is None:
+            return None
+        instruction = connections[2 * index]
+        return instruction._new_produced_mesh(instruction,
+                                              connections[2 * index + 1])
+
+    def _connect_produced_mesh(self, index, consuming_instruction,
+                               consumed_index):
+        """Connect the produced mesh at :paramref:`index` to the consumed mesh
+        of the :paramref:`consuming_instruction` at :paramref:`consumed_index`.
+
+        Both meshes must be disconnected.
+        """
+        if self._produced_connections is None:
+            self._produced_connections = \
+                [None] * (2 * self.number_of_produced_meshes)
+        self._produced_connections[2 * index:2 * index + 2] = \
+            consuming_instruction, consumed_index
+        if consuming_instruction._consumed_connections is None:
+            consuming_instruction._consumed_connections = \
+                [None] * (2 * consuming_instruction.number_of_consumed_meshes)
+        consuming_instruction._consumed_connections[
+            2 * consumed_index:2 * consumed_index + 2] = self, index
+
+    def _disconnect_produced_mesh(self, index):
+        """Disconnect the produced mesh at :paramref:`index` from the mesh
+        that consumes it."""
+        connections = self._produced_connections
+        consuming_instruction = connections[2 * index]
+        consumed_index = connections[2 * index + 1]
+        consuming_instruction._consumed_connections[
+            2 * consumed_index:2 * consumed_index + 2] = None, None
+        connections[2 * index:2 * index + 2] = None, None
+
     @property
     def row(self):
         """The row this instruction is in.
@@ -428,14 +500,8 @@ class InstructionInRow(Instruction):
                 index = instruction.index_of_first_produced_mesh_in_row
 
         """
-        index = 0
-        for instruction in self.row_instructions:
-            if instruction is self:
-                break
-            index += instruction.number_of_produced_meshes
-        else:
-            self._raise_not_found_error()
-        return index
+        produced, _ = self._row._get_mesh_index_table()
+        return produced[self.index_in_row]
 
     @property
     def index_of_last_produced_mesh_in_row(self):
@@ -462,14 +528,8 @@ class InstructionInRow(Instruction):
         Same as :attr:`index_of_first_produced_mesh_in_row`
         but for consumed meshes.
         """
-        index = 0
-        for instruction in self.row_instructions:
-            if instruction is self:
-                break
-            index += instruction.number_of_consumed_meshes
-        else:
-            self._raise_not_found_error()
-        return index
+        _, consumed = self._row._get_mesh_index_table()
+        return consumed[self.index_in_row]
 
     @property
     def index_of_last_consumed_mesh_in_row(self):
@@ -496,7 +556,9 @@ class InstructionInRow(Instruction):
 
         .. seealso:: :attr:`consumed_meshes`, :attr:`consuming_instructions`
         """
-        return self._produced_meshes
+        new_mesh = self._new_produced_mesh
+        return [new_mesh(self, index)
+                for index in range(self.number_of_produced_meshes)]
 
     @property
     def consumed_meshes(self):
@@ -513,7 +575,9 @@ class InstructionInRow(Instruction):
 
         .. seealso:: :attr:`produced_meshes`, :attr:`producing_instructions`
         """
-        return self._consumed_meshes
+        new_mesh = self._new_consumed_mesh
+        return [new_mesh(self, index)
+                for index in range(self.number_of_consumed_meshes)]
 
     def __repr__(self):
         """:obj:`repr(instruction) <repr>` used for :func:`print`.
@@ -543,8 +607,9 @@ class InstructionInRow(Instruction):
 
         .. seealso:: :attr:`consuming_instructions`, :attr:`consumed_meshes`
         """
-        return [(mesh.producing_instruction if mesh.is_produced() else None)
-                for mesh in self.consumed_meshes]
+        if self._consumed_connections is None:
+            return [None] * self.number_of_consumed_meshes
+        return self._consumed_connections[::2]
 
     @property
     def consuming_instructions(self):
@@ -556,8 +621,9 @@ class InstructionInRow(Instruction):
 
         .. seealso:: :attr:`producing_instructions`, :attr:`produced_meshes`
         """
-        return [(mesh.consuming_instruction if mesh.is_consumed() else None)
-                for mesh in self.produced_meshes]
+        if self._produced_connections is None:
+            return [None] * self.number_of_produced_meshes
+        return self._produced_connections[::2]
 
     @property
     def color(self):
@@ -581,7 +647,7 @@ class InstructionInRow(Instruction):
 
         .. seealso:: :attr:`Instruction.number_of_produced_meshes`
         """
-        return self._produced_meshes[-1]
+        return self.produced_meshes[-1]
 
     @property
     def last_consumed_mesh(self):
@@ -593,7 +659,7 @@ class InstructionInRow(Instruction):
 
         .. seealso:: :attr:`Instruction.number_of_consumed_meshes`
         """
-        return self._consumed_meshes[-1]
+        return self.consumed_meshes[-1]
 
     @property
     def first_produced_mesh(self):
@@ -605,7 +671,7 @@ class InstructionInRow(Instruction):
 
         .. seealso:: :attr:`Instruction.number_of_produced_meshes`
         """
-        return self._produced_meshes[0]
+        return self.produced_meshes[0]
 
     @property
     def first_consumed_mesh(self):
@@ -617,7 +683,7 @@ class InstructionInRow(Instruction):
 
         .. seealso:: :attr:`Instruction.number_of_consumed_meshes`
         """
-        return self._consumed_meshes[0]
+        return self.consumed_meshes[0]
 
 
 class InstructionNotFoundInRow(ValueError):
@@ -625,6 +691,12 @@ class InstructionNotFoundInRow(ValueError):
     pass
 
 
+def _instruction_at(row, index):
+    """Unpickle an instruction in a row, see
+    :meth:`InstructionInRow.__reduce__`."""
+    return row.instructions[index]
+
+
 __all__ = ["Instruction", "InstructionInRow", "InstructionNotFoundInRow",
            "ID", "TYPE", "KNIT_TYPE", "PURL_TYPE", "DEFAULT_TYPE", "COLOR",
            "NUMBER_OF_CONSUMED_MESHES", "DEFAULT_NUMBER_OF_CONSUMED_MESHES",
@@ -5,11 +5,36 @@ in each :class:`knitting pattern set
 This module provides the functionality to load default values for instructions
 from various locations.
 """
+from types import MappingProxyType
 from .Instruction import TYPE
 from .Loader import JSONLoader
 from .Instruction import Instruction
 
 
+def _hashable(value):
+    """:return: a hashable object that is equal for equal JSON values
+    :raises TypeError: if the value can not be hashed
+
+    The type is part of the result so that ``1``, ``1.0`` and ``True`` differ.
+    """
+    if isinstance(value, dict):
+        return (dict, frozenset((_hashable(key), _hashable(value_))
+                                for key, value_ in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(map(_hashable, value)))
+    hash(value)
+    return (type(value), value)
+
+
+def _copy(value):
+    """:return: a copy of a JSON value and the lists and dicts in it"""
+    if isinstance(value, dict):
+        return {key: _copy(value_) for key, value_ in value.items()}
+    if isinstance(value, list):
+        return list(map(_copy, value))
+    return value
+
+
 class InstructionLibrary(object):
     """This library can be used to look up default specification of
     instructions.
@@ -38,6 +63,7 @@ class InstructionLibrary(object):
         Use :attr:`load` to load specifications.
         """
         self._type_to_instruction = {}
+        self._shared_instructions = {}
 
     @property
     def load(self):
@@ -77,7 +103,11 @@ class InstructionLibrary(object):
         .. seealso:: :meth:`as_instruction`
         """
         instruction = self.as_instruction(specification)
+        if not isinstance(self._type_to_instruction, dict):
+            # the types are shared with other libraries, copy on write
+            self._type_to_instruction = dict(self._type_to_instruction)
         self._type_to_instruction[instruction.type] = instruction
+        self._shared_instructions.clear()
 
     def as_instruction(self, specification):
         """Convert the specification into an instruction
@@ -95,6 +125,40 @@ class InstructionLibrary(object):
             instruction.inherit_from(self._type_to_instruction[type_])
         return instruction
 
+    def as_shared_instruction(self, specification):
+        """Convert the specification into an instruction that is shared.
+
+        :param dict specification: a specification as for
+          :meth:`as_instruction`
+        :return: the same instruction for equal specifications
+        :rtype: knittingpattern.Instruction.Instruction
+
+        Instructions in rows are mostly equal, i.e. a chart has thousands of
+        ``{"color": "black"}`` knit instructions. They can all share one
+        instruction. The instruction uses a read-only copy of the
+        :paramref:`specification` so that changing the
+        :paramref:`specification` does not change the shared instruction.
+        The lists and dicts in the :paramref:`specification` are copied, too.
+        Their copies are shared by all the instructions with equal
+        specifications and should not be changed.
+        Specifications that are no :class:`dicts <dict>` or can not be hashed
+        are converted with :meth:`as_instruction`.
+        Adding an instruction with :meth:`add_instruction` creates new shared
+        instructions.
+        """
+        if not isinstance(specification, dict):
+            return self.as_instruction(specification)
+        try:
+            key = _hashable(specification)
+        except TypeError:
+            return self.as_instruction(specification)
+        instruction = self._shared_instructions.get(key)
+        if instruction is None:
+            instruction = self.as_instruction(
+                MappingProxyType(_copy(specification)))
+            self._shared_instructions[key] = instruction
+        return instruction
+
     def __getitem__(self, instruction_type):
         """:return: the specification for :paramref:`instruction_type`
 
@@ -114,6 +178,9 @@ class InstructionLibrary(object):
 
 class DefaultInstructions(InstructionLibrary):
     """The default specifications for instructions ported with this package
+
+    The specifications are loaded once. All default instruction libraries
+    share the loaded instructions until instructions are added to them.
     """
 
     #: the folder relative to this module where the instructions are located
@@ -125,7 +192,15 @@ class DefaultInstructions(InstructionLibrary):
         The default specifications are loaded automatically form this package.
         """
         super().__init__()
-        self.load.relative_folder(__file__, self.INSTRUCTIONS_FOLDER)
+        key = (type(self), self.INSTRUCTIONS_FOLDER)
+        loaded_instructions = _loaded_default_instructions.get(key)
+        if loaded_instructions is None:
+            self.load.relative_folder(__file__, self.INSTRUCTIONS_FOLDER)
+            for instruction in self._type_to_instruction.values():
+                instruction.freeze()
+            loaded_instructions = MappingProxyType(self._type_to_instruction)
+            _loaded_default_instructions[key] = loaded_instructions
+        self._type_to_instruction = loaded_instructions
 
 
 def default_instructions():
@@ -145,4 +220,8 @@ def default_instructions():
 
 
 _default_instructions = None
+
+#: the read-only instructions of the :class:`DefaultInstructions` by class and
+#: folder
+_loaded_default_instructions = {}
 __all__ = ["InstructionLibrary", "DefaultInstructions", "default_instructions"]
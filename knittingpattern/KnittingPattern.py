@@ -6,6 +6,7 @@ consists of several :class:`KnittingPatterns
 <knittingpattern.KnittingPattern.KnittingPattern>`.
 Their functionality can be found in this module.
 """
+from pickle import PicklingError
 from .walk import walk
 from .utils import unique
 
@@ -34,6 +35,26 @@ class KnittingPattern(object):
         self._rows = rows
         self._parser = parser
 
+    def __reduce__(self):
+        """Pickle the knitting pattern as its position in its set.
+
+        :raises pickle.PicklingError: if the knitting pattern is not in a
+          knitting pattern set of its parser
+
+        .. seealso:: :meth:`KnittingPatternSet.__reduce__()
+          <knittingpattern.KnittingPatternSet.KnittingPatternSet.__reduce__>`
+        """
+        for knitting_pattern_set in self._parser.knitting_pattern_sets:
+            patterns = knitting_pattern_set.patterns
+            try:
+                index = patterns.index_of(self.id)
+            except KeyError:
+                continue
+            if patterns.at(index) is self:
+                return _pattern_at, (knitting_pattern_set, index)
+        raise PicklingError("{} is not in a knitting pattern set."
+                            "".format(self))
+
     @property
     def id(self):
         """the identifier within a :class:`set of knitting patterns
@@ -64,6 +85,23 @@ class KnittingPattern(object):
         self._rows.append(row)
         return row
 
+    def connect_range(self, from_row, from_start, to_row, to_start, count):
+        """Connect meshes of two rows.
+
+        :param knittingpattern.Row.Row from_row: the row that produces the
+          meshes
+        :param int from_start: the index of the first produced mesh in
+          :paramref:`from_row`
+        :param knittingpattern.Row.Row to_row: the row that consumes the
+          meshes
+        :param int to_start: the index of the first consumed mesh in
+          :paramref:`to_row`
+        :param int count: the number of meshes to connect
+
+        .. seealso:: :meth:`knittingpattern.Row.Row.connect_range`
+        """
+        from_row.connect_range(from_start, to_row, to_start, count)
+
     def rows_in_knit_order(self):
         """Return the rows in the order that they should be knit.
 
@@ -85,4 +123,11 @@ class KnittingPattern(object):
         return unique([row.instruction_colors
                        for row in self.rows_in_knit_order()])
 
+
+def _pattern_at(knitting_pattern_set, index):
+    """Unpickle a knitting pattern, see :meth:`KnittingPattern.__reduce__`.
+    """
+    return knitting_pattern_set.patterns.at(index)
+
+
 __all__ = ["KnittingPattern"]
@@ -1,11 +1,10 @@
-"""A set of knitting patterns that can be dumped and loaded."""
+"""A set of knitting patterns that can be dumped and loaded.
 
-from .convert.AYABPNGDumper import AYABPNGDumper
-from .Dumper import XMLDumper
-from .convert.InstructionSVGCache import default_instruction_svg_cache
-from .convert.Layout import GridLayout
-from .convert.SVGBuilder import SVGBuilder
-from .convert.KnittingPatternToSVG import KnittingPatternToSVG
+The converters are imported when they are used so that loading a pattern
+does not import :mod:`PIL` or :mod:`xmltodict`.
+"""
+from .Parser import ID, NAME, TYPE, VERSION, INSTRUCTIONS, PATTERNS, ROWS, \
+    CONNECTIONS, FROM, TO, START, DEFAULT_START, MESHES, COMMENT
 
 
 class KnittingPatternSet(object):
@@ -85,9 +84,13 @@ class KnittingPatternSet(object):
         """
         return self._comment
 
-    def to_ayabpng(self):
+    def to_ayabpng(self, indexed=False):
         """Convert the knitting pattern to a png.
 
+        :param bool indexed: whether to save the png with a palette of
+          indexed colors, see
+          :class:`~knittingpattern.convert.AYABPNGDumper.AYABPNGDumper`
+
         :return: a dumper to save this pattern set as png for the AYAB
           software
         :rtype: knittingpattern.convert.AYABPNGDumper.AYABPNGDumper
@@ -100,7 +103,136 @@ class KnittingPatternSet(object):
             "/the/path/to/the/file.png"
 
         """
-        return AYABPNGDumper(lambda: self)
+        from .convert.AYABPNGDumper import AYABPNGDumper
+        return AYABPNGDumper(lambda: self, indexed=indexed)
+
+    def __reduce__(self):
+        """Pickle the knitting pattern set in the binary format.
+
+        :return: a tuple to restore the knitting pattern set with the
+          specification of its parser from the binary format of
+          :mod:`knittingpattern.binary`
+
+        This makes the knitting pattern sets :mod:`pickleable <pickle>`, i.e.
+        to send them to other processes, and :func:`copy.deepcopy` creates
+        a new knitting pattern set.
+        The objects in the knitting pattern set are pickled as their
+        positions in it.
+        """
+        from .binary import dumps
+        return (_load_knitting_pattern_set,
+                (self._parser.specification, dumps(self)))
+
+    def to_json(self):
+        """Convert the knitting pattern set to the JSON file format.
+
+        :return: a dumper to save this pattern set in the :ref:`file format
+          <FileFormatSpecification>`
+        :rtype: knittingpattern.Dumper.JSONDumper
+
+        Example:
+
+        .. code:: python
+
+            >>> knitting_pattern_set.to_json().path("pattern.json")
+
+        The patterns, rows, instructions and connections are taken from the
+        objects, so changes to them are saved.
+        The rows are converted one by one while they are written.
+        Adjacent meshes that are connected to adjacent meshes of the same
+        row are saved as one connection.
+        A connection is saved in the pattern of its row that comes last in
+        the :attr:`patterns` so that both rows are loaded before it.
+        """
+        from .Dumper import JSONDumper
+        return JSONDumper(self._to_json_object)
+
+    def _to_json_object(self):
+        """:return: the specification of this set with generators for the
+          patterns, rows and connections
+        :rtype: dict
+        :raises ValueError: while the patterns are generated, if a row is
+          connected to a row that is not in this set
+        """
+        result = {TYPE: self.type, VERSION: self.version}
+        if self.comment is not None:
+            result[COMMENT] = self.comment
+        result[PATTERNS] = self._json_patterns()
+        return result
+
+    def _json_patterns(self):
+        """:return: an iterator over the specifications of the patterns"""
+        pattern_index = {row: index
+                         for index, pattern in enumerate(self.patterns)
+                         for row in pattern.rows}
+        delayed_connections = {}
+        for index, pattern in enumerate(self.patterns):
+            yield {ID: pattern.id, NAME: pattern.name,
+                   ROWS: map(self._json_row, pattern.rows),
+                   CONNECTIONS: self._json_connections(
+                       index, pattern, pattern_index, delayed_connections)}
+
+    @staticmethod
+    def _json_row(row):
+        """:return: the specification of a row"""
+        result = {ID: row.id}
+        for key, value in row._own_specification().items():
+            if key not in (ID, INSTRUCTIONS):
+                result[key] = value
+        result[INSTRUCTIONS] = [dict(instruction._own_specification())
+                                for instruction in row.instructions]
+        return result
+
+    @staticmethod
+    def _json_connections(index, pattern, pattern_index,
+                          delayed_connections):
+        """:return: an iterator over the specifications of the connections
+        of a pattern
+
+        :param int index: the index of the :paramref:`pattern`
+        :param dict pattern_index: the index of the pattern of each row
+        :param dict delayed_connections: the connections to save in later
+          patterns by their index
+        """
+        yield from delayed_connections.pop(index, ())
+        for row in pattern.rows:
+            for start, to_row, to_start, count in row.connection_ranges():
+                to_index = pattern_index.get(to_row)
+                if to_index is None:
+                    raise ValueError("{} is connected to {} which is not in "
+                                     "the knitting pattern set."
+                                     "".format(row, to_row))
+                connection = {FROM: {ID: row.id}, TO: {ID: to_row.id},
+                              MESHES: count}
+                if start != DEFAULT_START:
+                    connection[FROM][START] = start
+                if to_start != DEFAULT_START:
+                    connection[TO][START] = to_start
+                if to_index > index:
+                    delayed_connections.setdefault(to_index, []).append(
+                        connection)
+                else:
+                    yield connection
+
+    def to_binary(self):
+        """Convert the knitting pattern set to the binary format.
+
+        :return: a dumper to save this pattern set in the binary format of
+          :mod:`knittingpattern.binary`
+        :rtype: knittingpattern.Dumper.ContentDumper
+
+        Example:
+
+        .. code:: python
+
+            >>> knitting_pattern_set.to_binary().path("pattern.kpb")
+
+        .. seealso:: :func:`knittingpattern.load_binary_from`
+        """
+        from .Dumper import ContentDumper
+        from .binary import dumps
+        return ContentDumper(lambda file: file.write(dumps(self)),
+                             text_is_expected=False, encoding=None)
 
     def to_svg(self, zoom):
         """Create an SVG from the knitting pattern set.
@@ -116,6 +248,13 @@ class KnittingPatternSet(object):
             >>> knitting_pattern_set.to_svg(25).temporary_path(".svg")
             "/the/path/to/the/file.svg"
         """
+        from .Dumper import XMLDumper
+        from .convert.InstructionSVGCache import \
+            default_instruction_svg_cache
+        from .convert.Layout import GridLayout
+        from .convert.SVGBuilder import SVGBuilder
+        from .convert.KnittingPatternToSVG import KnittingPatternToSVG
+
         def on_dump():
             """Dump the knitting pattern to the file.
 
@@ -154,4 +293,12 @@ class KnittingPatternSet(object):
         return self._patterns.first
 
 
+def _load_knitting_pattern_set(specification, bytes_):
+    """Unpickle a knitting pattern set, see
+    :meth:`KnittingPatternSet.__reduce__`."""
+    from .ParsingSpecification import new_binary_knitting_pattern_set_loader
+    return new_binary_knitting_pattern_set_loader(specification).string(
+        bytes_)
+
+
 __all__ = ["KnittingPatternSet"]
@@ -42,24 +42,77 @@ class PathLoader(object):
         self._process = process
         self._chooses_path = chooses_path
 
-    def folder(self, folder):
+    def folder(self, folder, executor=None, workers=None):
         """Load all files from a folder recursively.
 
         Depending on :meth:`chooses_path` some paths may not be loaded.
         Every loaded path is processed and returned part of the returned list.
 
         :param str folder: the folder to load the files from
+        :param executor: :obj:`None` or a :class:`concurrent.futures.Executor`
+          to load the files in parallel with
+        :param int workers: :obj:`None` or the number of processes to load
+          the files in parallel with if no :paramref:`executor` is given
         :rtype: list
         :return: a list of the results of the processing steps of the loaded
           files
+
+        If an :paramref:`executor` or a number of :paramref:`workers` is
+        given, the files are loaded in parallel and an iterator over tuples
+        ``(path, future)`` is returned instead.
+        They are yielded as the files are loaded.
+        ``future.result()`` returns the result of the processing step or
+        raises the error that occurred while loading the ``path``, so one
+        broken file does not stop the others from loading.
+
+        .. code:: python
+
+            for path, future in loader.folder("patterns", workers=4):
+                try:
+                    knitting_pattern_set = future.result()
+                except ValueError as error:
+                    print("Could not load", path, error)
+
+        The files are parsed in other processes if :paramref:`workers` or a
+        :class:`~concurrent.futures.ProcessPoolExecutor` are given.
+        Then, the loader and the results are :mod:`pickled <pickle>`.
+        Threads load the files in parallel, but as the parsing is done in
+        Python, it is not faster.
         """
-        result = []
+        paths = self._paths_in(folder)
+        if executor is None and workers is None:
+            return [self.path(path) for path in paths]
+        return self._load_in_parallel(paths, executor, workers)
+
+    def _paths_in(self, folder):
+        """:return: an iterator over the chosen paths in the folder
+        and its subfolders"""
         for root, _, files in os.walk(folder):
             for file in files:
                 path = os.path.join(root, file)
                 if self._chooses_path(path):
-                    result.append(self.path(path))
-        return result
+                    yield path
+
+    def _load_in_parallel(self, paths, executor, workers):
+        """Load the paths with the executor or a new process pool.
+
+        :return: an iterator over tuples ``(path, future)`` in the order the
+          paths are loaded
+
+        .. seealso:: :meth:`folder`
+        """
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        if executor is None:
+            with ProcessPoolExecutor(workers) as executor:
+                yield from self._load_in_parallel(paths, executor, None)
+            return
+        futures = {executor.submit(self.path, path): path for path in paths}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future
+        finally:
+            for future in futures:
+                future.cancel()
 
     def chooses_path(self, path):
         """:return: whether the path should be loaded
@@ -97,7 +150,7 @@ class PathLoader(object):
         absolute_path = os.path.join(path, folder)
         return absolute_path
 
-    def relative_folder(self, module, folder):
+    def relative_folder(self, module, folder, executor=None, workers=None):
         """Load a folder located relative to a module and return the processed
         result.
 
@@ -108,6 +161,8 @@ class PathLoader(object):
           - a module name
 
         :param str folder: the path of a folder relative to :paramref:`module`
+        :param executor: see :meth:`folder`
+        :param int workers: see :meth:`folder`
         :return: a list of the results of the processing
         :rtype: list
 
@@ -115,9 +170,10 @@ class PathLoader(object):
         Every loaded path is processed and returned part of the returned list.
         You can use :meth:`choose_paths` to find out which paths are chosen to
         load.
+        The paths can be loaded in parallel like in :meth:`folder`.
         """
         folder = self._relative_to_absolute(module, folder)
-        return self.folder(folder)
+        return self.folder(folder, executor, workers)
 
     def relative_file(self, module, file):
         """Load a file relative to a module.
@@ -153,16 +209,19 @@ class PathLoader(object):
         example_path = os.path.join("examples", relative_path)
         return self.relative_file(__file__, example_path)
 
-    def examples(self):
+    def examples(self, executor=None, workers=None):
         """Load all examples form the examples folder of this packge.
 
+        :param executor: see :meth:`folder`
+        :param int workers: see :meth:`folder`
         :return: a list of processed examples
         :rtype: list
 
         Depending on :meth:`chooses_path` some paths may not be loaded.
         Every loaded path is processed and returned part of the returned list.
+        The examples can be loaded in parallel like in :meth:`folder`.
         """
-        return self.relative_folder(__file__, "examples")
+        return self.relative_folder(__file__, "examples", executor, workers)
 
 
 class ContentLoader(PathLoader):
@@ -218,6 +277,20 @@ class JSONLoader(ContentLoader):
     :class:`object` as first argument: ``process(object)``.
     """
 
+    def __init__(self, process=identity, chooses_path=true, cache=None):
+        """Create a JSONLoader object.
+
+        :param process: see :meth:`PathLoader.__init__`
+        :param chooses_path: see :meth:`PathLoader.__init__`
+        :param cache: :obj:`None` or a cache for the processed results of
+          the contents such as a
+          :class:`~knittingpattern.ParseCache.ParseCache`.
+          ``cache.load(string, load)`` returns ``load(string)`` or a copy of
+          it from the cache.
+        """
+        super().__init__(process, chooses_path)
+        self._cache = cache
+
     def object(self, object_):
         """Processes an already loaded object.
 
@@ -231,9 +304,46 @@ class JSONLoader(ContentLoader):
 
         :return: the result of the processing step
         :param str string: the string to load the JSON from
+
+        If a :paramref:`~__init__.cache` is given, the result may be loaded
+        from it.
         """
+        if self._cache is not None:
+            return self._cache.load(string, self._load_string)
+        return self._load_string(string)
+
+    def _load_string(self, string):
+        """:return: the processed JSON content of the string"""
         object_ = json.loads(string)
         return self.object(object_)
 
 
-__all__ = ["JSONLoader", "ContentLoader", "PathLoader", "true", "identity"]
+class BinaryLoader(ContentLoader):
+    """Load and process bytes from various locations.
+
+    The :paramref:`process <PathLoader.__init__.process>` is called with
+    :class:`bytes` as first argument: ``process(bytes)``.
+    """
+
+    def path(self, path):
+        """:return: the processed result of a :paramref:`path's <path>`
+          content.
+        :param str path: the path where to load the content from.
+          It should exist on the local file system.
+        """
+        with open(path, "rb") as file:
+            return self.file(file)
+
+    def url(self, url):
+        """load and process the content behind a url
+
+        :return: the processed result of the :paramref:`url's <url>` content
+        :param str url: the url to retrieve the content from
+        """
+        import urllib.request
+        with urllib.request.urlopen(url) as file:
+            return self.file(file)
+
+
+__all__ = ["JSONLoader", "ContentLoader", "PathLoader", "BinaryLoader",
+           "true", "identity"]
@@ -14,8 +14,14 @@ class Mesh(metaclass=ABCMeta):
     :class:`ProducedMesh <knittingpattern.Mesh.ProducedMesh>` and
     :class:`ConsumedMesh <knittingpattern.Mesh.ConsumedMesh>`.
 
+    The meshes use :obj:`__slots__` because there are many of them.
+    They are views on the :ref:`connections of their instruction
+    <instruction-connections>`. Meshes are equal if they belong to the same
+    instruction at the same index.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def _producing_instruction_and_index(self):
         """Replace this method."""
@@ -333,7 +339,7 @@ class Mesh(metaclass=ABCMeta):
         If you got this mesh from :attr:`InstructionInRow.produced_meshes
         <knittinpattern.Instruction.InstructionInRow.produced_meshes>` or
         :attr:`Row.produced_meshes <knittinpattern.Row.Row.produced_meshes>`,
-        this returns the same object.
+        this returns an equal mesh.
 
         .. seealso:: :meth:`as_consumed_mesh`,
           :attr:`knittinpattern.Instruction.InstructionInRow.produced_meshes`,
@@ -372,6 +378,8 @@ class ProducedMesh(Mesh):
     """A :class:`~knittingpattern.Mesh.Mesh` that has a producing instruction
     """
 
+    __slots__ = ("__producing_instruction", "__index")
+
     def __init__(self, producing_instruction,
                  index_in_producing_instruction):
         """
@@ -388,20 +396,22 @@ class ProducedMesh(Mesh):
           to access the :class:`meshes <knittingpattern.Mesh.Mesh>`.
 
         """
-        self.__producing_instruction_and_index = (
-            producing_instruction,
-            index_in_producing_instruction
-        )
-        self._consumed_part = None
+        self.__producing_instruction = producing_instruction
+        self.__index = index_in_producing_instruction
+
+    @property
+    def _consumed_part(self):
+        """The consumed mesh this mesh is connected to or :obj:`None`."""
+        return self.__producing_instruction._consumed_mesh_connected_to(
+            self.__index)
 
     def _producing_instruction_and_index(self):
-        return self.__producing_instruction_and_index
+        return self.__producing_instruction, self.__index
 
     def _producing_row_and_index(self):
-        instruction, index = self.__producing_instruction_and_index
-        producing_row = instruction.row
-        return (producing_row,
-                index + instruction.index_of_first_produced_mesh_in_row)
+        instruction = self.__producing_instruction
+        return (instruction.row,
+                self.__index + instruction.index_of_first_produced_mesh_in_row)
 
     def _consuming_instruction_and_index(self):
         return self._consumed_part._consuming_instruction_and_index()
@@ -413,35 +423,63 @@ class ProducedMesh(Mesh):
         return True
 
     def _is_consumed(self):
-        return self._consumed_part is not None
+        connections = self.__producing_instruction._produced_connections
+        return connections is not None and \
+            connections[2 * self.__index] is not None
 
     def _is_consumed_mesh(self):
         return False
 
     def _disconnect(self):
-        assert self._consumed_part is not None, "Use is_consumed() before."
-        self._consumed_part._disconnected()
-        self._consumed_part = None
+        assert self._is_consumed(), "Use is_consumed() before."
+        self._connection_changed()
+        self.__producing_instruction._disconnect_produced_mesh(self.__index)
 
     def _connect_to(self, other_mesh):
         assert other_mesh._is_consumed_mesh()
-        self._consumed_part = other_mesh
-        self._consumed_part._connect_to_produced_mesh(self)
+        instruction, index = other_mesh._consuming_instruction_and_index()
+        self.__producing_instruction._connect_produced_mesh(
+            self.__index, instruction, index)
+        self._connection_changed()
+
+    def _connection_changed(self):
+        """Notify the rows that this mesh connects."""
+        instruction = self.__producing_instruction
+        instruction.row._connections_changed()
+        consuming_instruction = \
+            instruction._produced_connections[2 * self.__index]
+        consuming_instruction.row._connections_changed()
 
     def _as_produced_mesh(self):
         return self
 
     def _as_consumed_mesh(self):
-        assert self._consumed_part is not None
+        assert self._is_consumed()
         return self._consumed_part
 
     def _is_connected_to(self, other_mesh):
         return other_mesh is not None and other_mesh == self._consumed_part
 
+    def __reduce__(self):
+        """Pickle the mesh as its instruction and index."""
+        return ProducedMesh, (self.__producing_instruction, self.__index)
+
+    def __eq__(self, other):
+        """Meshes are equal if they are produced by the same instruction at
+        the same index."""
+        return isinstance(other, ProducedMesh) and \
+            self.__producing_instruction is other.__producing_instruction and \
+            self.__index == other.__index
+
+    def __hash__(self):
+        return hash((self.__producing_instruction, self.__index))
+
 
 class ConsumedMesh(Mesh):
     """A mesh that is only consumed by an instruction"""
 
+    __slots__ = ("__consuming_instruction", "__index")
+
     def __init__(self, consuming_instruction,
                  index_in_consuming_instruction):
         """
@@ -458,11 +496,14 @@ class ConsumedMesh(Mesh):
           to access the :class:`meshes <knittingpattern.Mesh.Mesh>`.
 
         """
-        self.__consuming_instruction_and_index = (
-            consuming_instruction,
-            index_in_consuming_instruction
-        )
-        self._produced_part = None
+        self.__consuming_instruction = consuming_instruction
+        self.__index = index_in_consuming_instruction
+
+    @property
+    def _produced_part(self):
+        """The produced mesh this mesh is connected to or :obj:`None`."""
+        return self.__consuming_instruction._produced_mesh_connected_to(
+            self.__index)
 
     def _producing_instruction_and_index(self):
         return self._produced_part._producing_instruction_and_index()
@@ -471,17 +512,17 @@ class ConsumedMesh(Mesh):
         return self._produced_part._producing_row_and_index()
 
     def _consuming_instruction_and_index(self):
-        return self.__consuming_instruction_and_index
+        return self.__consuming_instruction, self.__index
 
     def _consuming_row_and_index(self):
-        instruction, index = self.__consuming_instruction_and_index
-        consuming_row = instruction.row
-        return (
-            consuming_row, index +
-            instruction.index_of_first_consumed_mesh_in_row)
+        instruction = self.__consuming_instruction
+        return (instruction.row,
+                self.__index + instruction.index_of_first_consumed_mesh_in_row)
 
     def _is_produced(self):
-        return self._produced_part is not None
+        connections = self.__consuming_instruction._consumed_connections
+        return connections is not None and \
+            connections[2 * self.__index] is not None
 
     def _is_consumed(self):
         return True
@@ -490,23 +531,15 @@ class ConsumedMesh(Mesh):
         return True
 
     def _disconnect(self):
-        assert self._produced_part is not None
+        assert self._is_produced()
         self._produced_part._disconnect()
 
-    def _disconnected(self):
-        self._produced_part = None
-
     def _connect_to(self, other_mesh):
         assert not other_mesh._is_consumed_mesh()
         other_mesh._connect_to(self)
 
-    def _connect_to_produced_mesh(self, produced_mesh):
-        """This is called after a connection has been established by the
-        produced mesh."""
-        self._produced_part = produced_mesh
-
     def _as_produced_mesh(self):
-        assert self._produced_part is not None
+        assert self._is_produced()
         return self._produced_part
 
     def _as_consumed_mesh(self):
@@ -515,6 +548,20 @@ class ConsumedMesh(Mesh):
     def _is_connected_to(self, other_mesh):
         if other_mesh._is_consumed_mesh():
             return False
-        return other_mesh is not self and other_mesh._is_connected_to(self)
+        return other_mesh._is_connected_to(self)
+
+    def __reduce__(self):
+        """Pickle the mesh as its instruction and index."""
+        return ConsumedMesh, (self.__consuming_instruction, self.__index)
+
+    def __eq__(self, other):
+        """Meshes are equal if they are consumed by the same instruction at
+        the same index."""
+        return isinstance(other, ConsumedMesh) and \
+            self.__consuming_instruction is other.__consuming_instruction and \
+            self.__index == other.__index
+
+    def __hash__(self):
+        return hash((self.__consuming_instruction, self.__index))
 
 __all__ = ["Mesh", "ProducedMesh", "ConsumedMesh"]
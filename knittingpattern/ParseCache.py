@@ -0,0 +1,279 @@
+"""This module provides a cache for parsed knitting pattern sets on disk.
+
+Parsing the same files again and again takes time.
+A :class:`ParseCache` saves each parsed knitting pattern set in the
+:mod:`binary format <knittingpattern.binary>` which is faster to load.
+
+.. code:: python
+
+    import knittingpattern
+    from knittingpattern.ParseCache import ParseCache
+    cache = ParseCache("/tmp/knittingpattern-cache")
+    loader = knittingpattern.load_from(cache=cache)
+    knitting_pattern_set = loader.path("pattern.json")  # parsed
+    knitting_pattern_set = loader.path("pattern.json")  # loaded from cache
+    assert cache.hits == 1 and cache.misses == 1
+"""
+import hashlib
+import os
+import tempfile
+
+#: the extension of the files in the cache
+EXTENSION = ".kpb"
+
+#: the default size of the files in the cache in bytes
+DEFAULT_MAXIMUM_SIZE = 100 * 1024 * 1024
+
+
+def _version():
+    """:return: the version of the library and the binary format
+    :rtype: str
+    """
+    from . import __version__
+    from .binary import FORMAT_VERSION
+    return "{}-{}".format(__version__, FORMAT_VERSION)
+
+
+def _qualified_name(value):
+    """:return: the module and the qualified name of a class or function
+    :rtype: str
+    :raises TypeError: if the :paramref:`value` has no qualified name
+    """
+    module = getattr(value, "__module__", None)
+    qualname = getattr(value, "__qualname__", None)
+    if not isinstance(module, str) or not isinstance(qualname, str):
+        message = "{!r} has no module and qualified name to build the " \
+            "key of the cache from.".format(value)
+        raise TypeError(message)
+    return "{}.{}".format(module, qualname)
+
+
+def _specification_key(specification):
+    """:return: the class and the values of a specification
+    :rtype: str
+    :raises TypeError: if a value has no qualified name
+
+    The key is built from the qualified names of the values, not their
+    :func:`repr`, which can contain the memory address of a function.
+    So, the key stays the same in other processes.
+    """
+    values = sorted(vars(specification).items())
+    return "{}({})".format(_qualified_name(type(specification)), ",".join(
+        "{}={}".format(name, _qualified_name(value))
+        for name, value in values))
+
+
+class ParseCache(object):
+
+    """A cache for parsed knitting pattern sets in a folder.
+
+    The parsed knitting pattern sets are saved in files named after the
+    hash of the content they were parsed from and the version of this
+    library. So, changed files and new versions of the library do not use
+    outdated results.
+
+    When the files in the folder are larger than the
+    :paramref:`~__init__.maximum_size`, the files that were used least
+    recently are removed.
+    The time a file was used last is its modification time.
+
+    Caches with different
+    :paramref:`specifications <ParseCache.__init__.specification>` can share
+    a folder, as the specification is part of the names of the files.
+    Use the same specification as the loader that uses the cache.
+    """
+
+    def __init__(self, folder, maximum_size=DEFAULT_MAXIMUM_SIZE,
+                 restore=None, specification=None):
+        """Create a new cache.
+
+        :param str folder: the folder to save the files in. It is created if
+          it does not exist.
+        :param int maximum_size: the maximum size of the files in the cache
+          in bytes
+        :param restore: a function that loads a knitting pattern set from
+          the :mod:`binary format <knittingpattern.binary>` or :obj:`None`
+          to use a :func:`binary loader
+          <knittingpattern.ParsingSpecification.new_binary_knitting_pattern_set_loader>`
+          with the :paramref:`specification`
+        :param specification: the :class:`specification
+          <knittingpattern.ParsingSpecification.ParsingSpecification>` of
+          the loader that uses the cache or :obj:`None` for the
+          :class:`~knittingpattern.ParsingSpecification.DefaultSpecification`
+        :raises TypeError: if a value of the :paramref:`specification` is
+          not a class or function with a qualified name, as
+          :func:`functools.partial` objects
+        """
+        from .ParsingSpecification import DefaultSpecification, \
+            new_binary_knitting_pattern_set_loader
+        if specification is None:
+            specification = DefaultSpecification()
+        if restore is None:
+            restore = new_binary_knitting_pattern_set_loader(
+                specification).string
+        os.makedirs(folder, exist_ok=True)
+        self._folder = folder
+        self._maximum_size = maximum_size
+        self._restore = restore
+        self._version = "{}-{}".format(_version(),
+                                       _specification_key(specification))
+        self._size = None
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def folder(self):
+        """The folder of the files in the cache.
+
+        :rtype: str
+        """
+        return self._folder
+
+    @property
+    def maximum_size(self):
+        """The maximum size of the files in the cache in bytes.
+
+        :rtype: int
+        """
+        return self._maximum_size
+
+    @property
+    def hits(self):
+        """The number of contents that were loaded from the cache.
+
+        :rtype: int
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """The number of contents that were not found in the cache.
+
+        :rtype: int
+        """
+        return self._misses
+
+    def key(self, content):
+        """The key of a content in the cache.
+
+        :param str content: the content to parse
+        :return: a hash of the :paramref:`content`, the version of this
+          library and the specification
+        :rtype: str
+        """
+        hash_ = hashlib.sha256(self._version.encode("UTF-8"))
+        hash_.update(b"\0")
+        hash_.update(content.encode("UTF-8"))
+        return hash_.hexdigest()
+
+    def _path(self, key):
+        """:return: the path of the file for the :paramref:`key`"""
+        return os.path.join(self._folder, key + EXTENSION)
+
+    def load(self, content, parse):
+        """Load a knitting pattern set from the cache or parse it.
+
+        :param str content: the content to parse
+        :param parse: a function that parses the content, i.e.
+          ``parse(content)`` returns a knitting pattern set
+        :return: the knitting pattern set parsed from the content
+        :rtype: knittingpattern.KnittingPatternSet.KnittingPatternSet
+
+        If the result is not in the cache, the content is parsed and the
+        result is saved.
+        Broken files in the cache are replaced.
+        If the result can not be saved, i.e. the disk is full, it is returned
+        anyway.
+        """
+        path = self._path(self.key(content))
+        try:
+            with open(path, "rb") as file:
+                bytes_ = file.read()
+            os.utime(path)
+            result = self._restore(bytes_)
+        except (OSError, ValueError):
+            pass
+        else:
+            self._hits += 1
+            return result
+        self._misses += 1
+        result = parse(content)
+        try:
+            bytes_ = result.to_binary().bytes()
+        except ValueError:
+            return result
+        try:
+            self._save(path, bytes_)
+        except OSError:
+            pass
+        return result
+
+    def _save(self, path, bytes_):
+        """Save the bytes in the cache and remove old files if needed."""
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            suffix=".tmp", dir=self._folder)
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(bytes_)
+            os.replace(temporary_path, path)
+        except OSError:
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
+            raise
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += len(bytes_)
+        if self._size > self._maximum_size:
+            self._remove_least_recently_used()
+
+    def _files(self):
+        """:return: a list of tuples ``(modification_time, size, path)`` of
+          the files in the cache
+        :rtype: list
+        """
+        files = []
+        for entry in os.scandir(self._folder):
+            if entry.name.endswith(EXTENSION):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        return files
+
+    def _remove_least_recently_used(self):
+        """Remove files until the cache is not larger than its maximum."""
+        files = sorted(self._files())
+        size = sum(size for _, size, _ in files)
+        for _, file_size, path in files:
+            if size <= self._maximum_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= file_size
+        self._size = size
+
+    def size(self):
+        """The size of the files in the cache.
+
+        :return: the size in bytes
+        :rtype: int
+        """
+        return sum(size for _, size, _ in self._files())
+
+    def clear(self):
+        """Remove all files from the cache."""
+        for _, _, path in self._files():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._size = 0
+
+
+__all__ = ["ParseCache", "EXTENSION", "DEFAULT_MAXIMUM_SIZE"]
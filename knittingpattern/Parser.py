@@ -1,4 +1,8 @@
 """In this module you can find the parsing of knitting pattern structures."""
+from threading import Lock
+from weakref import WeakSet
+from .utils import paused_garbage_collection
+
 # attributes
 
 ID = "id"  #: the id of a row, an instruction or a pattern
@@ -46,12 +50,44 @@ class Parser(object):
 
         """
         self._spec = specification
+        self._knitting_pattern_sets = WeakSet()
+        self._lock = Lock()
         self._start()
 
+    def __reduce__(self):
+        """Pickle the parser as its specification.
+
+        The parser is not in the middle of parsing when it can be used from
+        other processes, so a new parser with the same specification is
+        created when it is unpickled.
+        """
+        return self._spec.new_parser, (self._spec,)
+
+    @property
+    def specification(self):
+        """The specification of this parser.
+
+        :return: the specification passed to :meth:`__init__`
+        """
+        return self._spec
+
+    @property
+    def knitting_pattern_sets(self):
+        """The knitting pattern sets created by this parser.
+
+        :return: the knitting pattern sets that are still in use
+        :rtype: list
+
+        The objects in the knitting pattern sets can be located with this,
+        i.e. to pickle them.
+        """
+        return list(self._knitting_pattern_sets)
+
     def _start(self):
         """Initialize the parsing process."""
         self._instruction_library = self._spec.new_default_instructions()
-        self._as_instruction = self._instruction_library.as_instruction
+        self._as_instruction = \
+            self._instruction_library.as_shared_instruction
         self._id_cache = {}
         self._pattern_set = None
         self._inheritance_todos = []
@@ -82,12 +118,82 @@ class Parser(object):
           :paramref:`value` does not fulfill the :ref:`specification
           <FileFormatSpecification>`.
 
+        Only one knitting pattern set is parsed at a time, so the parser can
+        be used from several threads.
         """
-        self._start()
+        with self._lock:
+            self._start()
+            pattern_collection = self._new_pattern_collection()
+            self._fill_pattern_collection(pattern_collection, values)
+            self._create_pattern_set(pattern_collection, values)
+            return self._pattern_set
+
+    def binary_knitting_pattern_set(self, bytes_):
+        """Load a knitting pattern set from the binary format.
+
+        :param bytes bytes_: a knitting pattern set in the binary format of
+          :mod:`knittingpattern.binary`
+        :rtype: knittingpattern.KnittingPatternSet.KnittingPatternSet
+        :raises knittingpattern.KnittingPatternSet.ParsingError: if
+          :paramref:`bytes_` is not in the binary format or broken
+
+        The values of the rows are resolved already, so the rows do not
+        inherit from each other. The specifications of the instructions are
+        shared once and the connections are made range by range.
+        The garbage collection is paused while the objects are created.
+        """
+        from .binary import loads
+        try:
+            type_, version, comment, specifications, patterns, connections = \
+                loads(bytes_)
+        except ValueError as error:
+            self._error(str(error))
+        with self._lock:
+            self._start()
+            with paused_garbage_collection():
+                try:
+                    pattern_collection = self._binary_patterns(
+                        specifications, patterns, connections)
+                except (TypeError, AttributeError) as error:
+                    self._error("The binary format is broken: {}"
+                                "".format(error))
+            self._pattern_set = self._spec.new_pattern_set(
+                type_, version, pattern_collection, self, comment)
+            self._knitting_pattern_sets.add(self._pattern_set)
+            return self._pattern_set
+
+    def _binary_patterns(self, specifications, patterns, connections):
+        """Create the patterns loaded from the binary format.
+
+        :return: a pattern collection
+        """
+        instructions = list(map(self._as_instruction, specifications))
+        new_instruction_in_row = self._spec.new_instruction_in_row
+        all_rows = []
         pattern_collection = self._new_pattern_collection()
-        self._fill_pattern_collection(pattern_collection, values)
-        self._create_pattern_set(pattern_collection, values)
-        return self._pattern_set
+        for id_, name, rows_to_load in patterns:
+            rows = self.new_row_collection()
+            for row_id, values, codes in rows_to_load:
+                if codes and max(codes) >= len(instructions):
+                    self._error("The row {} has instructions that are not "
+                                "in the binary format.".format(row_id))
+                row = self._spec.new_row(row_id, values, self)
+                row.extend_instructions([
+                    new_instruction_in_row(row, instructions[code])
+                    for code in codes])
+                rows.append(row)
+                all_rows.append(row)
+            pattern_collection.append(self.new_pattern(id_, name, rows))
+        for from_row, from_start, to_row, to_start, count in connections:
+            if from_row >= len(all_rows) or to_row >= len(all_rows):
+                self._error("A connection has rows that are not in the "
+                            "binary format.")
+            try:
+                all_rows[from_row].connect_range(
+                    from_start, all_rows[to_row], to_start, count)
+            except IndexError as error:
+                self._error(str(error))
+        return pattern_collection
 
     def _finish_inheritance(self):
         """Finish those who still need to inherit."""
@@ -109,7 +215,7 @@ class Parser(object):
         while self._instruction_todos:
             row = self._instruction_todos.pop()
             instructions = row.get(INSTRUCTIONS, [])
-            row.instructions.extend(instructions)
+            row.extend_instructions(instructions)
 
     def _delay_instructions(self, row):
         """Add a deleyed inheritance that is ti be resolved later.
@@ -167,6 +273,10 @@ class Parser(object):
         :param row: the row of the instruction
         :param specification: the specification of the instruction
         :return: the instruction in the row
+
+        Instructions with equal specifications share their specification,
+        see :meth:`~knittingpattern.InstructionLibrary.InstructionLibrary.\
+as_shared_instruction`.
         """
         whole_instruction_ = self._as_instruction(specification)
         return self._spec.new_instruction_in_row(row, whole_instruction_)
@@ -215,18 +325,8 @@ class Parser(object):
                          to_row_number_of_possible_meshes)
             # TODO: test all kinds of connections
             number_of_meshes = connection.get(MESHES, meshes)
-            from_row_stop_index = from_row_start_index + number_of_meshes
-            to_row_stop_index = to_row_start_index + number_of_meshes
-            assert 0 <= from_row_start_index <= from_row_stop_index
-            produced_meshes = from_row.produced_meshes[
-                from_row_start_index:from_row_stop_index]
-            assert 0 <= to_row_start_index <= to_row_stop_index
-            consumed_meshes = to_row.consumed_meshes[
-                to_row_start_index:to_row_stop_index]
-            assert len(produced_meshes) == len(consumed_meshes)
-            mesh_pairs = zip(produced_meshes, consumed_meshes)
-            for produced_mesh, consumed_mesh in mesh_pairs:
-                produced_mesh.connect_to(consumed_mesh)
+            from_row.connect_range(from_row_start_index, to_row,
+                                   to_row_start_index, number_of_meshes)
 
     def _get_type(self, values):
         """:return: the type of a knitting pattern set."""
@@ -252,6 +352,7 @@ class Parser(object):
         self._pattern_set = self._spec.new_pattern_set(
             type_, version, pattern, self, comment
         )
+        self._knitting_pattern_sets.add(self._pattern_set)
 
 
 def default_parser():
@@ -23,7 +23,7 @@ These functions should do the same:
     kp = new_knitting_pattern_set_loader().file("my_pattern")
 
 """
-from .Loader import JSONLoader
+from .Loader import JSONLoader, BinaryLoader
 from .Parser import Parser, ParsingError
 from .KnittingPatternSet import KnittingPatternSet
 from .IdCollection import IdCollection
@@ -52,7 +52,8 @@ class ParsingSpecification(object):
                  new_pattern=KnittingPattern,
                  new_row=Row,
                  new_default_instructions=DefaultInstructions,
-                 new_instruction_in_row=InstructionInRow):
+                 new_instruction_in_row=InstructionInRow,
+                 new_binary_loader=BinaryLoader):
         """Create a new parsing specification."""
         self.new_loader = new_loader
         self.new_parser = new_parser
@@ -64,6 +65,7 @@ class ParsingSpecification(object):
         self.new_row = new_row
         self.new_default_instructions = new_default_instructions
         self.new_instruction_in_row = new_instruction_in_row
+        self.new_binary_loader = new_binary_loader
 
 
 class DefaultSpecification(ParsingSpecification):
@@ -88,18 +90,43 @@ class DefaultSpecification(ParsingSpecification):
         return "<{}.{}>".format(cls.__module__, cls.__qualname__)
 
 
-def new_knitting_pattern_set_loader(specification=DefaultSpecification()):
+def new_knitting_pattern_set_loader(specification=DefaultSpecification(),
+                                    cache=None):
     """Create a loader for a knitting pattern set.
 
     :param specification: a :class:`specification
       <knittingpattern.ParsingSpecification.ParsingSpecification>`
       for the knitting pattern set, default
       :class:`DefaultSpecification`
+    :param cache: :obj:`None` or a
+      :class:`~knittingpattern.ParseCache.ParseCache` to load the parsed
+      contents from
     """
     parser = specification.new_parser(specification)
-    loader = specification.new_loader(parser.knitting_pattern_set)
+    if cache is None:
+        loader = specification.new_loader(parser.knitting_pattern_set)
+    else:
+        loader = specification.new_loader(parser.knitting_pattern_set,
+                                          cache=cache)
+    return loader
+
+
+def new_binary_knitting_pattern_set_loader(
+        specification=DefaultSpecification()):
+    """Create a loader for a knitting pattern set in the binary format.
+
+    :param specification: a :class:`specification
+      <knittingpattern.ParsingSpecification.ParsingSpecification>`
+      for the knitting pattern set, default
+      :class:`DefaultSpecification`
+
+    .. seealso:: :mod:`knittingpattern.binary`
+    """
+    parser = specification.new_parser(specification)
+    loader = specification.new_binary_loader(
+        parser.binary_knitting_pattern_set)
     return loader
 
 
 __all__ = ["ParsingSpecification", "new_knitting_pattern_set_loader",
-           "DefaultSpecification"]
+           "new_binary_knitting_pattern_set_loader", "DefaultSpecification"]
@@ -2,6 +2,15 @@
 that can be used to create inheritance on object level instead of class level.
 """
 
+#: This number changes whenever a prototype changes what it inherits from.
+#: Prototypes compare it to the number of their cache.
+#: If it changed, they check whether they or the prototypes they inherit
+#: from changed after their cache was filled.
+_generation = 0
+
+#: the cached value of keys that are not in the specification
+_MISSING = object()
+
 
 class Prototype(object):
     """This class provides inheritance of its specifications on object level.
@@ -11,8 +20,18 @@ class Prototype(object):
     Throughout this class `specification key` refers to a
     :func:`hashable <hash>` object
     to look up a value in the specification.
+
+    .. _prototype-cache:
+
+    The values found for keys are cached. The cache of a prototype is
+    dropped when :meth:`inherit_from` is called on it or on a prototype it
+    inherits from. The specifications themselves should not change after
+    they are passed to the prototype.
     """
 
+    __slots__ = ("__specification", "__unfrozen_specification", "__cache",
+                 "__cache_generation", "__generation")
+
     def __init__(self, specification, inherited_values=()):
         """create a new prototype
 
@@ -32,17 +51,60 @@ class Prototype(object):
 
         """
         self.__specification = [specification] + list(inherited_values)
+        self.__unfrozen_specification = None
+        self.__cache = None
+        self.__cache_generation = _generation
+        self.__generation = 0
 
     def get(self, key, default=None):
         """
         :return: the value behind :paramref:`key` in the specification.
           If no value was found, :paramref:`default` is returned.
         :param key: a :ref:`specification key <prototype-key>`
+
+        A prototype with only one specification looks the key up in it.
+        Otherwise, the value is :ref:`cached <prototype-cache>`.
+        """
+        specification = self.__specification
+        if len(specification) == 1:
+            base = specification[0]
+            if isinstance(base, Prototype):
+                return base.get(key, default)
+            return base[key] if key in base else default
+        cache = self.__cache
+        if cache is None or self.__cache_generation != _generation:
+            if cache is None or self._changed_since(self.__cache_generation):
+                cache = self.__cache = {}
+            self.__cache_generation = _generation
+        try:
+            value = cache[key]
+        except KeyError:
+            value = cache[key] = self.__look_up(key)
+        return default if value is _MISSING else value
+
+    def _changed_since(self, generation):
+        """Whether this prototype or one it inherits from changed.
+
+        :param int generation: the value of :data:`_generation` to compare to
+        :return: whether :meth:`inherit_from` was called after
+          :paramref:`generation` on this prototype or on a prototype it
+          inherits from
+        :rtype: bool
         """
+        if self.__generation > generation:
+            return True
+        for base in self.__specification:
+            if isinstance(base, Prototype) and base._changed_since(generation):
+                return True
+        return False
+
+    def __look_up(self, key):
+        """:return: the value behind :paramref:`key` in the specification or
+          :data:`_MISSING`"""
         for base in self.__specification:
             if key in base:
                 return base[key]
-        return default
+        return _MISSING
 
     def __getitem__(self, key):
         """``prototype[key]``
@@ -91,7 +153,74 @@ class Prototype(object):
         3. :paramref:`~__init__.inherited_values`
 
         """
+        global _generation
+        if self.__unfrozen_specification is not None:
+            self.__specification = self.__unfrozen_specification
+            self.__unfrozen_specification = None
         self.__specification.insert(1, new_specification)
+        _generation += 1
+        self.__generation = _generation
+
+    def freeze(self):
+        """Flatten the specifications into one :class:`dict`.
+
+        Call this when the prototype and what it inherits from do not change
+        any more, i.e. after parsing. Then, a key is looked up in one
+        :class:`dict`.
+        Specifications that can not list their keys and those inherited after
+        them stay as they are.
+        Changes to the prototypes inherited from are not visible until
+        :meth:`inherit_from` is called. This restores the specifications
+        that were flattened.
+        """
+        if self.__unfrozen_specification is not None:
+            return
+        specification = self.__specification
+        flat, number_of_flat_bases = self._flatten()
+        if number_of_flat_bases < 2:
+            return
+        self.__unfrozen_specification = specification
+        self.__specification = [flat] + specification[number_of_flat_bases:]
+
+    def _own_specification(self):
+        """The specification without the values that are inherited.
+
+        :return: the :paramref:`~__init__.specification` passed to
+          :meth:`__init__`. If it is a prototype, its own specification is
+          returned.
+        """
+        specification = self.__unfrozen_specification
+        if specification is None:
+            specification = self.__specification
+        own_specification = specification[0]
+        if isinstance(own_specification, Prototype):
+            return own_specification._own_specification()
+        return own_specification
+
+    def _flatten(self):
+        """Collect the values of the specifications.
+
+        :return: a tuple ``(values, number_of_bases)`` with the
+          :class:`dict` of the values in the first ``number_of_bases``
+          specifications. They are the ones before the first specification
+          that can not list its keys.
+        """
+        flat = {}
+        number_of_flat_bases = 0
+        for base in self.__specification:
+            if isinstance(base, Prototype):
+                values, number_of_bases = base._flatten()
+                if number_of_bases != len(base.__specification):
+                    break
+            elif hasattr(base, "keys"):
+                values = base
+            else:
+                break
+            for key in values.keys():
+                if key not in flat:
+                    flat[key] = values[key]
+            number_of_flat_bases += 1
+        return flat, number_of_flat_bases
 
 
 __all__ = ["Prototype"]
@@ -7,8 +7,11 @@ They contain :class:`instructions
 rows.
 """
 from .Prototype import Prototype
+from pickle import PicklingError
+from bisect import bisect_right
 from itertools import chain
-from ObservableList import ObservableList
+from collections import OrderedDict
+from ObservableList import ObservableList, AddChange
 from .utils import unique
 
 COLOR = "color"  #: the color of the row
@@ -25,6 +28,10 @@ class Row(Prototype):
     <knittingpattern.KnittingPattern.KnittingPattern>`.
     """
 
+    __slots__ = ("_id", "_instructions", "_parser", "_version",
+                 "_mesh_index_table", "_produced_meshes", "_consumed_meshes",
+                 "_rows_before", "_rows_after")
+
     def __init__(self, row_id, values, parser):
         """Create a new row.
 
@@ -42,9 +49,25 @@ class Row(Prototype):
         self._instructions = ObservableList()
         self._instructions.register_observer(self._instructions_changed)
         self._parser = parser
+        self._version = 0
+        self._invalidate_caches()
+
+    def _invalidate_caches(self):
+        """Remove the values computed from the instructions."""
+        self._mesh_index_table = None
+        self._produced_meshes = None
+        self._consumed_meshes = None
+        self._connections_changed()
+
+    def _connections_changed(self):
+        """Call when a mesh of this row is connected or disconnected."""
+        self._rows_before = None
+        self._rows_after = None
 
     def _instructions_changed(self, change):
         """Call when there is a change in the instructions."""
+        self._version += 1
+        self._invalidate_caches()
         if change.adds():
             for index, instruction in change.items():
                 if isinstance(instruction, dict):
@@ -52,6 +75,68 @@ class Row(Prototype):
                     self.instructions[index] = in_row
                 else:
                     instruction.transfer_to_row(self)
+                    self._connected_rows_changed(instruction)
+        else:
+            for instruction in change.elements:
+                if not isinstance(instruction, dict):
+                    self._connected_rows_changed(instruction)
+
+    @staticmethod
+    def _connected_rows_changed(instruction):
+        """Notify the rows connected to an instruction that moves."""
+        for connections in (instruction._consumed_connections,
+                            instruction._produced_connections):
+            if connections is None:
+                continue
+            for connected_instruction in connections[::2]:
+                if connected_instruction is not None:
+                    connected_instruction.row._connections_changed()
+
+    def extend_instructions(self, instructions):
+        """Add instructions to the end of the row at once.
+
+        :param instructions: an iterable of :class:`dicts <dict>` with the
+          specifications of new instructions or :class:`instructions
+          <knittingpattern.Instruction.InstructionInRow>` to move here
+
+        This has the same result as ``row.instructions.extend(instructions)``.
+        However, the specifications are converted to instructions before
+        they are added and the observers of the :attr:`instructions` are
+        notified once about the addition instead of once for each
+        specification.
+        """
+        instruction_in_row = self._parser.instruction_in_row
+        new_instructions = [
+            (instruction_in_row(self, instruction)
+             if isinstance(instruction, dict) else instruction)
+            for instruction in instructions]
+        if not new_instructions:
+            return
+        start = len(self._instructions)
+        list.extend(self._instructions, new_instructions)
+        self._instructions.notify_observers(AddChange(
+            self._instructions, slice(start, start + len(new_instructions))))
+
+    def __reduce__(self):
+        """Pickle the row as its position in its knitting pattern.
+
+        :raises pickle.PicklingError: if the row is not in a knitting pattern
+          set of its parser
+
+        .. seealso:: :meth:`KnittingPatternSet.__reduce__()
+          <knittingpattern.KnittingPatternSet.KnittingPatternSet.__reduce__>`
+        """
+        for knitting_pattern_set in self._parser.knitting_pattern_sets:
+            for pattern in knitting_pattern_set.patterns:
+                rows = pattern.rows
+                try:
+                    index = rows.index_of(self.id)
+                except KeyError:
+                    continue
+                if rows.at(index) is self:
+                    return _row_at, (pattern, index)
+        raise PicklingError("{} is not in a knitting pattern set."
+                            "".format(self))
 
     @property
     def id(self):
@@ -61,6 +146,26 @@ class Row(Prototype):
         """
         return self._id
 
+    @property
+    def version(self):
+        """The version of this row.
+
+        :return: the number of changes to the :attr:`instructions`
+        :rtype: int
+
+        You can use the version to find out if values computed from this row
+        are outdated.
+
+        .. code:: python
+
+            version = row.version
+            meshes = row.produced_meshes
+            # ...
+            if version != row.version:
+                meshes = row.produced_meshes
+        """
+        return self._version
+
     @property
     def instructions(self):
         """The instructions in this row.
@@ -83,8 +188,7 @@ class Row(Prototype):
           <knittingpattern.Instruction.Instruction.number_of_produced_meshes>`,
           :meth:`number_of_consumed_meshes`
         """
-        return sum(instruction.number_of_produced_meshes
-                   for instruction in self.instructions)
+        return self._get_mesh_index_table()[0][-1]
 
     @property
     def number_of_consumed_meshes(self):
@@ -98,8 +202,33 @@ class Row(Prototype):
           <knittingpattern.Instruction.Instruction.number_of_consumed_meshes>`,
           :meth:`number_of_produced_meshes`
         """
-        return sum(instruction.number_of_consumed_meshes
-                   for instruction in self.instructions)
+        return self._get_mesh_index_table()[1][-1]
+
+    def _get_mesh_index_table(self):
+        """The indices of the first meshes of the instructions in this row.
+
+        :return: a tuple ``(produced, consumed)`` of two lists. ``produced[i]``
+          is the index of the first mesh that the instruction at index ``i``
+          produces in this row. The last element of ``produced`` is the
+          :attr:`number_of_produced_meshes`. ``consumed`` is the same for the
+          consumed meshes.
+        :rtype: tuple
+
+        The table is computed when it is needed and kept until the
+        :attr:`instructions` change.
+        This also updates the index of the instructions in this row.
+        """
+        if self._mesh_index_table is None:
+            produced = [0]
+            consumed = [0]
+            for index, instruction in enumerate(self.instructions):
+                instruction._cached_index_in_row = index
+                produced.append(
+                    produced[-1] + instruction.number_of_produced_meshes)
+                consumed.append(
+                    consumed[-1] + instruction.number_of_consumed_meshes)
+            self._mesh_index_table = produced, consumed
+        return self._mesh_index_table
 
     @property
     def produced_meshes(self):
@@ -107,16 +236,130 @@ class Row(Prototype):
 
         :return: a collection of :class:`meshes <knittingpattern.Mesh.Mesh>`
           that this instruction produces
+        :rtype: tuple
 
+        The meshes are computed once and kept until the :attr:`instructions`
+        change, see :attr:`version`.
         """
-        return list(chain(*(instruction.produced_meshes
-                            for instruction in self.instructions)))
+        if self._produced_meshes is None:
+            self._produced_meshes = tuple(chain.from_iterable(
+                instruction.produced_meshes
+                for instruction in self.instructions))
+        return self._produced_meshes
 
     @property
     def consumed_meshes(self):
         """Same as :attr:`produced_meshes` but for consumed meshes."""
-        return list(chain(*(instruction.consumed_meshes
-                            for instruction in self.instructions)))
+        if self._consumed_meshes is None:
+            self._consumed_meshes = tuple(chain.from_iterable(
+                instruction.consumed_meshes
+                for instruction in self.instructions))
+        return self._consumed_meshes
+
+    def connect_range(self, start, to_row, to_start, count):
+        """Connect produced meshes of this row to consumed meshes of a row.
+
+        :param int start: the index of the first produced mesh in this row
+        :param knittingpattern.Row.Row to_row: the row that consumes the
+          meshes
+        :param int to_start: the index of the first consumed mesh in
+          :paramref:`to_row`
+        :param int count: the number of meshes to connect
+        :raises IndexError: if the meshes are not in the rows
+
+        The produced mesh at ``start + i`` is connected to the consumed
+        mesh at ``to_start + i`` for ``i`` in ``range(count)``.
+        Meshes that are connected already are disconnected before, as in
+        :meth:`~knittingpattern.Mesh.Mesh.connect_to`.
+        """
+        produced, _ = self._get_mesh_index_table()
+        _, consumed = to_row._get_mesh_index_table()
+        if count < 0 or start < 0 or start + count > produced[-1]:
+            raise IndexError("{} does not produce the meshes {} to {}."
+                             "".format(self, start, start + count))
+        if to_start < 0 or to_start + count > consumed[-1]:
+            raise IndexError("{} does not consume the meshes {} to {}."
+                             "".format(to_row, to_start, to_start + count))
+        instructions = self.instructions
+        to_instructions = to_row.instructions
+        mesh_pairs = zip(
+            self._mesh_positions(produced, start, count),
+            self._mesh_positions(consumed, to_start, count))
+        for (index, mesh_index), (to_index, to_mesh_index) in mesh_pairs:
+            instruction = instructions[index]
+            to_instruction = to_instructions[to_index]
+            connections = instruction._produced_connections
+            if connections is not None and \
+                    connections[2 * mesh_index] is not None:
+                connections[2 * mesh_index].row._connections_changed()
+                instruction._disconnect_produced_mesh(mesh_index)
+            connections = to_instruction._consumed_connections
+            if connections is not None and \
+                    connections[2 * to_mesh_index] is not None:
+                producing_instruction = connections[2 * to_mesh_index]
+                producing_instruction.row._connections_changed()
+                producing_instruction._disconnect_produced_mesh(
+                    connections[2 * to_mesh_index + 1])
+            instruction._connect_produced_mesh(mesh_index, to_instruction,
+                                               to_mesh_index)
+        self._connections_changed()
+        to_row._connections_changed()
+
+    def connection_ranges(self):
+        """The connections of the produced meshes of this row as ranges.
+
+        :return: a list of tuples ``(start, to_row, to_start, count)`` as the
+          arguments of :meth:`connect_range`
+        :rtype: list
+
+        Adjacent meshes of this row that are consumed by adjacent meshes of
+        the same row are in one range. The ranges are sorted by ``start``.
+        Meshes consumed by instructions that were removed from their row are
+        left out.
+        """
+        produced, _ = self._get_mesh_index_table()
+        ranges = []
+        last_range = None
+        for index, instruction in enumerate(self.instructions):
+            connections = instruction._produced_connections
+            if connections is None:
+                continue
+            for mesh_index in range(len(connections) // 2):
+                consuming_instruction = connections[2 * mesh_index]
+                if consuming_instruction is None:
+                    continue
+                to_index = consuming_instruction.get_index_in_row()
+                if to_index is None:
+                    continue
+                to_row = consuming_instruction.row
+                _, consumed = to_row._get_mesh_index_table()
+                start = produced[index] + mesh_index
+                to_start = consumed[to_index] + \
+                    connections[2 * mesh_index + 1]
+                if last_range is not None and last_range[1] is to_row and \
+                        last_range[0] + last_range[3] == start and \
+                        last_range[2] + last_range[3] == to_start:
+                    last_range[3] += 1
+                else:
+                    last_range = [start, to_row, to_start, 1]
+                    ranges.append(last_range)
+        return list(map(tuple, ranges))
+
+    @staticmethod
+    def _mesh_positions(mesh_index_table, start, count):
+        """The positions of meshes in the instructions.
+
+        :param list mesh_index_table: the first meshes of the instructions,
+          see :meth:`_get_mesh_index_table`
+        :return: an iterator over tuples ``(index, mesh_index)`` of the
+          instruction index and the index of the mesh in the instruction for
+          the meshes from :paramref:`start` on
+        """
+        index = bisect_right(mesh_index_table, start) - 1
+        for mesh in range(start, start + count):
+            while mesh_index_table[index + 1] <= mesh:
+                index += 1
+            yield index, mesh - mesh_index_table[index]
 
     def __repr__(self):
         """The string representation of this row.
@@ -212,14 +455,17 @@ class Row(Prototype):
         :return: a list of rows that produce meshes for this row. Each row
           occurs only once. They are sorted by the first occurrence in the
           instructions.
+
+        The rows are computed once and kept until the meshes of this row are
+        connected or disconnected.
         """
-        rows_before = []
-        for mesh in self.consumed_meshes:
-            if mesh.is_produced():
-                row = mesh.producing_row
-                if rows_before not in rows_before:
-                    rows_before.append(row)
-        return rows_before
+        if self._rows_before is None:
+            self._rows_before = self._unique_rows(
+                instruction.row for instruction in chain.from_iterable(
+                    instruction.producing_instructions
+                    for instruction in self.instructions)
+                if instruction is not None)
+        return list(self._rows_before)
 
     @property
     def rows_after(self):
@@ -229,14 +475,24 @@ class Row(Prototype):
         :return: a list of rows that consume meshes from this row. Each row
           occurs only once. They are sorted by the first occurrence in the
           instructions.
+
+        The rows are computed once and kept until the meshes of this row are
+        connected or disconnected.
+        """
+        if self._rows_after is None:
+            self._rows_after = self._unique_rows(
+                instruction.row for instruction in chain.from_iterable(
+                    instruction.consuming_instructions
+                    for instruction in self.instructions)
+                if instruction is not None)
+        return list(self._rows_after)
+
+    @staticmethod
+    def _unique_rows(rows):
+        """:return: the rows without duplicates in the order they occur in
+        :rtype: tuple
         """
-        rows_after = []
-        for mesh in self.produced_meshes:
-            if mesh.is_consumed():
-                row = mesh.consuming_row
-                if rows_after not in rows_after:
-                    rows_after.append(row)
-        return rows_after
+        return tuple(OrderedDict.fromkeys(rows))
 
     @property
     def first_instruction(self):
@@ -256,4 +512,10 @@ class Row(Prototype):
         """
         return self.instructions[-1]
 
+
+def _row_at(pattern, index):
+    """Unpickle a row, see :meth:`Row.__reduce__`."""
+    return pattern.rows.at(index)
+
+
 __all__ = ["Row", "COLOR"]
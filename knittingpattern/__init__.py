@@ -13,9 +13,12 @@ EMPTY_KNITTING_PATTERN_SET = {"version": "0.1", "type": "knitting pattern",
                               "patterns": []}
 
 
-def load_from():
+def load_from(cache=None):
     """Create a loader to load knitting patterns with.
 
+    :param cache: :obj:`None` or a
+      :class:`~knittingpattern.ParseCache.ParseCache` to save the parsed
+      knitting pattern sets in
     :return: the loader to load objects with
     :rtype: knittingpattern.Loader.JSONLoader
 
@@ -29,7 +32,28 @@ def load_from():
 
     """
     from .ParsingSpecification import new_knitting_pattern_set_loader
-    return new_knitting_pattern_set_loader()
+    return new_knitting_pattern_set_loader(cache=cache)
+
+
+def load_binary_from():
+    """Create a loader to load knitting patterns in the binary format with.
+
+    :return: the loader to load bytes with
+    :rtype: knittingpattern.Loader.BinaryLoader
+
+    Example:
+
+    .. code:: python
+
+       import knittingpattern
+       k = knittingpattern.load_from().example("Cafe.json")
+       k.to_binary().path("Cafe.kpb")
+       k = knittingpattern.load_binary_from().path("Cafe.kpb")
+
+    .. seealso:: :mod:`knittingpattern.binary`
+    """
+    from .ParsingSpecification import new_binary_knitting_pattern_set_loader
+    return new_binary_knitting_pattern_set_loader()
 
 
 def load_from_object(object_):
@@ -130,5 +154,6 @@ def new_knitting_pattern_set():
 
 __all__ = ["load_from_object", "load_from_string", "load_from_file",
            "load_from_path", "load_from_url", "load_from_relative_file",
-           "convert_from_image", "load_from", "new_knitting_pattern",
+           "convert_from_image", "load_from", "load_binary_from",
+           "new_knitting_pattern",
            "new_knitting_pattern_set"]
@@ -0,0 +1,197 @@
+"""A compact binary format for parsed knitting pattern sets.
+
+Loading a knitting pattern set from JSON decodes the JSON, shares the
+instructions, resolves the inheritance of the rows and connects the rows.
+The binary format stores the result of this so that loading it only creates
+the objects.
+
+.. code:: python
+
+    import knittingpattern
+    knitting_pattern_set = knittingpattern.load_from_path("pattern.json")
+    knitting_pattern_set.to_binary().path("pattern.kpb")
+    knitting_pattern_set = knittingpattern.load_binary_from().path(
+        "pattern.kpb")
+
+The format consists of
+
+1. :data:`MAGIC`, the :data:`FORMAT_VERSION` and the byte order of the
+   numbers as one byte each and
+2. a :mod:`marshal` dump of the content.
+
+The content stores
+
+- each distinct specification of the instructions once,
+- the ids, names, and the resolved values of the rows, without the
+  instructions,
+- the instructions of each row as an :class:`array <array.array>` of indices
+  into the specifications,
+- the connections as an :class:`array <array.array>` of ranges of meshes
+  ``(from_row, from_start, to_row, to_start, count)``. The rows are counted
+  through all patterns.
+
+The values in the format are not checked when they are loaded, so you should
+only load files from sources you trust.
+"""
+import marshal
+import sys
+from array import array
+from .InstructionLibrary import _hashable
+from .Parser import INSTRUCTIONS
+
+#: the first bytes of the binary format
+MAGIC = b"KPSB"
+
+#: the version of the binary format, increase it when the format changes
+FORMAT_VERSION = 1
+
+#: the version of the :mod:`marshal` format to dump the content with
+MARSHAL_VERSION = 4
+
+#: the type codes of the arrays of numbers from the smallest to the largest
+_TYPE_CODES = "BHIQ"
+
+#: the byte orders of the numbers, their position is stored in the header
+_BYTE_ORDERS = ("little", "big")
+
+
+def _to_array(numbers):
+    """Convert a list of numbers to the smallest array they fit in.
+
+    :param list numbers: numbers that are not negative
+    :return: a tuple ``(type_code, bytes)``
+    """
+    maximum = max(numbers, default=0)
+    for type_code in _TYPE_CODES:
+        if maximum < 256 ** array(type_code).itemsize:
+            break
+    return type_code, array(type_code, numbers).tobytes()
+
+
+def _from_array(type_code, bytes_, byte_order):
+    """:return: the array of numbers dumped with :func:`_to_array`
+    :rtype: array.array
+    """
+    numbers = array(type_code)
+    numbers.frombytes(bytes_)
+    if byte_order != sys.byteorder:
+        numbers.byteswap()
+    return numbers
+
+
+def _connection_ranges(rows):
+    """The connections of the rows as ranges of meshes.
+
+    :param list rows: the rows of a knitting pattern set
+    :return: a list of numbers ``from_row, from_start, to_row, to_start,
+      count`` for each range of connected meshes. ``from_row`` and
+      ``to_row`` are indices in :paramref:`rows`.
+    :raises ValueError: if a row is connected to a row that is not in
+      :paramref:`rows`
+
+    .. seealso:: :meth:`knittingpattern.Row.Row.connection_ranges`
+    """
+    row_index = {row: index for index, row in enumerate(rows)}
+    numbers = []
+    for from_row, row in enumerate(rows):
+        for from_start, consuming_row, to_start, count in \
+                row.connection_ranges():
+            to_row = row_index.get(consuming_row)
+            if to_row is None:
+                raise ValueError("{} is connected to {} which is not in "
+                                 "the knitting pattern set."
+                                 "".format(row, consuming_row))
+            numbers.extend((from_row, from_start, to_row, to_start, count))
+    return numbers
+
+
+def dumps(knitting_pattern_set):
+    """Convert a knitting pattern set to the binary format.
+
+    :param knitting_pattern_set: the
+      :class:`~knittingpattern.KnittingPatternSet.KnittingPatternSet` to
+      convert
+    :return: the knitting pattern set in the binary format
+    :rtype: bytes
+    :raises ValueError: if a value can not be stored, i.e. it is no JSON
+      value, or a row is connected to a row outside of the set
+
+    .. seealso:: :meth:`Parser.binary_knitting_pattern_set()
+      <knittingpattern.Parser.Parser.binary_knitting_pattern_set>` to load
+      the result
+    """
+    specifications = []
+    specification_index = {}
+    all_rows = []
+    patterns = []
+    for pattern in knitting_pattern_set.patterns:
+        rows = []
+        for row in pattern.rows:
+            codes = []
+            for instruction in row.instructions:
+                specification = instruction._own_specification()
+                try:
+                    key = _hashable(specification)
+                except TypeError:
+                    key = id(specification)
+                code = specification_index.get(key)
+                if code is None:
+                    code = specification_index[key] = len(specifications)
+                    specifications.append(dict(specification))
+                codes.append(code)
+            values, _ = row._flatten()
+            values.pop(INSTRUCTIONS, None)
+            rows.append((row.id, values) + _to_array(codes))
+            all_rows.append(row)
+        patterns.append((pattern.id, pattern.name, rows))
+    content = (knitting_pattern_set.type, knitting_pattern_set.version,
+               knitting_pattern_set.comment, specifications, patterns,
+               _to_array(_connection_ranges(all_rows)))
+    header = MAGIC + bytes([FORMAT_VERSION,
+                            _BYTE_ORDERS.index(sys.byteorder)])
+    return header + marshal.dumps(content, MARSHAL_VERSION)
+
+
+def loads(bytes_):
+    """Read the content of the binary format.
+
+    :param bytes bytes_: the result of :func:`dumps`
+    :return: a tuple ``(type, version, comment, specifications, patterns,
+      connections)``. ``patterns`` is a list of tuples ``(id, name, rows)``
+      and ``rows`` a list of tuples ``(id, values, codes)`` where ``codes``
+      are the indices of the instructions in ``specifications``.
+      ``connections`` is an iterator over the ranges of connected meshes,
+      see :func:`dumps`.
+    :rtype: tuple
+    :raises ValueError: if :paramref:`bytes_` is not in the binary format
+    """
+    header_length = len(MAGIC) + 2
+    if len(bytes_) < header_length or bytes_[:len(MAGIC)] != MAGIC:
+        raise ValueError("The content is not in the binary format of "
+                         "knitting pattern sets.")
+    format_version, byte_order = bytes_[len(MAGIC):header_length]
+    if format_version != FORMAT_VERSION:
+        raise ValueError("The binary format has version {} but should have "
+                         "version {}.".format(format_version, FORMAT_VERSION))
+    if byte_order >= len(_BYTE_ORDERS):
+        raise ValueError("The byte order {} is unknown.".format(byte_order))
+    byte_order = _BYTE_ORDERS[byte_order]
+    # marshal raises a MemoryError if a broken length is too large
+    try:
+        content = marshal.loads(bytes_[header_length:])
+        type_, version, comment, specifications, patterns, connections = \
+            content
+        patterns = [
+            (id_, name, [(row_id, values, _from_array(type_code, codes,
+                                                      byte_order))
+                         for row_id, values, type_code, codes in rows])
+            for id_, name, rows in patterns]
+        type_code, bytes_ = connections
+        connections = _from_array(type_code, bytes_, byte_order)
+    except (EOFError, TypeError, ValueError, MemoryError) as error:
+        raise ValueError("The binary format is broken: {}".format(error))
+    return (type_, version, comment, specifications, patterns,
+            zip(*[iter(connections)] * 5))
+
+
+__all__ = ["dumps", "loads", "MAGIC", "FORMAT_VERSION", "MARSHAL_VERSION"]
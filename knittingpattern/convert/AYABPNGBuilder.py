@@ -4,9 +4,12 @@ These png files are used to be fed into the ayab-desktop software.
 They only contain which meshes will be knit with a contrast color.
 They just contain colors.
 """
-import webcolors
 import PIL.Image
-from .color import convert_color_to_rrggbb
+from .color import convert_color_to_rrggbb, convert_color_to_rgb
+
+#: the maximum number of colors in an image with a :ref:`palette
+#: <png-palette>`
+MAXIMUM_NUMBER_OF_PALETTE_COLORS = 256
 
 
 class AYABPNGBuilder(object):
@@ -20,10 +23,15 @@ class AYABPNGBuilder(object):
     - a valid html5 color name such as ``"black"``, ``"white"``
     - colors of the form ``"#RGB"``, ``"#RRGGBB"`` and ``"#RRRGGGBBB"``
 
+    .. _png-palette:
+
+    If a palette is given, the image is saved with indexed colors in "P" mode.
+    Each pixel then takes one byte instead of three.
+
     """
 
     def __init__(self, min_x, min_y, max_x, max_y,
-                 default_color="white"):
+                 default_color="white", palette=None):
         """Initialize the builder with the bounding box and a default color.
 
         .. _png-builder-bounds:
@@ -38,14 +46,28 @@ class AYABPNGBuilder(object):
         :param int min_y: the lower bound of the y coordinates
         :param int max_y: the upper bound of the y coordinates
         :param default_color: a valid :ref:`color <png-color>`
+        :param palette: :obj:`None` to save the colors as RGB or a list of
+          :ref:`colors <png-color>` to save the image with a :ref:`palette
+          <png-palette>`. The :paramref:`default_color` is the first color of
+          the palette. Colors that are not in the palette are added when they
+          are used. :obj:`None` in the list is ignored.
         """
         self._min_x = min_x
         self._min_y = min_y
         self._max_x = max_x
         self._max_y = max_y
         self._default_color = default_color
+        if palette is None:
+            self._mode = "RGB"
+            self._palette = None
+        else:
+            self._mode = "P"
+            self._palette = {}
+            for color in [default_color] + list(palette):
+                if color is not None:
+                    self._convert_to_image_color(color)
         self._image = PIL.Image.new(
-            "RGB", (max_x - min_x, max_y - min_y),
+            self._mode, (max_x - min_x, max_y - min_y),
             self._convert_to_image_color(default_color))
 
     def write_to_file(self, file):
@@ -53,8 +75,23 @@ class AYABPNGBuilder(object):
 
         :param file: a file-like object
         """
+        if self._palette is not None:
+            self._image.putpalette(b"".join(map(bytes, self._palette)))
         self._image.save(file, format="PNG")
 
+    @property
+    def palette(self):
+        """The colors of the palette.
+
+        :return: the colors as ``(red, green, blue)`` tuples in the order of
+          the palette or :obj:`None` if the image has no :ref:`palette
+          <png-palette>`
+        :rtype: list
+        """
+        if self._palette is None:
+            return None
+        return list(self._palette)
+
     @staticmethod
     def _convert_color_to_rrggbb(color):
         """takes a :ref:`color <png-color>` and converts it into a 24 bit
@@ -64,8 +101,29 @@ class AYABPNGBuilder(object):
         return convert_color_to_rrggbb(color)
 
     def _convert_rrggbb_to_image_color(self, rrggbb):
-        """:return: the color that is used by the image"""
-        return webcolors.hex_to_rgb(rrggbb)
+        """:return: the color that is used by the image
+
+        This is a ``(red, green, blue)`` tuple or the index in the
+        :attr:`palette`.
+        """
+        rgb = convert_color_to_rgb(rrggbb)
+        if self._palette is None:
+            return rgb
+        index = self._palette.get(rgb)
+        if index is None:
+            index = len(self._palette)
+            if index >= MAXIMUM_NUMBER_OF_PALETTE_COLORS:
+                raise ValueError("The palette can only have {} colors."
+                                 "".format(MAXIMUM_NUMBER_OF_PALETTE_COLORS))
+            self._palette[rgb] = index
+        return index
+
+    def _convert_to_image_bytes(self, color):
+        """:return: the bytes of a pixel with the color in the image"""
+        image_color = self._convert_to_image_color(color)
+        if self._palette is None:
+            return bytes(image_color)
+        return bytes((image_color,))
 
     def _convert_to_image_color(self, color):
         """:return: a color that can be used by the image"""
@@ -138,6 +196,51 @@ class AYABPNGBuilder(object):
             self._set_pixel_and_convert_color(
                 color_in_grid.x, color_in_grid.y, color_in_grid.color)
 
+    def set_colors_in_layout(self, layout):
+        """Set the pixels of all the instructions in a layout.
+
+        :param knittingpattern.convert.Layout.GridLayout layout: the layout to
+          take the instructions from
+
+        This does the same as
+
+        .. code:: python
+
+            builder.set_colors_in_grid(layout.walk_instructions())
+
+        but faster, see :meth:`set_colors_in_columns`.
+        """
+        self.set_colors_in_columns(layout.columns)
+
+    def set_colors_in_columns(self, columns):
+        """Set the pixels of instructions given as columns.
+
+        :param knittingpattern.convert.Layout.LayoutColumns columns: the
+          columns of the instructions, as in :attr:`GridLayout.columns
+          <knittingpattern.convert.Layout.GridLayout.columns>`
+
+        Each color is converted once.
+        The pixels are written to a buffer which is then turned into the
+        image.
+        """
+        pixel_bytes = [(None if color is None else
+                        self._convert_to_image_bytes(color))
+                       for color in columns.colors]
+        size = self._image.size
+        image_width = size[0]
+        pixel_size = 1 if self._palette is not None else 3
+        pixels = bytearray(self._image.tobytes())
+        is_in_bounds = self.is_in_bounds
+        for x, y, color in zip(columns.x, columns.y, columns.color):
+            pixel = pixel_bytes[color]
+            if pixel is None or not is_in_bounds(x, y):
+                continue
+            index = ((int(y) - self._min_y) * image_width +
+                     int(x) - self._min_x) * pixel_size
+            pixels[index:index + pixel_size] = pixel
+        self._image = PIL.Image.frombuffer(self._mode, size, bytes(pixels),
+                                           "raw", self._mode, 0, 1)
+
     @property
     def default_color(self):
         """:return: the :ref:`color <png-color>` of the pixels that are not set
@@ -148,4 +251,4 @@ class AYABPNGBuilder(object):
         return self._default_color
 
 
-__all__ = ["AYABPNGBuilder"]
+__all__ = ["AYABPNGBuilder", "MAXIMUM_NUMBER_OF_PALETTE_COLORS"]
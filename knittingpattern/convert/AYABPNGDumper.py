@@ -10,7 +10,8 @@ from .AYABPNGBuilder import AYABPNGBuilder
 class AYABPNGDumper(ContentDumper):
     """This class converts knitting patterns into PNG files."""
 
-    def __init__(self, function_that_returns_a_knitting_pattern_set):
+    def __init__(self, function_that_returns_a_knitting_pattern_set,
+                 indexed=False):
         """Initialize the Dumper with a
         :paramref:`function_that_returns_a_knitting_pattern_set`.
 
@@ -22,18 +23,28 @@ class AYABPNGDumper(ContentDumper):
         :paramref:`function_that_returns_a_knitting_pattern_set`
         is called and the knitting pattern set is converted and saved to the
         specified location.
+
+        :param bool indexed: whether to save the PNG with a palette of the
+          :attr:`instruction colors
+          <knittingpattern.KnittingPattern.KnittingPattern.instruction_colors>`
+          instead of RGB colors. Indexed images are smaller.
         """
         super().__init__(self._dump_knitting_pattern,
                          text_is_expected=False, encoding=None)
         self.__on_dump = function_that_returns_a_knitting_pattern_set
+        self.__indexed = indexed
 
     def _dump_knitting_pattern(self, file):
         """dump a knitting pattern to a file."""
         knitting_pattern_set = self.__on_dump()
         knitting_pattern = knitting_pattern_set.patterns.at(0)
         layout = GridLayout(knitting_pattern)
-        builder = AYABPNGBuilder(*layout.bounding_box)
-        builder.set_colors_in_grid(layout.walk_instructions())
+        if self.__indexed:
+            palette = knitting_pattern.instruction_colors
+        else:
+            palette = None
+        builder = AYABPNGBuilder(*layout.bounding_box, palette=palette)
+        builder.set_colors_in_layout(layout)
         builder.write_to_file(file)
 
     def temporary_path(self, extension=".png"):
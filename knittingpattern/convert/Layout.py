@@ -2,7 +2,8 @@
 
 """
 from itertools import chain
-from collections import namedtuple
+from collections import namedtuple, deque
+from array import array
 
 
 INSTRUCTION_HEIGHT = 1  #: the default height of an instruction in the grid
@@ -23,11 +24,25 @@ GRID_LAYOUT = "grid-layout"
 WIDTH = "width"
 Point = namedtuple("Point", ["x", "y"])
 
+#: The statistics of the placement of the rows in a :class:`GridLayout`.
+#:
+#: - ``rows_placed`` is the number of rows in the grid
+#: - ``replacements`` is the number of times a row was placed again,
+#:   higher than before
+#: - ``queue_high_water_mark`` is the maximum number of rows that waited to
+#:   be placed
+#:
+#: .. seealso:: :attr:`GridLayout.walk_statistics`
+WalkStatistics = namedtuple("WalkStatistics", ["rows_placed", "replacements",
+                                               "queue_high_water_mark"])
+
 
 class InGrid(object):
 
     """Base class for things in a grid"""
 
+    __slots__ = ("_position",)
+
     def __init__(self, position):
         """Create a new InGrid object."""
         self._position = position
@@ -101,25 +116,29 @@ class InstructionInGrid(InGrid):
 
     """Holder of an instruction in the GridLayout."""
 
-    def __init__(self, instruction, position):
+    __slots__ = ("_instruction", "_width")
+
+    def __init__(self, instruction, position, width=None):
         """
         :param instruction: an :class:`instruction
           <knittingpattern.Instruction.InstructionInRow>`
         :param Point position: the position of the :paramref:`instruction`
+        :param width: the width of the :paramref:`instruction` or :obj:`None`
+          to compute it from the :data:`GRID_LAYOUT` of the instruction
 
         """
-        self._instruction = instruction
         super().__init__(position)
+        self._instruction = instruction
+        self._width = width
 
     @property
-    def _width(self):
-        """For ``self.width``."""
-        layout = self._instruction.get(GRID_LAYOUT)
-        if layout is not None:
-            width = layout.get(WIDTH)
-            if width is not None:
-                return width
-        return self._instruction.number_of_consumed_meshes
+    def width(self):
+        """:return: width of the object on the grid
+        :rtype: float
+        """
+        if self._width is None:
+            self._width = instruction_width(self._instruction)
+        return self._width
 
     @property
     def instruction(self):
@@ -138,18 +157,39 @@ class InstructionInGrid(InGrid):
         """
         return self._instruction.color
 
-    def _row(self):
-        """For ``self.row``."""
+    @property
+    def row(self):
+        """:return: row of the instruction
+        :rtype: knittingpattern.Row.Row
+        """
         return self._instruction.row
 
 
+def instruction_width(instruction):
+    """The width of an instruction in the grid.
+
+    :return: the :data:`WIDTH` in the :data:`GRID_LAYOUT` of the
+      :paramref:`instruction` or the number of meshes it consumes
+    :rtype: float
+    """
+    layout = instruction.get(GRID_LAYOUT)
+    if layout is not None:
+        width = layout.get(WIDTH)
+        if width is not None:
+            return width
+    return instruction.number_of_consumed_meshes
+
+
 class RowInGrid(InGrid):
     """Assign x and y coordinates to rows."""
 
+    __slots__ = ("_row", "_instructions")
+
     def __init__(self, row, position):
         """Create a new row in the grid."""
         super().__init__(position)
         self._row = row
+        self._instructions = None
 
     @property
     def _width(self):
@@ -162,16 +202,21 @@ class RowInGrid(InGrid):
 
         :return: the :class:`instructions in a grid <InstructionInGrid>` of
           this row
-        :rtype: list
+        :rtype: tuple
+
+        The instructions are placed when they are accessed the first time.
         """
-        x = self.x
-        y = self.y
-        result = []
-        for instruction in self._row.instructions:
-            instruction_in_grid = InstructionInGrid(instruction, Point(x, y))
-            x += instruction_in_grid.width
-            result.append(instruction_in_grid)
-        return result
+        if self._instructions is None:
+            x = self.x
+            y = self.y
+            result = []
+            for instruction in self._row.instructions:
+                width = instruction_width(instruction)
+                result.append(
+                    InstructionInGrid(instruction, Point(x, y), width))
+                x += width
+            self._instructions = tuple(result)
+        return self._instructions
 
     @property
     def _bounding_box(self):
@@ -192,78 +237,180 @@ def identity(object_):
     return object_
 
 
+class LayoutColumns(namedtuple("LayoutColumns", [
+        "x", "y", "width", "height", "color", "type", "colors", "types"])):
+    """The placement of the instructions of a :class:`GridLayout` as columns.
+
+    The element at an index in each column belongs to the instruction at the
+    same index in :meth:`GridLayout.walk_instructions`.
+
+    - ``x``, ``y``, ``width`` and ``height`` are :class:`arrays
+      <array.array>` of floats
+    - ``color`` and ``type`` are :class:`arrays <array.array>` of integers.
+      They are the indices of the color and the type of the instruction in
+      ``colors`` and ``types``.
+    - ``colors`` and ``types`` are tuples of the colors and the types of the
+      instructions in the order they occur in
+
+    .. code:: python
+
+        columns = layout.columns
+        for x, y, color in zip(columns.x, columns.y, columns.color):
+            print("color {} at {}".format(columns.colors[color], (x, y)))
+
+    """
+
+    __slots__ = ()
+
+    def to_numpy(self):
+        """The columns as :mod:`numpy` arrays.
+
+        :return: a copy of these columns with :class:`numpy arrays
+          <numpy.ndarray>` instead of :class:`arrays <array.array>`.
+          The arrays share the memory with these columns.
+        :rtype: LayoutColumns
+        :raises ImportError: if :mod:`numpy` is not installed
+        """
+        import numpy
+        return self._replace(**{
+            name: numpy.frombuffer(column, dtype=column.typecode)
+            for name, column in zip(self._fields, self)
+            if isinstance(column, array)})
+
+
+def _intern(interned, value):
+    """:return: the index of the value in the interned values
+
+    :param dict interned: a mapping from value to index
+    """
+    index = interned.get(value)
+    if index is None:
+        index = interned[value] = len(interned)
+    return index
+
+
 class _RecursiveWalk(object):
     """This class starts walking the knitting pattern and maps instructions to
-    positions in the grid that is created."""
+    positions in the grid that is created.
+
+    The rows to place are kept in a :class:`deque <collections.deque>`.
+    A row that is already placed is placed again only if it can be placed
+    higher and if it was not passed on the way to the new position.
+    The way is a linked list of ``(row, way_before)`` tuples that share the
+    rows they have in common.
+
+    This bounds the relaxation without a limit:
+    The rows on the way to a row are placed and not passed twice, so there
+    are less than ``n`` of them in a pattern with ``n`` rows.
+    Each of them is one row higher or lower than the one before.
+    Thus, a row can be placed at ``2 * n - 1`` heights and, as it only
+    moves up, it is placed at most ``2 * n - 1`` times.
+    """
 
     def __init__(self, first_instruction):
         """Start walking the knitting pattern starting from first_instruction.
         """
         self._rows_in_grid = {}
-        self._todo = []
-        self._expand(first_instruction.row, Point(0, 0), [])
+        self._todo = deque()
+        self._replacements = 0
+        self._queue_high_water_mark = 0
+        self._expand(first_instruction.row, Point(0, 0), None)
         self._walk()
 
     def _expand(self, row, consumed_position, passed):
         """Add the arguments `(args, kw)` to `_walk` to the todo list."""
         self._todo.append((row, consumed_position, passed))
+        if len(self._todo) > self._queue_high_water_mark:
+            self._queue_high_water_mark = len(self._todo)
 
     def _step(self, row, position, passed):
         """Walk through the knitting pattern by expanding an row."""
-        if row in passed or not self._row_should_be_placed(row, position):
+        if not self._row_should_be_placed(row, position, passed):
             return
         self._place_row(row, position)
-        passed = [row] + passed
-        # print("{}{} at\t{} {}".format("  " * len(passed), row, position,
-        #                               passed))
+        passed = (row, passed)
+        expanded = set()
         for i, produced_mesh in enumerate(row.produced_meshes):
-            self._expand_produced_mesh(produced_mesh, i, position, passed)
+            self._expand_produced_mesh(produced_mesh, i, position, passed,
+                                       expanded)
+        expanded = set()
         for i, consumed_mesh in enumerate(row.consumed_meshes):
-            self._expand_consumed_mesh(consumed_mesh, i, position, passed)
+            self._expand_consumed_mesh(consumed_mesh, i, position, passed,
+                                       expanded)
 
-    def _expand_consumed_mesh(self, mesh, mesh_index, row_position, passed):
-        """expand the consumed meshes"""
+    def _expand_consumed_mesh(self, mesh, mesh_index, row_position, passed,
+                              expanded):
+        """expand the consumed meshes
+
+        Only the first mesh to each row is expanded. The other meshes would
+        place the row at the same height.
+        """
         if not mesh.is_produced():
             return
         row = mesh.producing_row
+        if row in expanded:
+            return
+        expanded.add(row)
         position = Point(
             row_position.x + mesh.index_in_producing_row - mesh_index,
             row_position.y - INSTRUCTION_HEIGHT
         )
         self._expand(row, position, passed)
 
-    def _expand_produced_mesh(self, mesh, mesh_index, row_position, passed):
-        """expand the produced meshes"""
+    def _expand_produced_mesh(self, mesh, mesh_index, row_position, passed,
+                              expanded):
+        """expand the produced meshes
+
+        .. seealso:: :meth:`_expand_consumed_mesh`
+        """
         if not mesh.is_consumed():
             return
         row = mesh.consuming_row
+        if row in expanded:
+            return
+        expanded.add(row)
         position = Point(
             row_position.x - mesh.index_in_consuming_row + mesh_index,
             row_position.y + INSTRUCTION_HEIGHT
         )
         self._expand(row, position, passed)
 
-    def _row_should_be_placed(self, row, position):
-        """:return: whether to place this instruction"""
+    def _row_should_be_placed(self, row, position, passed):
+        """:return: whether to place this instruction
+
+        Only rows that are placed can be passed. Thus, the way is only
+        searched if the row can be placed higher.
+        """
         placed_row = self._rows_in_grid.get(row)
-        return placed_row is None or placed_row.y < position.y
+        if placed_row is None:
+            return True
+        if placed_row.y >= position.y:
+            return False
+        while passed is not None:
+            passed_row, passed = passed
+            if passed_row is row:
+                return False
+        return True
 
     def _place_row(self, row, position):
         """place the instruction on a grid"""
+        if row in self._rows_in_grid:
+            self._replacements += 1
         self._rows_in_grid[row] = RowInGrid(row, position)
 
     def _walk(self):
         """Loop through all the instructions that are `_todo`."""
         while self._todo:
-            args = self._todo.pop(0)
-            self._step(*args)
+            self._step(*self._todo.popleft())
 
-    def instruction_in_grid(self, instruction):
-        """Returns an `InstructionInGrid` object for the `instruction`"""
-        row_position = self._rows_in_grid[instruction.row].xy
-        x = instruction.index_of_first_consumed_mesh_in_row
-        position = Point(row_position.x + x, row_position.y)
-        return InstructionInGrid(instruction, position)
+    @property
+    def statistics(self):
+        """The statistics of this walk.
+
+        :rtype: WalkStatistics
+        """
+        return WalkStatistics(len(self._rows_in_grid), self._replacements,
+                              self._queue_high_water_mark)
 
     def row_in_grid(self, row):
         """Returns an `RowInGrid` object for the `row`"""
@@ -306,7 +453,11 @@ class Connection(object):
 
 
 class GridLayout(object):
-    """This class places the instructions at ``(x, y)`` positions."""
+    """This class places the instructions at ``(x, y)`` positions.
+
+    The rows and instructions are placed once, when the layout is created.
+    The walks iterate over these placements.
+    """
 
     def __init__(self, pattern):
         """
@@ -318,6 +469,25 @@ class GridLayout(object):
         self._rows = list(pattern.rows)
         self._walk = _RecursiveWalk(self._rows[0].instructions[0])
         self._rows.sort(key=lambda row: self._walk.row_in_grid(row).yx)
+        self._rows_in_grid = tuple(map(self._walk.row_in_grid, self._rows))
+        self._instructions_in_grid = tuple(chain.from_iterable(
+            row.instructions for row in self._rows_in_grid))
+        self._instruction_in_grid = {
+            instruction_in_grid.instruction: instruction_in_grid
+            for instruction_in_grid in self._instructions_in_grid}
+        self._bounding_box = None
+        self._columns = None
+
+    @property
+    def walk_statistics(self):
+        """How the rows were placed in this layout.
+
+        :return: the statistics of the placement of the rows
+        :rtype: WalkStatistics
+
+        This can help to find out why a pattern takes long to lay out.
+        """
+        return self._walk.statistics
 
     def walk_instructions(self, mapping=identity):
         """Iterate over instructions.
@@ -332,8 +502,7 @@ class GridLayout(object):
                 print("color {} at {}".format(c, pos))
 
         """
-        instructions = chain(*self.walk_rows(lambda row: row.instructions))
-        return map(mapping, instructions)
+        return map(mapping, self._instructions_in_grid)
 
     def walk_rows(self, mapping=identity):
         """Iterate over rows.
@@ -342,8 +511,7 @@ class GridLayout(object):
         :param mapping: funcion to map the result, see
           :meth:`walk_instructions` for an example usage
         """
-        row_in_grid = self._walk.row_in_grid
-        return map(lambda row: mapping(row_in_grid(row)), self._rows)
+        return map(mapping, self._rows_in_grid)
 
     def walk_connections(self, mapping=identity):
         """Iterate over connections between instructions.
@@ -353,11 +521,12 @@ class GridLayout(object):
         :param mapping: funcion to map the result, see
           :meth:`walk_instructions` for an example usage
         """
-        for start in self.walk_instructions():
+        instruction_in_grid = self._instruction_in_grid
+        for start in self._instructions_in_grid:
             for stop_instruction in start.instruction.consuming_instructions:
                 if stop_instruction is None:
                     continue
-                stop = self._walk.instruction_in_grid(stop_instruction)
+                stop = instruction_in_grid[stop_instruction]
                 connection = Connection(start, stop)
                 if connection.is_visible():
                     # print("connection:",
@@ -373,9 +542,45 @@ class GridLayout(object):
           of this layout
         :rtype: tuple
         """
-        min_x, min_y, max_x, max_y = zip(*list(self.walk_rows(
-            lambda row: row.bounding_box)))
-        return min(min_x), min(min_y), max(max_x), max(max_y)
+        if self._bounding_box is None:
+            min_x, min_y, max_x, max_y = zip(*list(self.walk_rows(
+                lambda row: row.bounding_box)))
+            self._bounding_box = \
+                min(min_x), min(min_y), max(max_x), max(max_y)
+        return self._bounding_box
+
+    @property
+    def columns(self):
+        """The placement of the instructions as columns.
+
+        :rtype: LayoutColumns
+
+        Use this instead of :meth:`walk_instructions` to process many
+        instructions at once.
+        The columns are :class:`arrays <array.array>`.
+        You can convert them to :mod:`numpy` arrays with
+        :meth:`LayoutColumns.to_numpy`.
+        """
+        if self._columns is None:
+            x = array("d")
+            y = array("d")
+            width = array("d")
+            height = array("d")
+            color = array("i")
+            type_ = array("i")
+            colors = {}
+            types = {}
+            for instruction_in_grid in self._instructions_in_grid:
+                instruction = instruction_in_grid.instruction
+                x.append(instruction_in_grid.x)
+                y.append(instruction_in_grid.y)
+                width.append(instruction_in_grid.width)
+                height.append(instruction_in_grid.height)
+                color.append(_intern(colors, instruction.color))
+                type_.append(_intern(types, instruction.type))
+            self._columns = LayoutColumns(x, y, width, height, color, type_,
+                                          tuple(colors), tuple(types))
+        return self._columns
 
     def row_in_grid(self, row):
         """The a RowInGrid for the row with position information.
@@ -387,4 +592,5 @@ class GridLayout(object):
 
 
 __all__ = ["GridLayout", "InstructionInGrid", "Connection", "identity",
-           "Point", "INSTRUCTION_HEIGHT", "InGrid", "RowInGrid"]
+           "Point", "INSTRUCTION_HEIGHT", "InGrid", "RowInGrid",
+           "WalkStatistics", "instruction_width", "LayoutColumns"]
@@ -1,7 +1,15 @@
-"""Functions for color conversion."""
+"""Functions for color conversion.
+
+The conversions are cached because patterns use only a few colors.
+"""
+from functools import lru_cache
 import webcolors
 
+#: the number of colors to remember the conversion of
+COLOR_CACHE_SIZE = 1024
+
 
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
 def convert_color_to_rrggbb(color):
     """The color in "#RRGGBB" format.
 
@@ -14,4 +22,16 @@ def convert_color_to_rrggbb(color):
         hex_color = color
     return webcolors.normalize_hex(hex_color)
 
-__all__ = ["convert_color_to_rrggbb"]
+
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def convert_color_to_rgb(color):
+    """The color as red, green and blue values.
+
+    :return: the :attr:`color` as a tuple ``(red, green, blue)`` of integers
+      from ``0`` to ``255``
+    :rtype: tuple
+    """
+    return tuple(webcolors.hex_to_rgb(convert_color_to_rrggbb(color)))
+
+__all__ = ["convert_color_to_rrggbb", "convert_color_to_rgb",
+           "COLOR_CACHE_SIZE"]
@@ -7,6 +7,11 @@ from ..Dumper import JSONDumper
 from .load_and_dump import decorate_load_and_dump
 import os
 
+#: the pixels of an image as a sequence, newer versions of Pillow renamed
+#: :meth:`PIL.Image.Image.getdata`
+_pixels = getattr(PIL.Image.Image, "get_flattened_data",
+                  PIL.Image.Image.getdata)
+
 
 @decorate_load_and_dump(PathLoader, JSONDumper)
 def convert_image_to_knitting_pattern(path, colors=("white", "black")):
@@ -22,12 +27,22 @@ def convert_image_to_knitting_pattern(path, colors=("white", "black")):
     .. code:: python
 
         convert_image_to_knitting_pattern().path("image.png").path("image.json")
+
+    The image is read one row at a time.
+    The rows and connections of the result are generators so that the
+    :class:`~knittingpattern.Dumper.json.JSONDumper` can write them while
+    they are created. The image file is open while the rows are generated.
     """
-    image = PIL.Image.open(path)
+    with PIL.Image.open(path) as image:
+        bbox = image.getbbox()
     pattern_id = os.path.splitext(os.path.basename(path))[0]
-    rows = []
-    connections = []
-    pattern_set = {
+    if bbox:
+        rows = _rows(path, bbox, colors)
+        connections = _connections(bbox)
+    else:
+        rows = []
+        connections = []
+    return {
         "version": "0.1",
         "type": "knitting pattern",
         "comment": {
@@ -41,27 +56,31 @@ def convert_image_to_knitting_pattern(path, colors=("white", "black")):
                 "connections": connections
             }
         ]}
-    bbox = image.getbbox()
-    if not bbox:
-        return pattern_set
-    white = image.getpixel((0, 0))
+
+
+def _rows(path, bbox, colors):
+    """Generate the rows of the image from bottom to top.
+
+    Only the pixels of one row are read at a time.
+    Pixels with the color of the top left pixel get the first color.
+    """
+    with PIL.Image.open(path) as image:
+        white = image.getpixel((0, 0))
+        is_white = white.__eq__
+        color_of = (colors[1], colors[0])
+        min_x, min_y, max_x, max_y = bbox
+        for y in reversed(range(min_y, max_y)):
+            pixels = _pixels(image.crop((min_x, y, max_x, y + 1)))
+            instructions = [{"color": color_of[is_white_pixel]}
+                            for is_white_pixel in map(is_white, pixels)]
+            yield {"id": y, "instructions": instructions}
+
+
+def _connections(bbox):
+    """Generate the connections between the rows from bottom to top."""
     min_x, min_y, max_x, max_y = bbox
-    last_row_y = None
-    for y in reversed(range(min_y, max_y)):
-        instructions = []
-        row = {"id": y, "instructions": instructions}
-        rows.append(row)
-        for x in range(min_x, max_x):
-            if image.getpixel((x, y)) == white:
-                color = colors[0]
-            else:
-                color = colors[1]
-            instruction = {"color": color}
-            instructions.append(instruction)
-        if last_row_y is not None:
-            connections.append({"from": {"id": last_row_y}, "to": {"id": y}})
-        last_row_y = y
-    return pattern_set
+    for y in reversed(range(min_y, max_y - 1)):
+        yield {"from": {"id": y + 1}, "to": {"id": y}}
 
 
 __all__ = ["convert_image_to_knitting_pattern"]
@@ -3,6 +3,10 @@
 Each pixel is an instruction."""
 from test_convert import fixture, pytest, MagicMock, call
 from knittingpattern.convert.AYABPNGBuilder import AYABPNGBuilder
+from knittingpattern.convert.color import convert_color_to_rgb
+from knittingpattern.convert.Layout import GridLayout, LayoutColumns
+from knittingpattern import load_from
+from array import array
 from collections import namedtuple
 import PIL.Image
 import tempfile
@@ -36,6 +40,10 @@ class TestColorConversion(object):
     def test_can_convert_anything_to_color(self, convert):
         assert convert("ajsdkahsj") != convert("ajsahsj")
 
+    def test_convert_to_rgb(self):
+        assert convert_color_to_rgb("blue") == (0, 0, 255)
+        assert convert_color_to_rgb("#123") == (0x11, 0x22, 0x33)
+
 
 class TestBounds(object):
     """Check whether points are inside and outside of the bounds."""
@@ -142,3 +150,78 @@ class TestDefaultColor(object):
 
     def test_default_color_is_white(self, default_color):
         assert default_color == "white"
+
+
+class TestSetColorsInLayout(object):
+    """The colors of a whole layout are set at once."""
+
+    @pytest.mark.parametrize("example", ["Cafe.json", "Charlotte.json",
+                                         "negative-rendering.json"])
+    def test_same_pixels_as_set_colors_in_grid(self, example):
+        pattern = load_from().example(example).first
+        layout = GridLayout(pattern)
+        builder_1 = AYABPNGBuilder(*layout.bounding_box)
+        builder_1.set_colors_in_grid(layout.walk_instructions())
+        builder_2 = AYABPNGBuilder(*layout.bounding_box)
+        builder_2.set_colors_in_layout(layout)
+        assert builder_1._image.tobytes() == builder_2._image.tobytes()
+
+    def test_set_colors_in_columns(self):
+        builder = AYABPNGBuilder(-1, -1, 2, 2)
+        builder.set_pixel(1, 1, "blue")
+        columns = LayoutColumns(
+            array("d", [0, -1, 12, 1, 0]), array("d", [0, -1, 12, 0, 1]),
+            None, None, array("i", [0, 1, 2, 3, 3]), None,
+            ("#000000", "#111111", "red", None), None)
+        builder.set_colors_in_columns(columns)
+        image = builder._image
+        assert image.getpixel((1, 1)) == (0, 0, 0)
+        assert image.getpixel((0, 0)) == (0x11, 0x11, 0x11)
+        assert image.getpixel((2, 2)) == (0, 0, 255)
+        assert image.getpixel((1, 2)) == (255, 255, 255)
+
+
+class TestPalette(object):
+    """Images with a palette store an index per pixel."""
+
+    def test_rgb_image_has_no_palette(self, builder):
+        assert builder.palette is None
+
+    def test_default_color_is_first(self):
+        builder = AYABPNGBuilder(-1, -1, 2, 2, palette=["red", None, "blue"])
+        assert builder.palette == [(255, 255, 255), (255, 0, 0), (0, 0, 255)]
+
+    def test_colors_are_added(self):
+        builder = AYABPNGBuilder(-1, -1, 2, 2, "black", palette=[])
+        builder.set_pixel(0, 0, "#00ff00")
+        builder.set_pixel(1, 0, "black")
+        assert builder.palette == [(0, 0, 0), (0, 255, 0)]
+
+    def test_palette_is_limited(self):
+        builder = AYABPNGBuilder(0, 0, 256, 1, palette=[])
+        for x in range(255):
+            builder.set_pixel(x, 0, "#0000{:02x}".format(x))
+        with pytest.raises(ValueError):
+            builder.set_pixel(255, 0, "#ff0000")
+
+    @pytest.mark.parametrize("example", ["Cafe.json", "Charlotte.json",
+                                         "negative-rendering.json"])
+    def test_same_colors_as_rgb(self, example):
+        pattern = load_from().example(example).first
+        layout = GridLayout(pattern)
+        rgb = AYABPNGBuilder(*layout.bounding_box)
+        rgb.set_colors_in_layout(layout)
+        indexed = AYABPNGBuilder(*layout.bounding_box,
+                                 palette=pattern.instruction_colors)
+        indexed.set_colors_in_layout(layout)
+        file = tempfile.TemporaryFile()
+        indexed.write_to_file(file)
+        file.seek(0)
+        image = PIL.Image.open(file)
+        assert image.mode == "P"
+        assert image.convert("RGB").tobytes() == rgb._image.tobytes()
+
+    def test_dump_indexed_pattern_set(self):
+        pattern_set = load_from().example("Cafe.json")
+        path = pattern_set.to_ayabpng(indexed=True).temporary_path()
+        assert PIL.Image.open(path).mode == "P"
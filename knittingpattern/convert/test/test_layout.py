@@ -1,5 +1,6 @@
 """Test the layout of knitting patterns."""
 from test_convert import fixture
+import pytest
 import os
 from knittingpattern.convert.Layout import GridLayout, InstructionInGrid
 from knittingpattern import load_from_relative_file
@@ -42,6 +43,7 @@ class BaseTest:
     ROW_IDS = [1, 2, 3, 4]
     LARGER_CONNECTIONS = []
     BOUNDING_BOX = (0, 0, 4, 4)
+    REPLACEMENTS = 0
 
     @fixture(scope="class")
     def pattern(self):
@@ -92,6 +94,46 @@ class BaseTest:
         """Test the bounding box of the layout."""
         assert grid.bounding_box == self.BOUNDING_BOX
 
+    def test_instructions_are_placed_once(self, grid):
+        """Test that the walks return the same objects."""
+        instructions = list(grid.walk_instructions())
+        assert instructions == list(grid.walk_instructions())
+        assert instructions == [instruction for row in grid.walk_rows()
+                                for instruction in row.instructions]
+        assert all(instruction.row is instruction.instruction.row
+                   for instruction in instructions)
+
+    def test_columns(self, grid):
+        """Test the columns have the same values as the instructions."""
+        columns = grid.columns
+        assert list(zip(columns.x, columns.y)) == self.COORDINATES
+        assert list(zip(columns.width, columns.height)) == self.SIZES
+        assert [columns.colors[color] for color in columns.color] == \
+            list(grid.walk_instructions(lambda i: i.instruction.color))
+        assert [columns.types[type_] for type_ in columns.type] == \
+            list(grid.walk_instructions(lambda i: i.instruction.type))
+
+    def test_numpy_columns(self, grid):
+        """Test the columns can be converted to numpy arrays."""
+        numpy = pytest.importorskip("numpy")
+        columns = grid.columns.to_numpy()
+        assert isinstance(columns.x, numpy.ndarray)
+        assert columns.x.tolist() == list(grid.columns.x)
+        assert columns.color.tolist() == list(grid.columns.color)
+        assert columns.colors == grid.columns.colors
+
+    def test_replacements_are_bounded(self, grid):
+        """Test that no row is placed more than ``2 * n - 1`` times."""
+        statistics = grid.walk_statistics
+        rows = statistics.rows_placed
+        assert statistics.replacements <= rows * (2 * rows - 2)
+
+    def test_all_rows_are_placed(self, grid):
+        """Test the statistics of the layout."""
+        statistics = grid.walk_statistics
+        assert statistics.rows_placed == len(self.ROW_IDS)
+        assert statistics.replacements == self.REPLACEMENTS
+
 
 class TestBlock4x4(BaseTest):
     """Execute the BaseTest."""
@@ -284,6 +326,7 @@ class TestParallelRows(BaseTest):
     # LARGER_CONNECTIONS = [((0, 1), (0, 3)), ((1, 1), (1, 3))]
     LARGER_CONNECTIONS = [((0, 0), (0, 2)), ((1, 0), (1, 2))]
     BOUNDING_BOX = (0, 0, 5, 4)
+    REPLACEMENTS = 2  # 2.1 and 4.1 are placed higher
 
     @fixture
     def row_4(self, pattern):
@@ -3,6 +3,8 @@ from knittingpattern.convert.image_to_knittingpattern import \
     convert_image_to_knitting_pattern
 from knittingpattern import convert_from_image
 from PIL import Image
+import json
+import gc
 
 
 IMAGE_PATH = os.path.join(HERE, "pictures")
@@ -64,3 +66,30 @@ def test_order_of_conversion():
     row1, row2, row3 = pattern.rows
     assert row1.first_instruction.color == row2.first_instruction.color
     assert row2.first_instruction.color != row3.first_instruction.color
+
+
+def test_rows_are_generated_while_dumping():
+    dumper = convert_image_to_knitting_pattern().relative_file(
+        HERE, "pictures/color-order.png")
+    rows = json.loads(dumper.string())["patterns"][0]["rows"]
+    assert [row["id"] for row in rows] == [2, 1, 0]
+
+
+def test_object_can_be_used_as_json():
+    dumper = convert_from_image().relative_file(
+        HERE, "pictures/color-order.png")
+    object_ = dumper.object()
+    assert json.loads(json.dumps(object_)) == json.loads(dumper.string())
+    pattern = object_["patterns"][0]
+    assert [row["id"] for row in pattern["rows"]] == [2, 1, 0]
+    assert [row["id"] for row in pattern["rows"]] == [2, 1, 0]
+    assert len(pattern["connections"]) == 2
+
+
+def test_image_file_is_closed(image_path, recwarn):
+    convert_image_to_knitting_pattern().path(image_path).string()
+    dumper = convert_image_to_knitting_pattern().path(image_path)
+    dumper.object()
+    gc.collect()
+    assert not [warning for warning in recwarn
+                if issubclass(warning.category, ResourceWarning)]
@@ -85,3 +85,48 @@ def test_transfer_removed_instruction(row, row2):
     row2.instructions.append(row.instructions.pop())
     instruction = row2.instructions[-1]
     assert instruction.row == row2
+
+
+class TestExtendInstructions(object):
+    """Add many instructions to a row at once."""
+
+    @fixture
+    def changes(self, row):
+        changes = []
+        row.instructions.register_observer(changes.append)
+        return changes
+
+    def test_dicts_are_converted(self, row):
+        row.extend_instructions([{}, {"type": "purl"}])
+        _, knit, purl = row.instructions
+        assert knit.type == "knit"
+        assert purl.type == "purl"
+        assert purl.row == row
+        assert purl.index_in_row == 2
+
+    def test_one_notification(self, row, changes):
+        row.extend_instructions([{}, {}, {}])
+        assert len(changes) == 1
+        assert changes[0].adds()
+        assert changes[0].range == range(1, 4)
+        assert changes[0].elements == row.instructions[1:]
+
+    def test_nothing_to_add(self, row, changes):
+        version = row.version
+        row.extend_instructions([])
+        assert changes == []
+        assert row.version == version
+
+    def test_instructions_are_transferred(self, row, row2, instruction2):
+        row.extend_instructions([{}, instruction2])
+        assert instruction2.row == row
+        assert instruction2.index_in_row == 2
+        assert row2.instructions == []
+
+    def test_same_as_extending_the_list(self, row, row2):
+        row.extend_instructions([{}, {"number of consumed meshes": 2}])
+        row2.instructions.extend([{}, {"number of consumed meshes": 2}])
+        assert row.number_of_consumed_meshes == \
+            row2.number_of_consumed_meshes
+        assert [i.type for i in row.instructions[1:]] == \
+            [i.type for i in row2.instructions[1:]]
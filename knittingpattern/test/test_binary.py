@@ -0,0 +1,202 @@
+"""Test the binary format of knitting pattern sets."""
+from pytest import fixture, raises
+import pytest
+import marshal
+import os
+import knittingpattern
+from knittingpattern.binary import dumps, loads, MAGIC, FORMAT_VERSION, \
+    _to_array
+from knittingpattern.Parser import ParsingError, INSTRUCTIONS, Parser
+from knittingpattern.Loader import BinaryLoader, JSONLoader
+from knittingpattern.ParsingSpecification import ParsingSpecification
+
+EXAMPLES_PATH = os.path.join(HERE, "..", "examples")
+PATTERNS_PATH = os.path.join(HERE, "pattern")
+PATHS = [os.path.join(folder, file)
+         for folder in (EXAMPLES_PATH, PATTERNS_PATH)
+         for file in sorted(os.listdir(folder)) if file.endswith(".json")]
+
+
+def describe(knitting_pattern_set):
+    """Describe everything in a knitting pattern set that is stored."""
+    patterns = []
+    for pattern in knitting_pattern_set.patterns:
+        rows = []
+        for row in pattern.rows:
+            values, _ = row._flatten()
+            values.pop(INSTRUCTIONS, None)
+            instructions = [
+                (dict(instruction._own_specification()), instruction.type,
+                 instruction.color, instruction.number_of_produced_meshes,
+                 instruction.number_of_consumed_meshes)
+                for instruction in row.instructions]
+            consumed = [(mesh.producing_row.id, mesh.index_in_producing_row)
+                        if mesh.is_produced() else None
+                        for mesh in row.consumed_meshes]
+            produced = [(mesh.consuming_row.id, mesh.index_in_consuming_row)
+                        if mesh.is_consumed() else None
+                        for mesh in row.produced_meshes]
+            rows.append((row.id, values, instructions, consumed, produced))
+        patterns.append((pattern.id, pattern.name, rows))
+    return (knitting_pattern_set.type, knitting_pattern_set.version,
+            knitting_pattern_set.comment, patterns)
+
+
+def load_binary(bytes_):
+    return knittingpattern.load_binary_from().string(bytes_)
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_round_trip(path):
+    knitting_pattern_set = knittingpattern.load_from_path(path)
+    bytes_ = knitting_pattern_set.to_binary().bytes()
+    loaded = load_binary(bytes_)
+    assert describe(loaded) == describe(knitting_pattern_set)
+    assert loaded.to_binary().bytes() == bytes_
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_load_from_path(path, tmpdir):
+    knitting_pattern_set = knittingpattern.load_from_path(path)
+    binary_path = tmpdir.join("pattern.kpb").strpath
+    knitting_pattern_set.to_binary().path(binary_path)
+    loaded = knittingpattern.load_binary_from().path(binary_path)
+    assert describe(loaded) == describe(knitting_pattern_set)
+
+
+@fixture
+def charlotte():
+    return knittingpattern.load_from().example("Charlotte.json")
+
+
+def test_rows_do_not_inherit():
+    path = os.path.join(PATTERNS_PATH, "inheritance.json")
+    knitting_pattern_set = knittingpattern.load_from_path(path)
+    loaded = load_binary(knitting_pattern_set.to_binary().bytes())
+    for row in loaded.patterns.at(0).rows:
+        _, number_of_specifications = row._flatten()
+        assert number_of_specifications == 1
+
+
+def test_instructions_are_shared():
+    pattern = {"type": "knitting pattern", "version": "0.1", "patterns": [
+        {"id": 1, "name": "chart", "rows": [
+            {"id": row_id, "instructions": [{"color": "red"}] * 3}
+            for row_id in range(3)]}]}
+    knitting_pattern_set = knittingpattern.load_from_object(pattern)
+    _, _, _, specifications, patterns, _ = loads(
+        knitting_pattern_set.to_binary().bytes())
+    assert specifications == [{"color": "red"}]
+    for _, _, codes in patterns[0][2]:
+        assert list(codes) == [0, 0, 0]
+    loaded = load_binary(knitting_pattern_set.to_binary().bytes())
+    specifications = [instruction._own_specification()
+                      for row in loaded.patterns.at(0).rows
+                      for instruction in row.instructions]
+    assert all(specification is specifications[0]
+               for specification in specifications)
+
+
+def test_connections_are_ranges():
+    pattern = {"type": "knitting pattern", "version": "0.1", "patterns": [
+        {"id": 1, "name": "two rows", "rows": [
+            {"id": 1, "instructions": [{}] * 5},
+            {"id": 2, "instructions": [{}] * 5}],
+         "connections": [
+            {"from": {"id": 1}, "to": {"id": 2}, "meshes": 2},
+            {"from": {"id": 1, "start": 3}, "to": {"id": 2, "start": 2}}]}]}
+    knitting_pattern_set = knittingpattern.load_from_object(pattern)
+    *_, connections = loads(knitting_pattern_set.to_binary().bytes())
+    assert list(connections) == [(0, 0, 1, 0, 2), (0, 3, 1, 2, 2)]
+
+
+def test_many_instructions_need_larger_numbers():
+    pattern = {"type": "knitting pattern", "version": "0.1", "patterns": [
+        {"id": 1, "name": "colors", "rows": [
+            {"id": 1, "instructions": [{"color": index}
+                                       for index in range(300)]}]}]}
+    knitting_pattern_set = knittingpattern.load_from_object(pattern)
+    loaded = load_binary(knitting_pattern_set.to_binary().bytes())
+    assert describe(loaded) == describe(knitting_pattern_set)
+
+
+def test_edited_pattern(charlotte):
+    pattern = charlotte.patterns.at(0)
+    row = pattern.add_row("new row")
+    row.instructions.append({"type": "purl", "color": "green"})
+    pattern.connect_range(pattern.rows.at(0), 0, row, 0, 1)
+    loaded = load_binary(charlotte.to_binary().bytes())
+    assert describe(loaded) == describe(charlotte)
+
+
+def test_row_connected_outside_of_the_set(charlotte):
+    other_row = knittingpattern.new_knitting_pattern("other").add_row(1)
+    other_row.instructions.append({})
+    row = charlotte.patterns.at(0).rows.at(0)
+    row.connect_range(0, other_row, 0, 1)
+    with raises(ValueError):
+        dumps(charlotte)
+
+
+@pytest.mark.parametrize("bytes_", [
+    b"", b"KPS", b"{}", MAGIC + bytes([FORMAT_VERSION + 1, 0]),
+    MAGIC + bytes([FORMAT_VERSION, 2]), MAGIC + bytes([FORMAT_VERSION, 0]),
+    MAGIC + bytes([FORMAT_VERSION, 0]) + b"broken"])
+def test_broken_content(bytes_):
+    with raises(ParsingError):
+        load_binary(bytes_)
+
+
+def test_loader_is_a_binary_loader():
+    assert isinstance(knittingpattern.load_binary_from(), BinaryLoader)
+
+
+def test_positional_arguments_of_the_specification_are_kept():
+    specification = ParsingSpecification(JSONLoader, Parser)
+    assert specification.new_parser is Parser
+    assert specification.new_binary_loader is BinaryLoader
+
+
+def replace_content(bytes_, replace):
+    """:return: the bytes with the marshaled content replaced"""
+    header_length = len(MAGIC) + 2
+    content = list(marshal.loads(bytes_[header_length:]))
+    replace(content)
+    return bytes_[:header_length] + marshal.dumps(tuple(content))
+
+
+def unknown_instruction(content):
+    content[3] = content[3][:1]
+
+
+def unknown_row(content):
+    content[5] = _to_array([0, 0, 100, 0, 1])
+
+
+def meshes_out_of_range(content):
+    content[5] = _to_array([0, 0, 1, 100, 1])
+
+
+def list_as_id(content):
+    pattern_id, name, rows = content[4][0]
+    content[4][0] = ([pattern_id], name, rows)
+
+
+@pytest.mark.parametrize("replace", [
+    unknown_instruction, unknown_row, meshes_out_of_range, list_as_id])
+def test_broken_values(charlotte, replace):
+    bytes_ = replace_content(charlotte.to_binary().bytes(), replace)
+    with raises(ParsingError):
+        load_binary(bytes_)
+
+
+@pytest.mark.parametrize("index", range(len(MAGIC) + 2, 400))
+def test_broken_bytes(index):
+    knitting_pattern_set = knittingpattern.load_from().example(
+        "block4x4.json")
+    bytes_ = bytearray(knitting_pattern_set.to_binary().bytes())
+    bytes_[index] ^= 0xff
+    try:
+        load_binary(bytes(bytes_))
+    except ParsingError:
+        pass
@@ -0,0 +1,143 @@
+"""Connect ranges of meshes between rows at once."""
+from pytest import fixture, raises
+import pytest
+from knittingpattern import new_knitting_pattern
+
+DOUBLE_CONSUMED_MESH = {"number of consumed meshes": 2}
+DOUBLE_PRODUCED_MESH = {"number of produced meshes": 2}
+NO_MESH = {"number of consumed meshes": 0, "number of produced meshes": 0}
+
+
+@fixture
+def pattern():
+    return new_knitting_pattern("test")
+
+
+@fixture
+def row_1(pattern):
+    row = pattern.add_row(1)
+    row.instructions.extend([{}, NO_MESH, DOUBLE_PRODUCED_MESH, {}, {}])
+    return row
+
+
+@fixture
+def row_2(pattern):
+    row = pattern.add_row(2)
+    row.instructions.extend([DOUBLE_CONSUMED_MESH, {}, NO_MESH, {}, {}])
+    return row
+
+
+def connections(row_1, row_2):
+    """:return: the pairs of indices of connected meshes"""
+    consumed_meshes = row_2.consumed_meshes
+    return [(index, consumed_meshes.index(mesh.as_consumed_mesh()))
+            for index, mesh in enumerate(row_1.produced_meshes)
+            if mesh.is_connected()]
+
+
+@fixture
+def connected(pattern, row_1, row_2):
+    pattern.connect_range(row_1, 1, row_2, 0, 4)
+    return row_1, row_2
+
+
+def test_meshes_are_connected(connected):
+    assert connections(*connected) == [(1, 0), (2, 1), (3, 2), (4, 3)]
+
+
+def test_rows_are_connected(connected):
+    row_1, row_2 = connected
+    assert row_1.rows_after == [row_2]
+    assert row_2.rows_before == [row_1]
+
+
+def test_same_as_connecting_meshes(pattern, connected):
+    row_3 = pattern.add_row(3)
+    row_4 = pattern.add_row(4)
+    row_3.instructions.extend([{}, NO_MESH, DOUBLE_PRODUCED_MESH, {}, {}])
+    row_4.instructions.extend([DOUBLE_CONSUMED_MESH, {}, NO_MESH, {}, {}])
+    for produced, consumed in zip(row_3.produced_meshes[1:],
+                                  row_4.consumed_meshes):
+        produced.connect_to(consumed)
+    assert connections(row_3, row_4) == connections(*connected)
+
+
+def test_connected_meshes_are_disconnected(row_1, row_2):
+    row_1.connect_range(0, row_2, 0, 2)
+    row_1.connect_range(1, row_2, 0, 2)
+    assert connections(row_1, row_2) == [(1, 0), (2, 1)]
+
+
+def test_rows_of_reconnected_meshes_are_notified(pattern, row_1, row_2):
+    row_3 = pattern.add_row(3)
+    row_3.instructions.extend([{}] * 6)
+    row_1.connect_range(0, row_3, 0, 1)
+    assert row_3.rows_before == [row_1]
+    row_1.connect_range(0, row_2, 0, 1)
+    assert row_3.rows_before == []
+    assert row_1.rows_after == [row_2]
+
+
+def test_rows_of_reconnected_producing_meshes_are_notified(
+        pattern, row_1, row_2):
+    row_3 = pattern.add_row(3)
+    row_3.instructions.extend([{}] * 6)
+    row_1.connect_range(0, row_2, 0, 1)
+    assert row_1.rows_after == [row_2]
+    row_3.connect_range(0, row_2, 0, 1)
+    assert row_1.rows_after == []
+    assert row_2.rows_before == [row_3]
+
+
+def test_connect_nothing(row_1, row_2):
+    row_1.connect_range(5, row_2, 5, 0)
+    assert connections(row_1, row_2) == []
+
+
+def test_connect_to_the_same_row(row_1):
+    row_1.connect_range(0, row_1, 1, 1)
+    assert row_1.rows_after == row_1.rows_before == [row_1]
+
+
+@pytest.mark.parametrize("start,to_start,count", [
+    (-1, 0, 1), (0, -1, 1), (0, 0, -1), (3, 0, 3), (0, 4, 2), (6, 0, 0)])
+def test_out_of_range(row_1, row_2, start, to_start, count):
+    with raises(IndexError):
+        row_1.connect_range(start, row_2, to_start, count)
+    assert connections(row_1, row_2) == []
+
+
+class TestConnectionRanges(object):
+
+    def test_no_connections(self, row_1):
+        assert row_1.connection_ranges() == []
+
+    def test_one_range(self, row_1, row_2, connected):
+        assert row_1.connection_ranges() == [(1, row_2, 0, 4)]
+
+    def test_ranges_are_split(self, pattern, row_1, row_2):
+        row_1.connect_range(0, row_2, 0, 2)
+        row_1.connect_range(2, row_2, 3, 2)
+        assert row_1.connection_ranges() == [(0, row_2, 0, 2),
+                                             (2, row_2, 3, 2)]
+
+    def test_ranges_to_different_rows(self, pattern, row_1, row_2):
+        row_3 = pattern.add_row(3)
+        row_3.instructions.extend([{}, {}])
+        row_1.connect_range(0, row_2, 0, 2)
+        row_1.connect_range(2, row_3, 0, 2)
+        assert row_1.connection_ranges() == [(0, row_2, 0, 2),
+                                             (2, row_3, 0, 2)]
+
+    def test_removed_consuming_instruction(self, row_1, row_2, connected):
+        row_2.instructions.pop(1)
+        assert row_1.connection_ranges() == [(1, row_2, 0, 2),
+                                             (4, row_2, 2, 1)]
+
+    def test_connect_the_ranges(self, pattern, row_1, row_2, connected):
+        row_3 = pattern.add_row(3)
+        row_3.instructions.extend([{}] * 6)
+        for start, _, to_start, count in row_1.connection_ranges():
+            row_1.connect_range(start, row_3, to_start, count)
+        assert row_1.connection_ranges() == [(1, row_3, 0, 4)]
+        assert row_2.rows_before == []
@@ -51,3 +51,25 @@ def test_default_instructions_is_a_singleton():
 
 def test_default_instructions_are_an_instance_of_the_class():
     assert isinstance(default_instructions(), DefaultInstructions)
+
+
+class TestSharedDefaultInstructions(object):
+    """The default instructions are loaded once."""
+
+    def test_types_are_shared(self, default):
+        assert default._type_to_instruction is \
+            DefaultInstructions()._type_to_instruction
+
+    def test_types_can_not_be_changed(self, default):
+        with pytest.raises(TypeError):
+            default._type_to_instruction["knit"] = None
+
+    def test_adding_a_type_does_not_change_other_libraries(self, default):
+        other = DefaultInstructions()
+        default.add_instruction({"type": "knit", "description": "changed"})
+        default.add_instruction({"type": "new type"})
+        assert default["knit"].description == "changed"
+        assert "new type" in default.loaded_types
+        assert other["knit"].description != "changed"
+        assert "new type" not in other.loaded_types
+        assert "new type" not in DefaultInstructions().loaded_types
@@ -1,6 +1,8 @@
 from pytest import fixture
 from unittest.mock import MagicMock
 from knittingpattern.Dumper import JSONDumper
+from knittingpattern.Dumper.json import encode_in_chunks
+import pytest
 import json
 from knittingpattern.ParsingSpecification import ParsingSpecification
 
@@ -47,3 +49,59 @@ def test_dump_to_knitting_pattern(dumper, parser, obj):
 def test_string_representation(dumper):
     string = repr(dumper)
     assert "JSONDumper" in string
+
+
+@pytest.mark.parametrize("create", [
+    lambda: [1, "2", None, True, 1.5, {"a": [1, 2]}],
+    lambda: {"a": {"b": [{}, []]}, 1: 2, None: False},
+    lambda: {"rows": (row for row in range(3)), "empty": iter([])},
+    lambda: [{"instructions": ({"id": i} for i in range(3))},
+             iter([[], ()])]])
+def test_encode_in_chunks_like_json(create):
+    materialized = json.loads(json.dumps(create(), default=list))
+    string = "".join(encode_in_chunks(create()))
+    assert json.loads(string) == materialized
+
+
+def test_dump_generators():
+    dumper = JSONDumper(lambda: {"rows": ([i] * i for i in range(4))})
+    assert dumper.string() == json.dumps({"rows": [[], [1], [2, 2],
+                                                   [3, 3, 3]]})
+
+
+def test_object_that_can_not_be_dumped():
+    with pytest.raises(TypeError):
+        list(encode_in_chunks({"a": [object()]}))
+
+
+@pytest.mark.parametrize("object_", [
+    {1: 2, 1.5: "a", True: None, None: [1]},
+    {"rows": [{2: "b"}], "x": {False: 0}}])
+def test_keys_are_converted_like_json(object_):
+    assert "".join(encode_in_chunks(object_)) == json.dumps(object_)
+    with_iterator = dict(object_, generated=iter([object_]))
+    assert json.loads("".join(encode_in_chunks(with_iterator))) == \
+        json.loads(json.dumps(dict(object_, generated=[object_])))
+
+
+@pytest.mark.parametrize("object_", [
+    {1, 2}, {"a": frozenset()}, [{(1, 2): 3}], {"a": {(1, 2): iter([])}},
+    iter([{1, 2}]), {"a": iter([]), "b": object()}])
+def test_only_iterators_are_streamed(object_):
+    with pytest.raises(TypeError):
+        list(encode_in_chunks(object_))
+
+
+def test_object_with_sets_can_not_be_dumped():
+    with pytest.raises(TypeError):
+        JSONDumper(lambda: {"a": {1, 2}}).string()
+
+
+def test_shared_subtrees_are_checked_once():
+    row = {"instructions": [{"color": "black"}] * 10}
+    nested = [row] * 100
+    for _ in range(20):
+        nested = [nested, nested]
+    object_ = {"rows": nested, "generated": iter([])}
+    chunks = encode_in_chunks(object_)
+    assert next(chunks) == "{"
@@ -0,0 +1,149 @@
+"""Dump knitting pattern sets to JSON."""
+from pytest import fixture, raises
+import pytest
+import json
+import pickle
+import os
+import knittingpattern
+from knittingpattern.binary import loads
+
+EXAMPLES_PATH = os.path.join(HERE, "..", "examples")
+PATTERNS_PATH = os.path.join(HERE, "pattern")
+PATHS = [os.path.join(folder, file)
+         for folder in (EXAMPLES_PATH, PATTERNS_PATH)
+         for file in sorted(os.listdir(folder)) if file.endswith(".json")]
+
+
+def reload(knitting_pattern_set):
+    return knittingpattern.load_from_string(
+        knitting_pattern_set.to_json().string())
+
+
+def content(knitting_pattern_set):
+    """:return: the content of the binary format without the ids of the rows
+      in their values"""
+    type_, version, comment, specifications, patterns, connections = \
+        loads(knitting_pattern_set.to_binary().bytes())
+    patterns = [(id_, name, [(row_id, dict(values, id=None), list(codes))
+                             for row_id, values, codes in rows])
+                for id_, name, rows in patterns]
+    return (type_, version, comment, specifications, patterns,
+            list(connections))
+
+
+def assert_equal(knitting_pattern_set_1, knitting_pattern_set_2):
+    """The binary format contains what is loaded from the JSON format."""
+    assert content(knitting_pattern_set_1) == content(knitting_pattern_set_2)
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_round_trip(path):
+    knitting_pattern_set = knittingpattern.load_from_path(path)
+    reloaded = reload(knitting_pattern_set)
+    assert_equal(reloaded, knitting_pattern_set)
+    assert reloaded.to_json().string() == \
+        knitting_pattern_set.to_json().string()
+
+
+@fixture
+def charlotte():
+    return knittingpattern.load_from().example("Charlotte.json")
+
+
+def test_patterns_and_rows_are_generated(charlotte):
+    specification = charlotte._to_json_object()
+    patterns = specification["patterns"]
+    assert not isinstance(patterns, list)
+    pattern = next(patterns)
+    assert not isinstance(pattern["rows"], list)
+    assert next(pattern["rows"])["id"] == ("A.1", "empty", "1")
+
+
+def test_object_has_lists(charlotte):
+    specification = charlotte.to_json().object()
+    assert json.loads(json.dumps(specification)) == \
+        json.loads(charlotte.to_json().string())
+
+
+def test_no_comment():
+    knitting_pattern_set = knittingpattern.new_knitting_pattern_set()
+    assert json.loads(knitting_pattern_set.to_json().string()) == {
+        "type": "knitting pattern", "version": "0.1", "patterns": []}
+
+
+@fixture
+def two_rows():
+    knitting_pattern_set = knittingpattern.new_knitting_pattern_set()
+    pattern = knitting_pattern_set.add_new_pattern("pattern")
+    row_1 = pattern.add_row(1)
+    row_1.instructions.extend([{}] * 5)
+    row_2 = pattern.add_row(2)
+    row_2.instructions.extend([{"color": "red"}] * 5)
+    return knitting_pattern_set
+
+
+def dumped_pattern(knitting_pattern_set, index=0):
+    specification = json.loads(knitting_pattern_set.to_json().string())
+    return specification["patterns"][index]
+
+
+def test_adjacent_meshes_are_one_connection(two_rows):
+    row_1, row_2 = two_rows.first.rows
+    row_1.connect_range(0, row_2, 0, 2)
+    row_1.connect_range(2, row_2, 2, 1)
+    row_1.connect_range(3, row_2, 4, 1)
+    assert dumped_pattern(two_rows)["connections"] == [
+        {"from": {"id": 1}, "to": {"id": 2}, "meshes": 3},
+        {"from": {"id": 1, "start": 3}, "to": {"id": 2, "start": 4},
+         "meshes": 1}]
+    assert_equal(reload(two_rows), two_rows)
+
+
+def test_edited_rows_are_dumped(two_rows):
+    row_1, row_2 = two_rows.first.rows
+    row_2.instructions.pop(0)
+    row_2.instructions.append({"type": "purl"})
+    row_1.connect_range(0, row_2, 0, 5)
+    rows = dumped_pattern(two_rows)["rows"]
+    assert rows == [
+        {"id": 1, "instructions": [{}] * 5},
+        {"id": 2, "instructions": [{"color": "red"}] * 4 + [
+            {"type": "purl"}]}]
+    assert_equal(reload(two_rows), two_rows)
+
+
+def test_connection_to_a_later_pattern(two_rows):
+    row_1, _ = two_rows.first.rows
+    pattern = two_rows.add_new_pattern("later")
+    row_3 = pattern.add_row(3)
+    row_3.instructions.extend([{}] * 5)
+    row_1.connect_range(0, row_3, 0, 5)
+    assert dumped_pattern(two_rows, 0)["connections"] == []
+    assert dumped_pattern(two_rows, 1)["connections"] == [
+        {"from": {"id": 1}, "to": {"id": 3}, "meshes": 5}]
+    assert_equal(reload(two_rows), two_rows)
+
+
+def test_connection_outside_of_the_set(two_rows):
+    row_1, _ = two_rows.first.rows
+    other_row = knittingpattern.new_knitting_pattern("other").add_row(1)
+    other_row.instructions.append({})
+    row_1.connect_range(0, other_row, 0, 1)
+    with raises(ValueError):
+        two_rows.to_json().string()
+
+
+@pytest.mark.parametrize("index", [0, 2, -1])
+def test_removed_instruction(index):
+    block = knittingpattern.load_from().example("block4x4.json")
+    row = block.first.rows.at(1)
+    row.instructions.pop(index)
+    reloaded = reload(block)
+    assert_equal(reloaded, block)
+    reloaded_row = reloaded.first.rows.at(1)
+    assert len(reloaded_row.instructions) == 3
+    assert [r.id for r in reloaded_row.rows_before] == \
+        [r.id for r in row.rows_before]
+    assert [r.id for r in reloaded_row.rows_after] == \
+        [r.id for r in row.rows_after]
+    assert content(pickle.loads(pickle.dumps(block))) == content(block)
@@ -1,6 +1,8 @@
 from pytest import fixture, raises
+import pytest
 from knittingpattern.IdCollection import IdCollection
 from collections import namedtuple
+from random import Random
 
 
 I = namedtuple("Item", ["id"])
@@ -36,3 +38,149 @@ def test_length(c):
 def test_at_raises_keyerror(c):
     with raises(KeyError):
         c["unknown-id"]
+
+
+@fixture
+def abcd(c):
+    for id_ in "abcd":
+        c.append(I(id_))
+    return c
+
+
+def ids(items):
+    return [item.id for item in items]
+
+
+def test_at_negative_index(abcd):
+    assert abcd.at(-1).id == "d"
+
+
+def test_at_slice(abcd):
+    assert ids(abcd.at(slice(1, 3))) == ["b", "c"]
+    assert ids(abcd.at(slice(None, None, -2))) == ["d", "b"]
+
+
+def test_at_raises_indexerror(abcd):
+    with raises(IndexError):
+        abcd.at(4)
+
+
+def test_first(abcd):
+    assert abcd.first.id == "a"
+
+
+def test_first_of_empty_collection(c):
+    with raises(IndexError):
+        c.first
+
+
+@pytest.mark.parametrize("index,id_", enumerate("abcd"))
+def test_index_of(abcd, index, id_):
+    assert abcd.index_of(id_) == index
+
+
+def test_index_of_unknown_id(abcd):
+    with raises(KeyError):
+        abcd.index_of("x")
+
+
+def test_append_replaces_object_with_same_id(abcd):
+    item = I("b")
+    abcd.append(item)
+    assert abcd.at(1) is item
+    assert abcd["b"] is item
+    assert ids(abcd) == list("abcd")
+    assert len(abcd) == 4
+
+
+@pytest.mark.parametrize("removed,remaining", [
+    ("a", "bcd"), ("b", "acd"), ("d", "abc"), ("bc", "ad"), ("db", "ac"),
+    ("abcd", "")])
+def test_remove(abcd, removed, remaining):
+    for id_ in removed:
+        del abcd[id_]
+    assert ids(abcd) == list(remaining)
+    assert ids(abcd.at(slice(None))) == list(remaining)
+    assert len(abcd) == len(remaining)
+    for index, id_ in enumerate(remaining):
+        assert abcd.at(index).id == id_
+        assert abcd.index_of(id_) == index
+    for id_ in removed:
+        with raises(KeyError):
+            abcd[id_]
+        with raises(KeyError):
+            abcd.index_of(id_)
+
+
+def test_remove_unknown_id(abcd):
+    with raises(KeyError):
+        del abcd["x"]
+    assert ids(abcd) == list("abcd")
+
+
+def test_append_after_remove(abcd):
+    del abcd["b"]
+    abcd.append(I("b"))
+    abcd.append(I("e"))
+    assert ids(abcd) == list("acdbe")
+    assert abcd.index_of("e") == 4
+    assert abcd.at(3).id == "b"
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_changes(c, seed):
+    random = Random(seed)
+    expected = []
+    for id_ in range(200):
+        if expected and random.random() < 0.45:
+            removed = random.choice(expected)
+            expected.remove(removed)
+            del c[removed]
+        else:
+            expected.append(id_)
+            c.append(I(id_))
+        assert ids(c.at(slice(None))) == expected
+        index = random.randrange(-len(expected) - 1, len(expected) + 1)
+        if -len(expected) <= index < len(expected):
+            assert c.at(index).id == expected[index]
+        else:
+            with raises(IndexError):
+                c.at(index)
+        for index, id_ in enumerate(expected):
+            assert c.index_of(id_) == index
+        assert ids(c.at(slice(1, -1, 2))) == expected[1:-1:2]
+
+
+def test_gaps_are_closed_when_more_than_half_are_removed(c):
+    for id_ in range(10):
+        c.append(I(id_))
+    for id_ in range(1, 6):
+        del c[id_]
+        assert c._tree is not None
+        assert c._gaps == id_
+        assert len(c._positions) == 10
+    del c[6]
+    assert c._tree is None
+    assert c._gaps == 0
+    assert ids(c._positions) == [0, 7, 8, 9]
+
+
+def test_removing_the_last_object_leaves_no_gap(abcd):
+    del abcd["d"]
+    assert abcd._tree is None
+    assert abcd._gaps == 0
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_positions_after_random_removals(c, seed):
+    random = Random(seed)
+    expected = list(range(100))
+    for id_ in expected:
+        c.append(I(id_))
+    while expected:
+        removed = random.choice(expected)
+        expected.remove(removed)
+        del c[removed]
+        for index, id_ in enumerate(expected):
+            assert c.at(index).id == id_
+            assert c.index_of(id_) == index
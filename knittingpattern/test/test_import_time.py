@@ -0,0 +1,69 @@
+"""Test that loading a knitting pattern imports little.
+
+The converters depend on :mod:`PIL`, :mod:`xmltodict` and :mod:`webcolors`.
+These are only imported when the converters are used.
+"""
+from pytest import fixture, mark
+import subprocess
+import sys
+import os
+
+ROOT = os.path.join(HERE, "..", "..")
+LOAD_A_PATTERN = "import knittingpattern; knittingpattern.load_from_object(" \
+    "{'type': 'knitting pattern', 'version': '0.1', 'patterns': []})"
+IMPORT_TIME_BUDGET = 0.1  # seconds
+LAZY_MODULES = ["PIL", "xmltodict", "webcolors"]
+
+
+def import_times(code):
+    """Run the code in a new interpreter and return the imports.
+
+    :return: a list of tuples of the module name and the cumulative import
+      time in seconds of the modules that were imported at the top level
+    """
+    output = subprocess.check_output(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stderr=subprocess.STDOUT, cwd=ROOT, universal_newlines=True)
+    result = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        result.append((name.rstrip(), int(cumulative) / 1000000))
+    return result
+
+
+@fixture(scope="module")
+def imports():
+    return import_times(LOAD_A_PATTERN)
+
+
+@fixture(scope="module")
+def imported_modules(imports):
+    return [name.strip() for name, _ in imports]
+
+
+@mark.parametrize("module", LAZY_MODULES)
+def test_module_is_not_imported(imported_modules, module):
+    assert module not in imported_modules
+
+
+def test_knittingpattern_is_imported(imported_modules):
+    assert "knittingpattern" in imported_modules
+
+
+def test_import_time_is_within_budget(imports):
+    import_time = sum(seconds for name, seconds in imports
+                      if name.startswith(" knittingpattern"))
+    assert import_time < IMPORT_TIME_BUDGET
+
+
+def test_converters_import_their_dependencies():
+    imports = import_times("import knittingpattern; knittingpattern."
+                           "load_from().example('Cafe.json').to_svg(25)"
+                           ".string()")
+    imported_modules = [name.strip() for name, _ in imports]
+    assert "xmltodict" in imported_modules
+    assert "webcolors" in imported_modules
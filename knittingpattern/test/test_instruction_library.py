@@ -1,4 +1,5 @@
 from pytest import fixture
+import pytest
 from knittingpattern.InstructionLibrary import InstructionLibrary
 
 DESCRIPTION = "here you can see how to knit: URL"
@@ -108,3 +109,59 @@ def test_when_library_load_instruction_it_is_in_its_types(library2):
 
 def test_unloaded_instruction_is_not_in_the_types(library2):
     assert UNLOADED not in library2.loaded_types
+
+
+class TestSharedInstructions(object):
+
+    def test_equal_specifications_share_the_instruction(self, library):
+        shared = library.as_shared_instruction
+        assert shared({"color": "black"}) is shared({"color": "black"})
+        nested = {"type": "purl", "render": {"z": [1, 2]}}
+        assert shared(nested) is shared({"type": "purl",
+                                         "render": {"z": [1, 2]}})
+
+    @pytest.mark.parametrize("spec1,spec2", [
+        ({"color": "black"}, {"color": "white"}),
+        ({"number": 1}, {"number": True}),
+        ({"number": 1}, {"number": 1.0}),
+        ({"z": [1]}, {"z": {1: 1}})])
+    def test_different_specifications(self, library, spec1, spec2):
+        shared = library.as_shared_instruction
+        assert shared(spec1) is not shared(spec2)
+
+    def test_shared_instruction_inherits_from_type(self, library):
+        knit = library.as_shared_instruction({"type": "knit", "color": "red"})
+        assert knit.description == DESCRIPTION
+        assert knit.color == "red"
+
+    def test_changing_the_specification(self, library):
+        spec = {"color": "black"}
+        instruction = library.as_shared_instruction(spec)
+        spec["color"] = "white"
+        assert instruction.color == "black"
+        assert library.as_shared_instruction(spec).color == "white"
+
+    def test_changing_nested_values_of_the_specification(self, library):
+        spec = {"render": {"color": "black"}, "ids": [[1]]}
+        instruction = library.as_shared_instruction(spec)
+        spec["render"]["color"] = "white"
+        spec["ids"][0].append(2)
+        assert instruction["render"] == {"color": "black"}
+        assert instruction["ids"] == [[1]]
+        assert library.as_shared_instruction(spec)["render"] == \
+            {"color": "white"}
+
+    def test_adding_instructions_creates_new_shared_instructions(
+            self, library):
+        knit = library.as_shared_instruction({"type": "knit"})
+        library.add_instruction({"type": "knit",
+                                 "description": DESCRIPTION_2})
+        new_knit = library.as_shared_instruction({"type": "knit"})
+        assert new_knit is not knit
+        assert new_knit.description == DESCRIPTION_2
+
+    def test_unhashable_specification_is_not_shared(self, library):
+        spec = {"color": bytearray(b"black")}
+        shared = library.as_shared_instruction
+        assert shared(spec) is not shared(spec)
+        assert shared(spec).color == spec["color"]
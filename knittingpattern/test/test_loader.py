@@ -1,4 +1,5 @@
 from pytest import fixture
+from concurrent.futures import ThreadPoolExecutor
 import os
 import pytest
 from knittingpattern.Loader import ContentLoader, JSONLoader, PathLoader
@@ -89,3 +90,29 @@ def test_load_examples(path_loader):
             example_paths.add(os.path.abspath(os.path.join(root, example)))
     generated_paths = list(map(os.path.abspath, path_loader.examples()))
     assert set(generated_paths) == example_paths
+
+
+def test_load_examples_with_an_executor(path_loader):
+    with ThreadPoolExecutor(2) as executor:
+        loaded = list(path_loader.examples(executor=executor))
+    assert set(path for path, _ in loaded) == set(path_loader.examples())
+    assert all(future.result() == path for path, future in loaded)
+
+
+def test_loading_in_parallel_isolates_errors(tmpdir):
+    for name in ("1_2", "2_2", "3_2"):
+        tmpdir.join(name).write(name)
+
+    def process(path):
+        if path.endswith("2_2"):
+            raise ValueError(path)
+        return path
+    loader = PathLoader(process)
+    with ThreadPoolExecutor(2) as executor:
+        loaded = dict(loader.folder(tmpdir.strpath, executor=executor))
+    assert len(loaded) == 3
+    for path, future in loaded.items():
+        if path.endswith("2_2"):
+            assert isinstance(future.exception(), ValueError)
+        else:
+            assert future.result() == path
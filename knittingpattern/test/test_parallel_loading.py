@@ -0,0 +1,78 @@
+"""Load many knitting pattern sets in parallel."""
+from pytest import fixture
+from concurrent.futures import ThreadPoolExecutor
+import json
+import pickle
+import knittingpattern
+from knittingpattern.KnittingPatternSet import KnittingPatternSet
+from knittingpattern.Parser import Parser
+from knittingpattern.ParseCache import ParseCache
+
+NUMBER_OF_PATTERNS = 8
+
+
+def pattern(index):
+    return {"type": "knitting pattern", "version": "0.1", "patterns": [
+        {"id": index, "name": "pattern {}".format(index), "rows": [
+            {"id": row_id, "instructions": [{"color": index}] * 3}
+            for row_id in range(index + 1)]}]}
+
+
+@fixture
+def folder(tmpdir):
+    for index in range(NUMBER_OF_PATTERNS):
+        with open(tmpdir.join("{}.json".format(index)).strpath, "w") as file:
+            json.dump(pattern(index), file)
+    return tmpdir
+
+
+def check(loaded):
+    loaded = dict(loaded)
+    assert len(loaded) == NUMBER_OF_PATTERNS
+    for path, future in loaded.items():
+        knitting_pattern_set = future.result()
+        assert isinstance(knitting_pattern_set, KnittingPatternSet)
+        pattern = knitting_pattern_set.first
+        assert path.endswith("{}.json".format(pattern.id))
+        assert len(pattern.rows) == pattern.id + 1
+
+
+def test_load_with_processes(folder):
+    check(knittingpattern.load_from().folder(folder.strpath, workers=2))
+
+
+def test_load_with_threads(folder):
+    with ThreadPoolExecutor(4) as executor:
+        check(knittingpattern.load_from().folder(folder.strpath,
+                                                 executor=executor))
+
+
+def test_broken_file_does_not_stop_the_others(folder):
+    folder.join("broken.json").write("{")
+    loaded = dict(knittingpattern.load_from().folder(folder.strpath,
+                                                     workers=2))
+    broken = loaded.pop(folder.join("broken.json").strpath)
+    assert isinstance(broken.exception(), ValueError)
+    check(loaded)
+
+
+def test_load_with_a_cache(folder, tmpdir_factory):
+    cache = ParseCache(tmpdir_factory.mktemp("cache").strpath)
+    loader = knittingpattern.load_from(cache=cache)
+    check(loader.folder(folder.strpath, workers=2))
+    assert len(list(cache._files())) == NUMBER_OF_PATTERNS
+
+
+def test_load_sequentially(folder):
+    loaded = knittingpattern.load_from().folder(folder.strpath)
+    assert len(loaded) == NUMBER_OF_PATTERNS
+
+
+def test_pickled_parser_is_new(folder):
+    loader = knittingpattern.load_from()
+    loader.path(folder.join("1.json").strpath)
+    parser = loader._process.__self__
+    unpickled = pickle.loads(pickle.dumps(parser))
+    assert isinstance(unpickled, Parser)
+    assert unpickled is not parser
+    assert unpickled.knitting_pattern_sets == []
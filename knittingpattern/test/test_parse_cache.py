@@ -0,0 +1,229 @@
+"""Test the cache of parsed knitting pattern sets."""
+from pytest import fixture, raises
+import pytest
+import functools
+import os
+import shutil
+import knittingpattern
+from knittingpattern.ParseCache import ParseCache, EXTENSION, \
+    _specification_key
+from knittingpattern.Loader import JSONLoader
+from knittingpattern.ParsingSpecification import ParsingSpecification, \
+    new_knitting_pattern_set_loader
+from knittingpattern.Row import Row
+from test_binary import replace_content, unknown_row
+
+CAFE_PATH = os.path.join(HERE, "..", "examples", "Cafe.json")
+CHARLOTTE_PATH = os.path.join(HERE, "..", "examples", "Charlotte.json")
+
+
+def read(path):
+    with open(path) as file:
+        return file.read()
+
+
+@fixture
+def folder(tmpdir):
+    return tmpdir.join("cache").strpath
+
+
+@fixture
+def cache(folder):
+    return ParseCache(folder)
+
+
+@fixture
+def loader(cache):
+    return knittingpattern.load_from(cache=cache)
+
+
+def cached_files(cache):
+    return sorted(file for file in os.listdir(cache.folder)
+                  if file.endswith(EXTENSION))
+
+
+def test_folder_is_created(cache, folder):
+    assert os.path.isdir(folder)
+    assert cache.folder == folder
+
+
+def test_miss(cache, loader):
+    knitting_pattern_set = loader.path(CAFE_PATH)
+    assert cache.misses == 1
+    assert cache.hits == 0
+    assert cached_files(cache) == [cache.key(read(CAFE_PATH)) + EXTENSION]
+    assert knitting_pattern_set.first.name == "A.2"
+
+
+def test_hit(cache, loader):
+    parsed = loader.path(CAFE_PATH)
+    loaded = loader.path(CAFE_PATH)
+    assert cache.misses == 1
+    assert cache.hits == 1
+    assert loaded is not parsed
+    assert loaded.to_binary().bytes() == parsed.to_binary().bytes()
+
+
+def test_cache_is_shared(cache, loader):
+    loader.path(CAFE_PATH)
+    other_cache = ParseCache(cache.folder)
+    knittingpattern.load_from(cache=other_cache).string(read(CAFE_PATH))
+    assert other_cache.hits == 1
+
+
+def test_different_contents(cache, loader):
+    loader.path(CAFE_PATH)
+    loader.path(CHARLOTTE_PATH)
+    assert cache.misses == 2
+    assert len(cached_files(cache)) == 2
+
+
+def test_key_depends_on_the_version(cache, monkeypatch):
+    key = cache.key("{}")
+    monkeypatch.setattr(knittingpattern, "__version__", "0.0.0")
+    assert ParseCache(cache.folder).key("{}") != key
+
+
+def test_broken_file_is_replaced(cache, loader):
+    path = os.path.join(cache.folder, cache.key(read(CAFE_PATH)) + EXTENSION)
+    with open(path, "wb") as file:
+        file.write(b"broken")
+    knitting_pattern_set = loader.path(CAFE_PATH)
+    assert cache.misses == 1
+    assert knitting_pattern_set.first.name == "A.2"
+    loader.path(CAFE_PATH)
+    assert cache.hits == 1
+
+
+def test_file_with_broken_content_is_replaced(cache, loader):
+    parsed = loader.path(CAFE_PATH)
+    path = os.path.join(cache.folder, cache.key(read(CAFE_PATH)) + EXTENSION)
+    with open(path, "rb") as file:
+        bytes_ = file.read()
+    with open(path, "wb") as file:
+        file.write(replace_content(bytes_, unknown_row))
+    loaded = loader.path(CAFE_PATH)
+    assert cache.misses == 2
+    assert loaded.to_binary().bytes() == parsed.to_binary().bytes()
+    loader.path(CAFE_PATH)
+    assert cache.hits == 1
+
+
+def test_parsed_result_is_returned_if_it_can_not_be_saved(cache, loader):
+    shutil.rmtree(cache.folder)
+    knitting_pattern_set = loader.path(CAFE_PATH)
+    assert knitting_pattern_set.first.name == "A.2"
+    assert cache.misses == 1
+
+
+def test_temporary_file_is_removed_if_it_can_not_be_saved(
+        cache, loader, monkeypatch):
+    def replace(*args):
+        raise OSError("The disk is full.")
+    monkeypatch.setattr(os, "replace", replace)
+    knitting_pattern_set = loader.path(CAFE_PATH)
+    assert knitting_pattern_set.first.name == "A.2"
+    assert os.listdir(cache.folder) == []
+
+
+def test_key_depends_on_the_specification(cache):
+    specification = ParsingSpecification(new_row=Row)
+    assert ParseCache(cache.folder, specification=specification).key("{}") \
+        == ParseCache(cache.folder, specification=ParsingSpecification(
+            new_row=Row)).key("{}")
+
+    class OtherRow(Row):
+        pass
+    other = ParsingSpecification(new_row=OtherRow)
+    assert ParseCache(cache.folder, specification=other).key("{}") != \
+        ParseCache(cache.folder, specification=specification).key("{}")
+
+
+def new_row(*args, **kw):
+    return Row(*args, **kw)
+
+
+@pytest.mark.parametrize("function", [new_row, lambda: None])
+def test_key_of_functions_does_not_depend_on_the_address(function):
+    key = _specification_key(ParsingSpecification(new_row=function))
+    assert "0x" not in key
+    assert "new_row={}.{}".format(__name__, function.__qualname__) in key
+
+
+def test_key_of_functions_is_shared(cache):
+    def new_row(*args, **kw):
+        return Row(*args, **kw)
+    specification = ParsingSpecification(new_row=new_row)
+    assert ParseCache(cache.folder, specification=specification).key("{}") \
+        == ParseCache(cache.folder, specification=ParsingSpecification(
+            new_row=new_row)).key("{}")
+
+
+def test_values_without_qualified_name_are_rejected(folder):
+    specification = ParsingSpecification(new_row=functools.partial(Row))
+    with raises(TypeError):
+        ParseCache(folder, specification=specification)
+
+
+def test_specification_is_used_to_restore(folder):
+    class OtherRow(Row):
+        pass
+    specification = ParsingSpecification(new_row=OtherRow)
+    cache = ParseCache(folder, specification=specification)
+    loader = new_knitting_pattern_set_loader(specification, cache=cache)
+    loader.path(CAFE_PATH)
+    loaded = loader.path(CAFE_PATH)
+    assert cache.hits == 1
+    assert isinstance(loaded.first.rows.at(0), OtherRow)
+
+
+def test_least_recently_used_files_are_removed(folder):
+    cache = ParseCache(folder)
+    loader = knittingpattern.load_from(cache=cache)
+    loader.path(CAFE_PATH)
+    loader.path(CHARLOTTE_PATH)
+    sizes = {file: os.path.getsize(os.path.join(folder, file))
+             for file in cached_files(cache)}
+    cache.clear()
+    cache = ParseCache(folder, maximum_size=sum(sizes.values()) - 1)
+    loader = knittingpattern.load_from(cache=cache)
+    loader.path(CAFE_PATH)
+    cafe_file = cached_files(cache)[0]
+    os.utime(os.path.join(folder, cafe_file), (0, 0))
+    loader.path(CHARLOTTE_PATH)
+    assert cafe_file not in cached_files(cache)
+    assert len(cached_files(cache)) == 1
+    assert cache.size() <= cache.maximum_size
+
+
+def test_recently_used_files_are_kept(folder, cache, loader):
+    loader.path(CAFE_PATH)
+    cafe_file = cached_files(cache)[0]
+    cafe_path = os.path.join(folder, cafe_file)
+    os.utime(cafe_path, (0, 0))
+    loader.path(CAFE_PATH)
+    assert os.path.getmtime(cafe_path) > 0
+
+
+def test_clear(cache, loader):
+    loader.path(CAFE_PATH)
+    cache.clear()
+    assert cached_files(cache) == []
+    assert cache.size() == 0
+
+
+def test_loader_without_cache_parses():
+    loader = JSONLoader(lambda object_: object_)
+    assert loader.string("[1]") == [1]
+
+
+def test_json_loader_uses_the_cache():
+    loaded = []
+
+    class Cache(object):
+        def load(self, content, load):
+            loaded.append(content)
+            return load(content)
+    loader = JSONLoader(lambda object_: object_, cache=Cache())
+    assert loader.string("[1]") == [1]
+    assert loaded == ["[1]"]
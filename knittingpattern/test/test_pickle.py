@@ -0,0 +1,108 @@
+"""Pickle knitting pattern sets and the objects in them."""
+from pytest import fixture, raises
+import pytest
+import copy
+import os
+import pickle
+import knittingpattern
+from knittingpattern.Instruction import InstructionNotFoundInRow
+
+EXAMPLES_PATH = os.path.join(HERE, "..", "examples")
+PATHS = [os.path.join(EXAMPLES_PATH, file)
+         for file in sorted(os.listdir(EXAMPLES_PATH))
+         if file.endswith(".json")]
+
+
+def round_trip(object_):
+    return pickle.loads(pickle.dumps(object_))
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_pickle_knitting_pattern_set(path):
+    knitting_pattern_set = knittingpattern.load_from_path(path)
+    unpickled = round_trip(knitting_pattern_set)
+    assert unpickled is not knitting_pattern_set
+    assert unpickled.to_binary().bytes() == \
+        knitting_pattern_set.to_binary().bytes()
+
+
+@fixture
+def cafe():
+    return knittingpattern.load_from().example("Cafe.json")
+
+
+@fixture
+def row(cafe):
+    return cafe.first.rows.at(3)
+
+
+def test_pickle_pattern(cafe):
+    pattern_set, pattern = round_trip((cafe, cafe.first))
+    assert pattern is pattern_set.first
+
+
+def test_pickle_row(cafe, row):
+    unpickled_row = round_trip(row)
+    assert unpickled_row.id == row.id
+    assert unpickled_row.rows_before[0].id == row.rows_before[0].id
+
+
+def test_pickle_instruction(row):
+    instruction = row.instructions[2]
+    unpickled = round_trip((row, instruction))
+    assert unpickled[1] is unpickled[0].instructions[2]
+
+
+@pytest.mark.parametrize("meshes", ["produced_meshes", "consumed_meshes"])
+def test_pickle_mesh(row, meshes):
+    mesh = getattr(row, meshes)[1]
+    unpickled_row, unpickled_mesh = round_trip((row, mesh))
+    assert unpickled_mesh == getattr(unpickled_row, meshes)[1]
+    assert unpickled_mesh.is_connected() == mesh.is_connected()
+
+
+def test_knitting_pattern_set_is_pickled_once(cafe):
+    rows = list(cafe.first.rows)
+    assert len(pickle.dumps(rows)) < 2 * len(pickle.dumps(cafe))
+    unpickled_rows = round_trip(rows)
+    assert [row.id for row in unpickled_rows] == [row.id for row in rows]
+
+
+def test_deepcopy(cafe):
+    copied = copy.deepcopy(cafe)
+    assert copied is not cafe
+    assert copied.first is not cafe.first
+    assert copied.to_binary().bytes() == cafe.to_binary().bytes()
+
+
+def test_edited_knitting_pattern_set(cafe, row):
+    row.instructions.append({"type": "purl", "color": "green"})
+    unpickled = round_trip(cafe)
+    assert unpickled.first.rows.at(3).instructions[-1].type == "purl"
+
+
+def test_loader_is_used_twice():
+    loader = knittingpattern.load_from()
+    cafe = loader.example("Cafe.json")
+    loader.example("Charlotte.json")
+    unpickled_row = round_trip(cafe.first.rows.at(0))
+    assert unpickled_row.id == cafe.first.rows.at(0).id
+
+
+def test_row_not_in_knitting_pattern_set(cafe, row):
+    del cafe.first.rows[row.id]
+    with raises(pickle.PicklingError):
+        pickle.dumps(row)
+
+
+def test_pattern_not_in_knitting_pattern_set(cafe):
+    pattern = cafe.first
+    del cafe.patterns[pattern.id]
+    with raises(pickle.PicklingError):
+        pickle.dumps(pattern)
+
+
+def test_instruction_not_in_row(row):
+    instruction = row.instructions.pop(0)
+    with raises(InstructionNotFoundInRow):
+        pickle.dumps(instruction)
@@ -0,0 +1,125 @@
+"""Test the lookup of values in prototypes."""
+from pytest import fixture
+from knittingpattern.Prototype import Prototype
+import pytest
+
+
+class NoKeys(object):
+    """A specification that can not list its keys."""
+
+    def __init__(self, values):
+        self._values = values
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+
+@fixture
+def parent():
+    return Prototype({"a": 1, "b": 2}, [{"c": 3}])
+
+
+@fixture
+def child(parent):
+    return Prototype({"a": "A"}, [parent])
+
+
+def test_lookup(child):
+    assert child["a"] == "A"
+    assert child["b"] == 2
+    assert child.get("c") == 3
+    assert child.get("d", 4) == 4
+    assert "d" not in child
+    with pytest.raises(KeyError):
+        child["d"]
+
+
+def test_values_are_cached(child):
+    assert child["b"] == 2
+    child._Prototype__specification[1] = {}
+    assert child["b"] == 2
+
+
+@pytest.mark.parametrize("key,value", [("a", "A"), ("b", "B"), ("c", 3)])
+def test_inherit_from(child, key, value):
+    child.get("a"), child.get("b"), child.get("c")
+    child.inherit_from({"a": "X", "b": "B"})
+    assert child[key] == value
+
+
+def test_inherit_from_in_parent(child, parent):
+    assert "x" not in child
+    parent.inherit_from({"x": "X"})
+    assert child["x"] == "X"
+
+
+class TestFreeze(object):
+
+    def test_values_stay_the_same(self, child):
+        child.freeze()
+        assert child["a"] == "A"
+        assert child["b"] == 2
+        assert child["c"] == 3
+        assert "d" not in child
+
+    def test_specifications_are_flattened(self, child):
+        child.freeze()
+        assert child._Prototype__specification == [
+            {"a": "A", "b": 2, "c": 3}]
+
+    def test_inherit_from_restores_the_specifications(self, child):
+        child.freeze()
+        child.inherit_from({"a": "X", "b": "B"})
+        assert child["a"] == "A"
+        assert child["b"] == "B"
+        assert child["c"] == 3
+
+    def test_specifications_without_keys_are_kept(self):
+        no_keys = NoKeys({"a": 1, "b": 2})
+        prototype = Prototype({"a": "A"}, [{"c": 3}, no_keys, {"b": "B"}])
+        prototype.freeze()
+        assert prototype._Prototype__specification == [
+            {"a": "A", "c": 3}, no_keys, {"b": "B"}]
+        assert prototype["b"] == 2
+
+    def test_parent_without_keys_is_kept(self):
+        no_keys = NoKeys({"b": 2})
+        parent = Prototype({"a": 1}, [no_keys])
+        prototype = Prototype({"c": 3}, [parent, {"b": "B"}])
+        prototype.freeze()
+        assert prototype._Prototype__specification[1:] == [parent,
+                                                           {"b": "B"}]
+        assert prototype["b"] == 2
+        assert prototype["a"] == 1
+
+
+class TestOwnSpecification(object):
+
+    def test_own_specification(self, child):
+        assert child._own_specification() == {"a": "A"}
+
+    def test_own_specification_of_a_prototype(self, child):
+        prototype = Prototype(child, [{"d": 4}])
+        assert prototype._own_specification() == {"a": "A"}
+
+    def test_frozen_prototype(self, child):
+        child.freeze()
+        assert child._own_specification() == {"a": "A"}
+
+
+def test_cache_is_kept_if_other_prototypes_change(child):
+    assert child["b"] == 2
+    child._Prototype__specification[1] = {}
+    Prototype({}).inherit_from({"b": "other"})
+    assert child["b"] == 2
+
+
+def test_inherit_from_in_grandparent(parent):
+    grandparent = Prototype({})
+    child = Prototype({}, [Prototype({}, [grandparent]), parent])
+    assert "x" not in child
+    grandparent.inherit_from({"x": "X"})
+    assert child["x"] == "X"
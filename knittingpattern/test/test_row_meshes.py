@@ -60,3 +60,132 @@ def test_2(row):
 def test_2_reversed(row):
     row.instructions.extend([DOUBLE_PRODUCED_MESH, {}, DOUBLE_CONSUMED_MESH])
     assert_row(row, (0,), (2, 1), (0,), (2,))
+
+
+def test_mesh_indices_change_with_the_instructions(row):
+    row.instructions.extend([{}, DOUBLE_PRODUCED_MESH, DOUBLE_CONSUMED_MESH])
+    last = row.last_instruction
+    assert last.index_of_first_produced_mesh_in_row == 3
+    assert last.index_of_first_consumed_mesh_in_row == 2
+    row.instructions.insert(0, DOUBLE_CONSUMED_MESH)
+    assert last.index_of_first_produced_mesh_in_row == 4
+    assert last.index_of_first_consumed_mesh_in_row == 4
+    assert row.number_of_produced_meshes == 5
+    assert row.number_of_consumed_meshes == 6
+    row.instructions.pop(1)
+    assert last.index_of_first_produced_mesh_in_row == 3
+    assert last.index_of_first_consumed_mesh_in_row == 3
+    assert row.last_consumed_mesh.index_in_consuming_row == 4
+
+
+def test_meshes_are_computed_once(row):
+    row.instructions.extend([{}, DOUBLE_PRODUCED_MESH])
+    assert row.produced_meshes is row.produced_meshes
+    assert row.consumed_meshes is row.consumed_meshes
+    assert len(row.produced_meshes) == 3
+
+
+def test_meshes_change_with_the_instructions(row):
+    version = row.version
+    produced_meshes = row.produced_meshes
+    row.instructions.append(DOUBLE_PRODUCED_MESH)
+    assert row.version != version
+    assert row.produced_meshes != produced_meshes
+    assert len(row.produced_meshes) == 2
+    assert row.produced_meshes == tuple(row.last_instruction.produced_meshes)
+
+
+def test_rows_are_connected_once(row):
+    row_2 = row._parser.new_row(2)
+    row.instructions.extend([{}, {}, {}])
+    row_2.instructions.extend([{}, {}, {}])
+    for produced_mesh, consumed_mesh in zip(row.produced_meshes,
+                                            row_2.consumed_meshes):
+        produced_mesh.connect_to(consumed_mesh)
+    assert row.rows_after == [row_2]
+    assert row_2.rows_before == [row]
+
+
+def test_rows_change_with_the_connections(row):
+    row_2 = row._parser.new_row(2)
+    row.instructions.append({})
+    row_2.instructions.append({})
+    assert row.rows_after == []
+    row.first_produced_mesh.connect_to(row_2.first_consumed_mesh)
+    assert row.rows_after == [row_2]
+    assert row_2.rows_before == [row]
+    row.first_produced_mesh.disconnect()
+    assert row.rows_after == []
+    assert row_2.rows_before == []
+
+
+def test_rows_change_with_the_instructions(row):
+    row_2 = row._parser.new_row(2)
+    row_3 = row._parser.new_row(3)
+    row.instructions.append({})
+    row_2.instructions.append({})
+    row.first_produced_mesh.connect_to(row_2.first_consumed_mesh)
+    assert row.rows_after == [row_2]
+    row_3.instructions.append(row_2.first_instruction)
+    assert row.rows_after == [row_3]
+    assert row_3.rows_before == [row]
+    assert row_2.rows_before == []
+
+
+def test_objects_have_no_dict(row):
+    row.instructions.append({})
+    instruction = row.first_instruction
+    objects = [row, instruction, instruction.produced_meshes[0],
+               instruction.consumed_meshes[0]]
+    assert not any(hasattr(object_, "__dict__") for object_ in objects)
+
+
+def test_meshes_are_equal_views(row):
+    row_2 = row._parser.new_row(2)
+    row.instructions.extend([{}, {}])
+    row_2.instructions.append({})
+    produced = row.instructions[0].produced_meshes[0]
+    consumed = row_2.first_consumed_mesh
+    assert produced == row.first_produced_mesh
+    assert hash(produced) == hash(row.first_produced_mesh)
+    assert produced != row.last_produced_mesh
+    assert produced != row.first_consumed_mesh
+    produced.connect_to(consumed)
+    assert produced.as_consumed_mesh() == consumed
+    assert consumed.as_produced_mesh() == produced
+    assert len({produced, consumed, row.first_produced_mesh}) == 2
+
+
+def test_connections_are_kept_by_the_instructions(row):
+    row_2 = row._parser.new_row(2)
+    row.instructions.extend([{}, DOUBLE_PRODUCED_MESH])
+    row_2.instructions.extend([DOUBLE_CONSUMED_MESH, {}])
+    produced = row.produced_meshes
+    consumed = row_2.consumed_meshes
+    produced[0].connect_to(consumed[1])
+    produced[2].connect_to(consumed[2])
+    instruction_1, instruction_2 = row.instructions
+    instruction_3, instruction_4 = row_2.instructions
+    assert instruction_1._produced_connections == [instruction_3, 1]
+    assert instruction_2._produced_connections == [None, None,
+                                                   instruction_4, 0]
+    assert instruction_3.producing_instructions == [None, instruction_1]
+    assert instruction_2.consuming_instructions == [None, instruction_4]
+    produced[0].disconnect()
+    assert instruction_1._produced_connections == [None, None]
+    assert instruction_3._consumed_connections == [None] * 4
+
+
+def test_connections_are_allocated_when_connecting(row):
+    row_2 = row._parser.new_row(2)
+    row.instructions.append({})
+    row_2.instructions.append({})
+    instruction_1 = row.first_instruction
+    instruction_2 = row_2.first_instruction
+    assert instruction_1._produced_connections is None
+    assert instruction_1.consuming_instructions == [None]
+    assert not row.first_produced_mesh.is_connected()
+    assert instruction_2._consumed_connections is None
+    row.first_produced_mesh.connect_to(row_2.first_consumed_mesh)
+    assert instruction_1._consumed_connections is None
+    assert instruction_1.consuming_instructions == [instruction_2]
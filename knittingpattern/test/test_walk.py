@@ -50,3 +50,11 @@ def test_graphs_are_sorted(links, expected_ids):
     pattern = construct_graph(links)
     walked_ids = walk_ids(pattern)
     assert walked_ids == expected_ids
+
+
+def test_many_strands_are_walked_one_after_the_other():
+    links = [(strand * 10 + i, strand * 10 + i + 1)
+             for strand in range(100) for i in range(9)]
+    pattern = construct_graph(links)
+    walked_ids = walk_ids(pattern)
+    assert walked_ids == list(range(1000))
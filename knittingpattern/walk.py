@@ -1,4 +1,5 @@
 """Walk the knitting pattern."""
+from collections import deque
 
 
 def walk(knitting_pattern):
@@ -8,30 +9,36 @@ def walk(knitting_pattern):
     :rtype: list
     :param knittingpattern.KnittingPattern.KnittingPattern knitting_pattern: a
       knitting pattern to take the rows from
+
+    A row can be knit once all the :attr:`rows before it
+    <knittingpattern.Row.Row.rows_before>` are knit.
+    Each row counts the connections to the rows that are not knit, yet.
+    Rows without such connections are kept in a :class:`deque
+    <collections.deque>` and knit first to last.
+    Rows that are freed are put in front so that the rows are walked
+    depth-first.
+    This takes time linear in the number of rows and connections.
     """
-    rows_before = {}  # key consumes from values
-    free_rows = []
+    number_of_rows_before = {}  # the connections to rows that are not knit
+    free_rows = deque()
     walk = []
     for row in knitting_pattern.rows:
-        rows_before_ = row.rows_before[:]
-        if rows_before_:
-            rows_before[row] = rows_before_
+        rows_before = len(row.rows_before)
+        if rows_before:
+            number_of_rows_before[row] = rows_before
         else:
             free_rows.append(row)
     assert free_rows
     while free_rows:
-        # print("free rows:", free_rows)
-        row = free_rows.pop(0)
+        row = free_rows.popleft()
         walk.append(row)
-        assert row not in rows_before
+        assert row not in number_of_rows_before
         for freed_row in reversed(row.rows_after):
-            todo = rows_before[freed_row]
-            # print("  freed:", freed_row, todo)
-            todo.remove(row)
-            if not todo:
-                del rows_before[freed_row]
-                free_rows.insert(0, freed_row)
-    assert not rows_before, "everything is walked"
+            number_of_rows_before[freed_row] -= 1
+            if not number_of_rows_before[freed_row]:
+                del number_of_rows_before[freed_row]
+                free_rows.appendleft(freed_row)
+    assert not number_of_rows_before, "everything is walked"
     return walk
 
 